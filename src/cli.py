@@ -0,0 +1,440 @@
+# src/cli.py
+
+# Only the standard library is imported here: each subcommand imports the
+# modules it needs, so a command never pays for pandas, sklearn or tkinter
+# unless it uses them (predicting with a compact model imports none of them).
+import argparse
+import csv
+import math
+import os
+import sys
+
+# Model files read without unpickling an estimator.
+RUNTIME_MODEL_EXTENSIONS = ('.pemodel', '.json')
+
+# Options of handle_nan_values selected by the --method of the clean command.
+CLEAN_METHODS = {'drop': "1", 'mean': "2", 'median': "3", 'constant': "4"}
+
+# Outputs of the clean command written chunk by chunk (see clean_large_file).
+COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow')
+
+# Rows per chunk of the chunked readers (file_importer.DEFAULT_CHUNK_SIZE,
+# not imported here because the module loads pandas).
+DEFAULT_CHUNK_SIZE = 50000
+
+
+def _reader_options(args):
+    """Returns the reader options (see import_file) given on the command line."""
+    options = {}
+    if getattr(args, 'table', None):
+        options['table_name'] = args.table
+    if getattr(args, 'sheet', None):
+        options['sheet_name'] = args.sheet
+    if getattr(args, 'columns', None):
+        options['columns'] = [col.strip() for col in args.columns.split(',') if col.strip()]
+    return options
+
+
+def _load_predictor(model_path):
+    """
+    Loads a saved model as a LinearPredictor. Compact and JSON model files
+    are read without sklearn; joblib files need it to be unpickled. The
+    preprocessing saved with the model is kept in its metadata.
+
+    Parameters:
+    - model_path (str): The model file.
+
+    Returns:
+    - LinearPredictor: The model.
+    """
+    from src.models.runtime import LinearPredictor
+    if model_path.lower().endswith(RUNTIME_MODEL_EXTENSIONS):
+        return LinearPredictor.load(model_path)
+    from src.models.model_io import load_model_data
+    model_data = load_model_data(model_path)
+    if model_data.get('model') is None:
+        raise ValueError("The model object is missing in the loaded file.")
+    metadata = {'preprocessing': model_data['preprocessing']} if model_data.get('preprocessing') else None
+    return LinearPredictor.from_model(model_data['model'], model_data.get('input_column'),
+                                      model_data.get('output_column'), metadata)
+
+
+def _staging_path(output_path):
+    """Returns the temporary file written next to an output file until it is complete."""
+    directory, name = os.path.split(os.path.abspath(output_path))
+    return os.path.join(directory, f".{name}.{os.getpid()}.partial")
+
+
+def _format_prediction(predictor, text):
+    """Returns the prediction for a CSV cell ('' for a missing or non-numeric value)."""
+    try:
+        prediction = predictor.predict(float(text))
+    except ValueError:
+        return ""
+    return "" if math.isnan(prediction) else repr(prediction)
+
+
+def predict_csv_stream(predictor, input_stream, output_stream, input_column,
+                       output_column="prediction"):
+    """
+    Copies a CSV stream with a column of predictions added, one row at a
+    time with the csv module, so it starts instantly and works in pipelines.
+
+    Parameters:
+    - predictor (LinearPredictor): The model.
+    - input_stream (file): The CSV input, with a header row.
+    - output_stream (file): The CSV output.
+    - input_column (str): The input column.
+    - output_column (str): The name of the predictions column.
+
+    Returns:
+    - int: The number of rows predicted.
+    """
+    reader = csv.reader(input_stream)
+    writer = csv.writer(output_stream, lineterminator="\n")
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("The input does not contain any data.")
+    if input_column not in header:
+        raise ValueError(f"Column not found in the input: {input_column}")
+    position = header.index(input_column)
+    writer.writerow(header + [output_column])
+    rows = 0
+    for row in reader:
+        if not row:
+            continue
+        writer.writerow(row + [_format_prediction(predictor, row[position]) if position < len(row) else ""])
+        rows += 1
+    return rows
+
+
+def command_profile(args):
+    """Imports a file and prints the statistics of its columns."""
+    from src.data.file_importer import import_file
+    from src.data.profile import DatasetProfile
+
+    data_frame = import_file(args.file, options=_reader_options(args))
+    table = DatasetProfile.from_dataframe(data_frame).to_frame()
+    if args.json:
+        print(table.to_json(orient='records', indent=2))
+    else:
+        print(f"{args.file}: {len(data_frame)} rows, {len(data_frame.columns)} columns")
+        print(table.to_string(index=False))
+    if args.save:
+        _write_table(data_frame, args.save)
+    return 0
+
+
+def _write_table(data_frame, output_path):
+    """Writes a DataFrame to a .csv, .xlsx, .parquet or .feather file."""
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension == '.csv':
+        data_frame.to_csv(output_path, index=False)
+    elif extension == '.xlsx':
+        data_frame.to_excel(output_path, index=False)
+    elif extension == '.parquet':
+        data_frame.to_parquet(output_path, index=False)
+    elif extension == '.feather':
+        data_frame.reset_index(drop=True).to_feather(output_path)
+    else:
+        raise ValueError(f"Unsupported output format: {output_path} "
+                         f"(use .csv, .xlsx, .parquet or .feather).")
+
+
+def command_clean(args):
+    """Handles the NaN values of a file and writes the result."""
+    option = CLEAN_METHODS[args.method]
+    if option == "4" and args.value is None:
+        raise ValueError("--value is required with --method constant.")
+
+    if args.output.lower().endswith(COLUMNAR_EXTENSIONS):
+        # Streamed in two passes: the file does not have to fit in memory.
+        from src.data.out_of_core import clean_large_file
+        summary = clean_large_file(args.input, args.output, option, args.value,
+                                   options=_reader_options(args))
+        print(f"{summary['rows_read']} rows read, {summary['rows_written']} rows written "
+              f"to {args.output}, {int(summary['filled'].sum())} values filled.")
+        return 0
+
+    from src.data.data_handler import handle_nan_values
+    from src.data.file_importer import import_file
+    data_frame = import_file(args.input, options=_reader_options(args))
+    data_frame, message = handle_nan_values(data_frame, option, args.value, inplace=True)
+    _write_table(data_frame, args.output)
+    print(message)
+    return 0
+
+
+def command_fit(args):
+    """Fits a model on two columns of a file and saves it."""
+    from src.models.model_io import save_model_data
+    from src.models.regression import LinearRegressionModel
+    from src.models.streaming_ols import accumulate_file
+
+    accumulator = accumulate_file(args.data, args.input_column, args.output_column,
+                                  _reader_options(args))
+    if accumulator.n <= 1:
+        raise ValueError("At least two rows with both columns are needed to fit a model.")
+    model = LinearRegressionModel.from_statistics(accumulator)
+    formula = model.get_formula(args.input_column, args.output_column)
+    save_model_data({
+        'input_column': args.input_column,
+        'output_column': args.output_column,
+        'model_description': args.description or "No description provided",
+        'formula': formula,
+        'metrics': {'R²': model.r2_, 'MSE': model.mse_},
+        'model': model,
+    }, args.model)
+    print(formula)
+    print(f"R²: {model.r2_:.4f}  MSE: {model.mse_:.4f}  ({int(accumulator.n)} rows)")
+    return 0
+
+
+def command_evaluate(args):
+    """Cross-validates a regression on a file, or scores a saved model on it."""
+    import numpy as np
+    from src.data.file_importer import import_file
+    from src.models.evaluation import bootstrap_coefficients, cross_validate
+
+    input_column, output_column = args.input_column, args.output_column
+    predictor = None
+    if args.model:
+        predictor = _load_predictor(args.model)
+        input_column = input_column or predictor.input_column
+        output_column = output_column or predictor.output_column
+    if not input_column or not output_column:
+        raise ValueError("--input-column and --output-column are required without a model.")
+
+    data_frame = import_file(args.data, options=_reader_options(args))
+    missing = [col for col in (input_column, output_column) if col not in data_frame.columns]
+    if missing:
+        raise ValueError(f"Columns not found in {args.data}: {', '.join(missing)}")
+    x = data_frame[input_column].to_numpy(dtype='float64', na_value=np.nan)
+    y = data_frame[output_column].to_numpy(dtype='float64', na_value=np.nan)
+
+    if predictor is not None:
+        valid = ~(np.isnan(x) | np.isnan(y))
+        errors = y[valid] - predictor.predict(x[valid])
+        mse = float(np.mean(errors ** 2))
+        total = float(np.sum((y[valid] - y[valid].mean()) ** 2))
+        r2 = 1.0 - float(np.sum(errors ** 2)) / total if total > 0 else float('nan')
+        print(f"Model on {int(valid.sum())} rows: R² {r2:.4f}  MSE {mse:.4f}")
+
+    cv = cross_validate(x, y, k=args.folds, seed=args.seed)
+    print(f"CV R²: {cv['r2_mean']:.4f} ± {cv['r2_std']:.4f} ({args.folds} folds)")
+    print(f"CV MSE: {cv['mse_mean']:.4f} ± {cv['mse_std']:.4f}")
+    if args.resamples:
+        bootstrap = bootstrap_coefficients(x, y, n_resamples=args.resamples, seed=args.seed)
+        print("Coef. 95% CI: [{:.4f}, {:.4f}]".format(*bootstrap['coef_ci']))
+        print("Intercept 95% CI: [{:.4f}, {:.4f}]".format(*bootstrap['intercept_ci']))
+    return 0
+
+
+def command_predict(args):
+    """Predicts values given on the command line, a CSV stream or a file."""
+    predictor = _load_predictor(args.model)
+    if args.x:
+        for text in args.x:
+            print(_format_prediction(predictor, text) or "nan")
+        return 0
+
+    input_column = args.input_column or predictor.input_column
+    if not input_column:
+        raise ValueError("--input-column is required: the model does not name its input column.")
+    input_path = None if args.input in (None, "-") else args.input
+    output_path = None if args.output in (None, "-") else args.output
+
+    keep_columns = None
+    if args.keep_columns is not None:
+        keep_columns = [col.strip() for col in args.keep_columns.split(',') if col.strip()]
+
+    # Models fitted on preprocessed data get the same steps replayed (with
+    # pandas) before they predict.
+    preprocessing = predictor.metadata.get('preprocessing') or {}
+    plain_csv = [path is None or os.path.splitext(path)[1].lower() == '.csv'
+                 for path in (input_path, output_path)]
+    if all(plain_csv) and keep_columns is None and not preprocessing.get('steps'):
+        # The output is staged so that it may be the input file, and so that
+        # a failure leaves no partial output.
+        staging_path = None if output_path is None else _staging_path(output_path)
+        input_stream = sys.stdin if input_path is None else open(input_path, newline='', encoding='utf-8')
+        completed = False
+        try:
+            output_stream = sys.stdout if output_path is None else open(staging_path, 'w', newline='',
+                                                                         encoding='utf-8')
+            try:
+                predict_csv_stream(predictor, input_stream, output_stream, input_column, args.output_column)
+                completed = True
+            finally:
+                if output_path is not None:
+                    output_stream.close()
+        finally:
+            if input_path is not None:
+                input_stream.close()
+            if staging_path is not None:
+                if completed:
+                    os.replace(staging_path, output_path)
+                elif os.path.exists(staging_path):
+                    os.remove(staging_path)
+        return 0
+
+    # Excel, SQLite, compressed or columnar files go through the chunked reader.
+    if input_path is None or output_path is None:
+        raise ValueError("Standard input and output are read and written as CSV: give both files "
+                         "for other formats, with --keep-columns or for a model with preprocessing.")
+    from src.data.pipeline import PreprocessingPipeline
+    from src.models.batch_predict import predict_file
+
+    def report(progress, rows, rows_per_second):
+        sys.stderr.write(f"\r{progress:5.1f}%  {rows} rows  {rows_per_second:,.0f} rows/s")
+        sys.stderr.flush()
+
+    summary = predict_file(predictor, input_path, output_path, input_column,
+                           output_column=args.output_column, options=_reader_options(args),
+                           keep_columns=keep_columns, table_name=args.output_table,
+                           chunk_size=args.chunk_size, progress_callback=report,
+                           pipeline=PreprocessingPipeline.from_dict(preprocessing))
+    sys.stderr.write(f"\n{summary['rows']} rows predicted in {summary['seconds']:.2f} s.\n")
+    return 0
+
+
+def command_export(args):
+    """Converts a model file to another format."""
+    extension = os.path.splitext(args.output)[1].lower()
+    if extension not in ('.pemodel', '.json', '.joblib', '.pkl'):
+        raise ValueError("The output must be a .pemodel, .json, .joblib or .pkl file.")
+
+    if args.model.lower().endswith('.json'):
+        predictor = _load_predictor(args.model)
+        model_data = dict(predictor.metadata, input_column=predictor.input_column,
+                          output_column=predictor.output_column, model=predictor)
+    else:
+        from src.models.model_io import load_model_data
+        model_data = load_model_data(args.model)
+        if model_data.get('model') is None:
+            raise ValueError("The model object is missing in the loaded file.")
+
+    if extension == '.json':
+        from src.models.runtime import export_model_data
+        export_model_data(model_data, args.output)
+    else:
+        from src.models.model_io import save_model_data
+        save_model_data(model_data, args.output)
+    print(f"Model written to {args.output}")
+    return 0
+
+
+def _add_reader_arguments(parser):
+    parser.add_argument("--table", help="The table read from a SQLite file.")
+    parser.add_argument("--sheet", help="The sheet read from an Excel file.")
+
+
+def build_parser():
+    """
+    Returns:
+    - argparse.ArgumentParser: The parser of the command line, with one
+      subcommand per task.
+    """
+    parser = argparse.ArgumentParser(
+        prog="predictease",
+        description="PredictEase without its window: profile and clean data files, "
+                    "fit, evaluate and export models and predict with them."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    profile = subparsers.add_parser("profile", aliases=["import"],
+                                    help="Import a file and print the statistics of its columns.")
+    profile.add_argument("file", help="The CSV, Excel or SQLite file.")
+    _add_reader_arguments(profile)
+    profile.add_argument("--columns", help="Comma-separated columns read (Excel and SQLite files).")
+    profile.add_argument("--json", action="store_true", help="Print the statistics as JSON.")
+    profile.add_argument("--save", help="Also write the imported data to a .csv, .xlsx, .parquet "
+                                        "or .feather file.")
+    profile.set_defaults(handler=command_profile)
+
+    clean = subparsers.add_parser("clean", help="Remove or fill the NaN values of a file.")
+    clean.add_argument("input", help="The CSV, Excel or SQLite file.")
+    clean.add_argument("output", help="The .csv, .xlsx file, or a .parquet, .feather or .arrow "
+                                      "file (processed in chunks, for files larger than memory).")
+    clean.add_argument("--method", choices=sorted(CLEAN_METHODS), default="drop",
+                       help="Drop the rows with NaN values or fill them.")
+    clean.add_argument("--value", type=float, help="The fill value of --method constant.")
+    _add_reader_arguments(clean)
+    clean.set_defaults(handler=command_clean)
+
+    fit = subparsers.add_parser("fit", help="Fit a linear regression and save it.")
+    fit.add_argument("data", help="The CSV, Excel or SQLite file (read in chunks).")
+    fit.add_argument("model", help="The model file written (.pemodel, .joblib or .pkl).")
+    fit.add_argument("--input-column", required=True, help="The input column.")
+    fit.add_argument("--output-column", required=True, help="The target column.")
+    fit.add_argument("--description", help="The description saved with the model.")
+    _add_reader_arguments(fit)
+    fit.set_defaults(handler=command_fit)
+
+    evaluate = subparsers.add_parser("evaluate", help="Cross-validate a regression on a file.")
+    evaluate.add_argument("data", help="The CSV, Excel or SQLite file.")
+    evaluate.add_argument("--model", help="A saved model, also scored on the data "
+                                          "(its columns are used by default).")
+    evaluate.add_argument("--input-column", help="The input column.")
+    evaluate.add_argument("--output-column", help="The target column.")
+    evaluate.add_argument("--folds", type=int, default=5, help="The number of cross-validation folds.")
+    evaluate.add_argument("--resamples", type=int, default=1000,
+                          help="The number of bootstrap resamples (0 to skip the intervals).")
+    evaluate.add_argument("--seed", type=int, default=0, help="The seed of the folds and resamples.")
+    _add_reader_arguments(evaluate)
+    evaluate.set_defaults(handler=command_evaluate)
+
+    predict = subparsers.add_parser("predict", help="Predict with a saved model.")
+    predict.add_argument("model", help="The model file (.pemodel and .json files load fastest).")
+    predict.add_argument("input", nargs="?", help="The file to predict (CSV from standard input "
+                                                  "if omitted or '-').")
+    predict.add_argument("-o", "--output", help="The file written (CSV to standard output if "
+                                                "omitted or '-'; .parquet, .sqlite and .db too).")
+    predict.add_argument("--x", nargs="+", help="Predict these values instead of a file.")
+    predict.add_argument("--input-column", help="The input column (the model's by default).")
+    predict.add_argument("--output-column", default="prediction", help="The predictions column.")
+    predict.add_argument("--keep-columns", help="Comma-separated columns copied to the output "
+                                                "(all by default).")
+    predict.add_argument("--output-table", default="predictions",
+                         help="The table written to a SQLite output.")
+    predict.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                         help="The number of rows per chunk of non-CSV files.")
+    _add_reader_arguments(predict)
+    predict.set_defaults(handler=command_predict)
+
+    export = subparsers.add_parser("export", help="Convert a model file to another format.")
+    export.add_argument("model", help="The model file (.pemodel, .json, .joblib or .pkl).")
+    export.add_argument("output", help="The file written: .pemodel (compact), .json (coefficients "
+                                       "for the runtime), .joblib or .pkl.")
+    export.set_defaults(handler=command_export)
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs a command, e.g.:
+
+        python predictease.py fit data.csv model.pemodel --input-column x --output-column y
+        cat new.csv | python predictease.py predict model.pemodel > predictions.csv
+
+    Parameters:
+    - argv (list): The command line arguments (sys.argv[1:] if None).
+
+    Returns:
+    - int: The exit status.
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # The reader of the output stopped early (e.g. piped to head): the
+        # output still buffered is discarded instead of failing at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, KeyError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
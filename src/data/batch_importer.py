@@ -0,0 +1,112 @@
+# src/data/batch_importer.py
+
+import glob
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from src.data.file_importer import import_file
+
+# Extensions picked up when a whole directory is imported.
+SUPPORTED_EXTENSIONS = ('.csv', '.csv.gz', '.csv.bz2', '.csv.xz', '.csv.zst',
+                        '.xlsx', '.xls', '.sqlite', '.db')
+
+# Start method of the worker processes. Forking the GUI process would copy
+# the Tk interpreter and the locks held by its threads into every worker.
+WORKER_START_METHOD = 'spawn'
+
+
+def expand_sources(path_or_pattern):
+    """
+    Lists the files matched by a directory or a glob pattern.
+
+    Parameters:
+    - path_or_pattern (str): A directory (all supported files in it are used)
+      or a glob pattern such as "exports/2024-*.csv".
+
+    Returns:
+    - list: The sorted file paths.
+    """
+    if os.path.isdir(path_or_pattern):
+        paths = [
+            os.path.join(path_or_pattern, name)
+            for name in os.listdir(path_or_pattern)
+            if name.lower().endswith(SUPPORTED_EXTENSIONS)
+        ]
+    else:
+        paths = glob.glob(path_or_pattern, recursive=True)
+    paths = sorted(path for path in paths if os.path.isfile(path))
+    if not paths:
+        raise ValueError(f"No supported files match '{path_or_pattern}'.")
+    return paths
+
+
+def import_files(path_or_pattern, max_workers=None, source_column=None,
+                 progress_callback=None):
+    """
+    Imports several files in parallel (one process per CPU core by default)
+    and concatenates them into a single DataFrame.
+
+    Parameters:
+    - path_or_pattern (str): A directory or a glob pattern (see expand_sources).
+    - max_workers (int): The number of worker processes (all cores if None).
+    - source_column (str): If given, a categorical column with this name
+      records the file each row comes from. It must not be the name of a
+      column of the files (ValueError).
+    - progress_callback (callable): Called as progress_callback(done, total)
+      every time a file has been processed.
+
+    Returns:
+    - pd.DataFrame: The concatenated DataFrame. Columns missing from some
+      files are filled with NaN and dtypes are unified across files.
+    - dict: The error message of every file that could not be imported.
+    """
+    paths = expand_sources(path_or_pattern)
+    frames = {}
+    failures = {}
+
+    if len(paths) == 1:
+        # Not worth starting a process pool
+        try:
+            frames[paths[0]] = import_file(paths[0])
+        except Exception as e:
+            failures[paths[0]] = str(e)
+        if progress_callback is not None:
+            progress_callback(1, 1)
+    else:
+        # Starting a worker is not free with spawn, so never start idle ones.
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        context = multiprocessing.get_context(WORKER_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {executor.submit(import_file, path): path for path in paths}
+            for done, future in enumerate(as_completed(futures), start=1):
+                path = futures[future]
+                try:
+                    frames[path] = future.result()
+                except Exception as e:
+                    failures[path] = str(e)
+                if progress_callback is not None:
+                    progress_callback(done, len(paths))
+
+    if not frames:
+        raise ValueError("None of the files could be imported.")
+
+    ordered_paths = [path for path in paths if path in frames]
+    ordered_frames = [frames[path] for path in ordered_paths]
+    data_frame = pd.concat(ordered_frames, ignore_index=True, sort=False)
+
+    if source_column:
+        if source_column in data_frame.columns:
+            raise ValueError(f"The files already have a column named '{source_column}': "
+                             "choose another name for the source column.")
+        source_names = [os.path.basename(path) for path in ordered_paths]
+        if len(set(source_names)) < len(source_names):
+            # Same file name in different directories
+            source_names = ordered_paths
+        codes = np.repeat(np.arange(len(ordered_frames)),
+                          [len(frame) for frame in ordered_frames])
+        data_frame[source_column] = pd.Categorical.from_codes(
+            codes, categories=source_names
+        )
+    return data_frame, failures
@@ -0,0 +1,81 @@
+# src/data/compression.py
+
+import bz2
+import gzip
+import lzma
+
+# Magic bytes at the start of each supported compressed format.
+COMPRESSION_SIGNATURES = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+]
+
+# File name suffixes of compressed files (e.g. "export.csv.gz").
+COMPRESSION_EXTENSIONS = ('gz', 'bz2', 'xz', 'zst')
+
+
+def detect_compression(file_path):
+    """
+    Detects the compression of a file from its magic bytes.
+
+    Parameters:
+    - file_path (str): The path of the file.
+
+    Returns:
+    - str: 'gzip', 'bz2', 'xz' or 'zstd', or None if the file is not compressed.
+    """
+    with open(file_path, 'rb') as handle:
+        magic = handle.read(6)
+    for signature, compression in COMPRESSION_SIGNATURES:
+        if magic.startswith(signature):
+            return compression
+    return None
+
+
+def get_file_extension(file_path):
+    """
+    Returns the extension of a file, ignoring a compression suffix
+    (e.g. 'csv' for "export.csv.gz").
+
+    Parameters:
+    - file_path (str): The path of the file.
+
+    Returns:
+    - str: The lowercase extension without the dot.
+    """
+    parts = file_path.lower().split('.')
+    if len(parts) > 2 and parts[-1] in COMPRESSION_EXTENSIONS:
+        return parts[-2]
+    return parts[-1]
+
+
+def open_decompressed(raw_handle, compression):
+    """
+    Wraps a binary file handle so that it is decompressed on the fly,
+    without writing the decompressed data anywhere.
+
+    Parameters:
+    - raw_handle (file): The compressed file opened in binary mode.
+    - compression (str): The compression returned by detect_compression,
+      or None for an uncompressed file.
+
+    Returns:
+    - file: A binary file-like object yielding the decompressed bytes.
+    """
+    if compression is None:
+        return raw_handle
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=raw_handle, mode='rb')
+    if compression == 'bz2':
+        return bz2.BZ2File(raw_handle, mode='rb')
+    if compression == 'xz':
+        return lzma.LZMAFile(raw_handle, mode='rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("Reading .zst files requires the 'zstandard' package.")
+        return zstandard.ZstdDecompressor().stream_reader(raw_handle)
+    raise ValueError(f"Unsupported compression: {compression}")
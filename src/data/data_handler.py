@@ -1,63 +1,120 @@
 # src/data/data_handler.py
 
-from tkinter import messagebox, simpledialog
+import numpy as np
+import pandas as pd
 
 
-def handle_nan_values(df, option):
+def fill_nan_values(df, method, constant_value=None, inplace=False, statistics=None):
+    """
+    Fills the NaN values of every numeric column (of any dtype, including
+    float32 and nullable integers) in a single pass: the statistics of all
+    the columns containing NaN are computed in one vectorized reduction and
+    written back with one assignment per dtype.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame to process.
+    - method (str): "mean", "median" or "constant".
+    - constant_value (float): The value used by the "constant" method.
+    - inplace (bool): If True, df is modified instead of being copied.
+    - statistics (pd.Series): Precomputed fill value of each column (e.g.
+      the mean over a whole file processed in chunks), used instead of
+      computing it from df. Columns missing from it are not filled.
+
+    Returns:
+    - pd.DataFrame: The processed DataFrame (df itself if inplace is True).
+    - pd.Series: The number of cells filled in each column.
+    """
+    numeric = df.select_dtypes(include='number')
+    nan_counts = numeric.isnull().sum()
+    columns = nan_counts.index[nan_counts > 0]
+
+    if statistics is not None:
+        fill_values = pd.Series(statistics, dtype='float64').reindex(columns)
+    elif method == "mean":
+        fill_values = numeric[columns].mean()
+    elif method == "median":
+        fill_values = numeric[columns].median()
+    elif method == "constant":
+        fill_values = pd.Series(float(constant_value), index=columns)
+    else:
+        raise ValueError(f"Unknown fill method: {method}")
+
+    # Columns made only of NaN have no statistic and stay untouched.
+    fill_values = fill_values.dropna()
+
+    if not inplace:
+        df = df.copy()
+
+    # NumPy float columns are filled per dtype group, as one 2D array.
+    dtypes = df.dtypes[fill_values.index]
+    is_numpy_float = dtypes.map(lambda dtype: isinstance(dtype, np.dtype) and dtype.kind == 'f')
+    for dtype in dtypes[is_numpy_float].unique():
+        group = dtypes.index[is_numpy_float & (dtypes == dtype)]
+        block = df[group].to_numpy(dtype=dtype, copy=True)
+        np.copyto(block, np.broadcast_to(fill_values[group].to_numpy(dtype=dtype), block.shape),
+                  where=np.isnan(block))
+        df.loc[:, group] = block
+
+    # Nullable (extension) columns go through pandas; integer columns cannot
+    # hold a fractional fill value and become Float64.
+    extension_values = fill_values[~is_numpy_float]
+    for col, value in extension_values.items():
+        if pd.api.types.is_integer_dtype(df[col].dtype) and not float(value).is_integer():
+            df[col] = df[col].astype('Float64')
+    if len(extension_values):
+        df.fillna(extension_values.to_dict(), inplace=True)
+
+    return df, nan_counts[fill_values.index]
+
+
+def handle_nan_values(df, option, constant_value=None, inplace=False, statistics=None):
     """
     Handles NaN values in the DataFrame based on the selected option.
 
     Parameters:
     - df (pd.DataFrame): The DataFrame to process.
     - option (str): The option selected for handling NaN values ("1" to "4").
+    - constant_value (float): The value used to fill NaN values with option "4".
+    - inplace (bool): If True, the filling options modify df directly
+      instead of copying it, which avoids doubling the peak memory.
+    - statistics (pd.Series): Precomputed fill value of each column (e.g.
+      from the dataset profile), so the filling options do not scan df.
 
     Returns:
     - pd.DataFrame: The processed DataFrame.
     - str: A success message to display to the user.
+
+    Raises:
+    - ValueError: If the option is unknown or the constant value is missing.
     """
-    try:
-        if option == "1":
-            # Remove rows with NaN values
-            df = df.dropna()
-            success_message = "Rows with NaN values have been removed."
-        else:
-            if option == "4":  # Fill with a constant
-                constant_value_input = simpledialog.askstring(
-                    "Input",
-                    "Enter a constant value:"
-                )
-                if constant_value_input is None:
-                    return None, "Operation cancelled by user."
-                try:
-                    constant_value = float(constant_value_input)
-                except ValueError:
-                    return None, "Invalid constant value entered."
-
-            # Select numeric columns
-            numeric_columns = df.select_dtypes(
-                                               include=['float64',
-                                                        'int64']).columns
-            for col in numeric_columns:
-                if option == "2":  # Fill with mean
-                    mean_value = df[col].mean()
-                    df[col] = df[col].fillna(mean_value)
-                elif option == "3":  # Fill with median
-                    median_value = df[col].median()
-                    df[col] = df[col].fillna(median_value)
-                elif option == "4":  # Fill with a constant
-                    df[col] = df[col].fillna(constant_value)
-
-            # Define success message
-            if option == "2":
-                success_message = "NaN values have been filled with the column mean."
-            elif option == "3":
-                success_message = "NaN values have been filled with the column median."
-            elif option == "4":
-                success_message = f"NaN values have been filled with the constant value: {constant_value}"
-
-        return df, success_message
-
-    except Exception as e:
-        error_message = f"An error occurred while handling NaN values: {str(e)}"
-        messagebox.showerror("Error", error_message)
-        return None, error_message
+    if option == "1":
+        # Remove rows with NaN values
+        rows_before = len(df)
+        df = df.dropna()
+        return df, f"Rows with NaN values have been removed ({rows_before - len(df)} rows)."
+
+    if option not in ("2", "3", "4"):
+        raise ValueError(f"Unknown option: {option}")
+    if option == "4" and constant_value is None:
+        raise ValueError("A constant value is required to fill NaN values with a constant.")
+
+    # Fill every numeric column in a single pass
+    method = {"2": "mean", "3": "median", "4": "constant"}[option]
+    df, filled_counts = fill_nan_values(
+        df, method, constant_value if option == "4" else None, inplace, statistics
+    )
+
+    # Define success message
+    if option == "2":
+        success_message = "NaN values have been filled with the column mean."
+    elif option == "3":
+        success_message = "NaN values have been filled with the column median."
+    else:
+        success_message = f"NaN values have been filled with the constant value: {constant_value}"
+
+    # Report how many cells were filled in each column
+    if filled_counts.sum():
+        details = ", ".join(f"{col} ({count})" for col, count in filled_counts.items())
+        success_message += f"\nCells filled: {details}"
+
+    return df, success_message
@@ -0,0 +1,208 @@
+# src/data/dataset_cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+import pandas as pd
+
+# Default location and size cap of the on-disk dataset cache.
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".predictease", "cache")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+
+# Number of bytes hashed at the start, middle and end of a source file.
+FINGERPRINT_BLOCK_SIZE = 1024 * 1024
+
+INDEX_FILE_NAME = "index.json"
+
+
+def fingerprint_file(file_path, block_size=FINGERPRINT_BLOCK_SIZE):
+    """
+    Computes a content hash of a file from its size and three sampled blocks
+    (start, middle and end), so multi-GB files are fingerprinted in milliseconds.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - block_size (int): The number of bytes read for each block.
+
+    Returns:
+    - str: The hexadecimal digest.
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=20)
+    with open(file_path, 'rb') as handle:
+        if size <= 3 * block_size:
+            digest.update(handle.read())
+        else:
+            for offset in (0, size // 2, size - block_size):
+                handle.seek(offset)
+                digest.update(handle.read(block_size))
+    return digest.hexdigest()
+
+
+class DatasetCache:
+    """
+    A columnar (Feather) on-disk cache of imported datasets.
+
+    Entries are keyed by the absolute path of the source file and are only
+    reused while its size, modification time and content hash are unchanged.
+    The total size of the cache is capped and the least recently used
+    entries are evicted first.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+
+    def load(self, file_path, variant=""):
+        """
+        Loads a dataset from the cache.
+
+        Parameters:
+        - file_path (str): The path of the source file.
+        - variant (str): Distinguishes datasets read from the same file with
+          different import options (e.g. another table or sheet).
+
+        Returns:
+        - pd.DataFrame: The cached DataFrame, or None if there is no valid entry.
+        """
+        key = self._key(file_path, variant)
+        with self.lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return None
+
+            sidecar_path = os.path.join(self.cache_dir, entry['sidecar'])
+            stat = os.stat(file_path)
+            if (entry['source_size'] != stat.st_size
+                    or entry['source_mtime'] != stat.st_mtime
+                    or entry['content_hash'] != fingerprint_file(file_path)
+                    or not os.path.exists(sidecar_path)):
+                # The source file changed: the entry is stale.
+                self._remove_entry(index, key)
+                self._write_index(index)
+                return None
+
+            entry['last_access'] = time.time()
+            self._write_index(index)
+
+        return pd.read_feather(sidecar_path)
+
+    def store(self, file_path, data_frame, variant=""):
+        """
+        Stores a dataset in the cache, evicting old entries if needed.
+
+        Parameters:
+        - file_path (str): The path of the source file.
+        - data_frame (pd.DataFrame): The DataFrame imported from the file.
+        - variant (str): The import options the DataFrame was read with.
+
+        Returns:
+        - bool: True if the dataset was cached, False otherwise.
+        """
+        key = self._key(file_path, variant)
+        sidecar = f"{key}.feather"
+        sidecar_path = os.path.join(self.cache_dir, sidecar)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        try:
+            # Feather needs string column names and a default index.
+            data_frame.reset_index(drop=True).to_feather(sidecar_path)
+        except Exception:
+            # Some frames (e.g. mixed-type object columns) cannot be stored
+            # in a columnar format; the import works without the cache.
+            if os.path.exists(sidecar_path):
+                os.remove(sidecar_path)
+            return False
+
+        stat = os.stat(file_path)
+        with self.lock:
+            index = self._read_index()
+            index[key] = {
+                'source_path': os.path.abspath(file_path),
+                'variant': variant,
+                'source_size': stat.st_size,
+                'source_mtime': stat.st_mtime,
+                'content_hash': fingerprint_file(file_path),
+                'sidecar': sidecar,
+                'sidecar_size': os.path.getsize(sidecar_path),
+                'last_access': time.time()
+            }
+            self._evict(index)
+            self._write_index(index)
+        return key in index
+
+    def entries(self):
+        """
+        Lists the cache entries, most recently used first.
+
+        Returns:
+        - list: A list of dicts describing each cached dataset.
+        """
+        with self.lock:
+            index = self._read_index()
+        return sorted(index.values(), key=lambda entry: entry['last_access'],
+                      reverse=True)
+
+    def total_size(self):
+        """
+        Returns:
+        - int: The number of bytes used by the cached sidecar files.
+        """
+        return sum(entry['sidecar_size'] for entry in self.entries())
+
+    def clear(self):
+        """
+        Removes every entry from the cache.
+        """
+        with self.lock:
+            index = self._read_index()
+            for key in list(index):
+                self._remove_entry(index, key)
+            self._write_index(index)
+
+    def _evict(self, index):
+        """Removes the least recently used entries until the size cap is met."""
+        by_age = sorted(index, key=lambda key: index[key]['last_access'])
+        total = sum(entry['sidecar_size'] for entry in index.values())
+        for key in by_age:
+            if total <= self.max_bytes:
+                break
+            total -= index[key]['sidecar_size']
+            self._remove_entry(index, key)
+
+    def _remove_entry(self, index, key):
+        """Deletes the sidecar file of an entry and drops it from the index."""
+        entry = index.pop(key)
+        sidecar_path = os.path.join(self.cache_dir, entry['sidecar'])
+        if os.path.exists(sidecar_path):
+            os.remove(sidecar_path)
+
+    def _key(self, file_path, variant=""):
+        """Returns the cache key of a source file (a hash of its absolute path)."""
+        key_source = os.path.abspath(file_path) + "\0" + variant
+        return hashlib.sha1(key_source.encode()).hexdigest()
+
+    def _read_index(self):
+        """Reads the JSON index of the cache."""
+        index_path = os.path.join(self.cache_dir, INDEX_FILE_NAME)
+        if not os.path.exists(index_path):
+            return {}
+        try:
+            with open(index_path, 'r', encoding='utf-8') as handle:
+                return json.load(handle)
+        except ValueError:
+            # A damaged index only costs a re-import.
+            return {}
+
+    def _write_index(self, index):
+        """Writes the JSON index of the cache atomically."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index_path = os.path.join(self.cache_dir, INDEX_FILE_NAME)
+        temp_path = index_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump(index, handle)
+        os.replace(temp_path, index_path)
@@ -1,68 +1,565 @@
 # src/data/file_importer.py
 
+import importlib.util
+import json
+import os
 import sqlite3
+import numpy as np
+import openpyxl
 import pandas as pd
+from src.data.compression import (detect_compression, get_file_extension,
+                                  open_decompressed)
+from src.data.schema_sniffer import sniff_csv_schema
 
+# Number of rows parsed per chunk when a CSV file is imported in streaming mode.
+DEFAULT_CHUNK_SIZE = 50000
 
-def read_csv(file_path):
-    """Helper function to read CSV files."""
-    return pd.read_csv(file_path)
 
+class ImportCancelledError(Exception):
+    """Raised when the user cancels an import that is still in progress."""
 
-def read_excel(file_path):
-    """Helper function to read Excel files."""
-    return pd.read_excel(file_path, engine='openpyxl')
 
+def read_csv(file_path, dtype=None):
+    """
+    Helper function to read CSV files, compressed or not. The text columns
+    found by sniff_csv_schema spare pandas their type inference; the file
+    is parsed once.
+    """
+    compression = detect_compression(file_path)
+    return pd.read_csv(file_path, dtype=dtype or None, compression=compression)
 
-def read_sqlite_or_db(file_path):
-    """Helper function to read SQLite or DB files."""
-    connection = sqlite3.connect(file_path)
-    tables = pd.read_sql_query(
-        "SELECT name FROM sqlite_master WHERE type = 'table';", connection
-    )
-    if tables.empty:
-        raise ValueError("The file does not contain any tables.")
-    table_name = tables['name'].iloc[0]
-    data_frame = pd.read_sql_query(f'SELECT * FROM "{table_name}"', connection)
-    connection.close()
+
+def iter_csv_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE, columns=None):
+    """
+    Reads a CSV file lazily, one chunk of rows at a time. Compressed files
+    (gzip, bz2, xz, zstd) are decompressed as a stream.
+
+    Parameters:
+    - file_path (str): The path of the CSV file.
+    - chunk_size (int): The number of rows per chunk.
+    - columns (list): The columns to parse (all columns if None).
+
+    Yields:
+    - tuple: (pd.DataFrame, float) with the parsed chunk and the
+      percentage of the file (in bytes on disk) consumed so far.
+
+    The file is closed when the chunks are exhausted, when parsing fails
+    and when the consumer stops early (close() of the generator).
+    """
+    total_size = os.path.getsize(file_path)
+    compression = detect_compression(file_path)
+    with open(file_path, 'rb') as raw_handle:
+        stream = open_decompressed(raw_handle, compression)
+        try:
+            reader = pd.read_csv(stream, chunksize=chunk_size, usecols=columns)
+            try:
+                for chunk in reader:
+                    # The parser reads ahead in blocks, so the position of the
+                    # underlying (compressed) handle is a close, cheap estimate
+                    # of the progress.
+                    progress = raw_handle.tell() * 100.0 / total_size if total_size else 100.0
+                    yield chunk, min(progress, 100.0)
+            finally:
+                reader.close()
+        finally:
+            if stream is not raw_handle:
+                stream.close()
+
+
+def import_csv_in_chunks(file_path, chunk_size=DEFAULT_CHUNK_SIZE,
+                         chunk_callback=None, progress_callback=None,
+                         cancel_event=None):
+    """
+    Imports a CSV file in chunks so the caller can display the data
+    before the whole file has been parsed.
+
+    Parameters:
+    - file_path (str): The path of the CSV file.
+    - chunk_size (int): The number of rows per chunk.
+    - chunk_callback (callable): Called as chunk_callback(chunk, is_first)
+      for every parsed chunk.
+    - progress_callback (callable): Called with the progress percentage
+      (0-100) after every chunk.
+    - cancel_event (threading.Event): When set, the import stops and
+      ImportCancelledError is raised.
+
+    Returns:
+    - pd.DataFrame: The complete DataFrame.
+    """
+    # Reject malformed files before streaming them.
+    sniff_csv_schema(file_path)
+
+    chunks = []
+    chunk_iterator = iter_csv_chunks(file_path, chunk_size)
+    try:
+        for chunk, progress in chunk_iterator:
+            if cancel_event is not None and cancel_event.is_set():
+                raise ImportCancelledError("The import was cancelled by the user.")
+
+            is_first = not chunks
+            if is_first:
+                # Reject malformed files as soon as the first chunk is parsed.
+                validate_dataframe(chunk)
+            chunks.append(chunk)
+
+            if chunk_callback is not None:
+                chunk_callback(chunk, is_first)
+            if progress_callback is not None:
+                progress_callback(progress)
+    finally:
+        # Close the file at once when the import is cancelled or fails
+        chunk_iterator.close()
+
+    if not chunks:
+        raise ValueError("The file does not contain any data.")
+
+    data_frame = pd.concat(chunks, ignore_index=True)
+    validate_dataframe(data_frame)
     return data_frame
 
 
+def list_excel_sheets(file_path):
+    """
+    Lists the sheets of an Excel file without loading their content.
+
+    Parameters:
+    - file_path (str): The path of the Excel file.
+
+    Returns:
+    - list: The sheet names.
+    """
+    if file_path.lower().endswith('.xlsx'):
+        workbook = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    with pd.ExcelFile(file_path) as excel_file:
+        return list(excel_file.sheet_names)
+
+
+def _calamine_available():
+    """Returns True if the optional (and much faster) calamine engine is installed."""
+    return importlib.util.find_spec("python_calamine") is not None
+
+
+def _excel_rows_to_frame(rows, header, positions):
+    """Helper function to build a DataFrame from raw worksheet rows."""
+    records = [tuple(row[pos] if pos < len(row) else None for pos in positions)
+               for row in rows]
+    chunk = pd.DataFrame.from_records(records, columns=[header[pos] for pos in positions])
+    return chunk.infer_objects()
+
+
+def iter_excel_chunks(file_path, sheet_name=None, columns=None,
+                      chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads a sheet of an Excel file lazily, one chunk of rows at a time.
+    XLSX files are streamed with openpyxl's read-only mode, so the workbook
+    object model is never built in memory, and only the selected columns
+    are kept. With calamine installed (or for XLS files), the sheet is
+    parsed at once by pandas and returned as a single chunk.
+
+    Parameters:
+    - file_path (str): The path of the Excel file.
+    - sheet_name (str): The sheet to read (the first sheet if None).
+    - columns (list): The columns to read (all columns if None).
+    - chunk_size (int): The number of rows per chunk.
+
+    Yields:
+    - tuple: (pd.DataFrame, float) with the parsed chunk and the
+      percentage of the rows of the sheet read so far.
+    """
+    if not file_path.lower().endswith('.xlsx') or _calamine_available():
+        engine = 'calamine' if _calamine_available() else None
+        yield pd.read_excel(file_path, sheet_name=sheet_name or 0,
+                            usecols=columns, engine=engine), 100.0
+        return
+
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        total_rows = worksheet.max_row or 0
+        rows = worksheet.iter_rows(values_only=True)
+
+        # The first non-empty row holds the column names.
+        header = None
+        for row in rows:
+            if any(value is not None for value in row):
+                header = [
+                    str(value) if value is not None else f"Unnamed: {position}"
+                    for position, value in enumerate(row)
+                ]
+                break
+        if header is None:
+            raise ValueError("The file does not contain any data.")
+
+        if columns:
+            unknown_columns = [col for col in columns if col not in header]
+            if unknown_columns:
+                raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+            positions = [header.index(col) for col in columns]
+        else:
+            positions = list(range(len(header)))
+
+        buffer = []
+        rows_read = 1
+        for row in rows:
+            rows_read += 1
+            # Blank rows are skipped, as pandas does.
+            if all(row[pos] is None for pos in positions if pos < len(row)):
+                continue
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                progress = rows_read * 100.0 / total_rows if total_rows else 100.0
+                yield _excel_rows_to_frame(buffer, header, positions), min(progress, 100.0)
+                buffer = []
+        if buffer or rows_read == 1:
+            yield _excel_rows_to_frame(buffer, header, positions), 100.0
+    finally:
+        workbook.close()
+
+
+def read_excel(file_path, sheet_name=None, columns=None, progress_callback=None):
+    """
+    Helper function to read Excel files.
+
+    Parameters:
+    - file_path (str): The path of the Excel file.
+    - sheet_name (str): The sheet to read (the first sheet if None).
+    - columns (list): The columns to read (all columns if None).
+    - progress_callback (callable): Called with the percentage of rows read.
+    """
+    chunks = []
+    for chunk, progress in iter_excel_chunks(file_path, sheet_name, columns):
+        chunks.append(chunk)
+        if progress_callback is not None:
+            progress_callback(progress)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def quote_identifier(name):
+    """Helper function to quote a table or column name for SQLite."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def list_sqlite_tables(file_path):
+    """
+    Lists the tables of a SQLite or DB file with their number of rows.
+
+    Parameters:
+    - file_path (str): The path of the SQLite file.
+
+    Returns:
+    - list: A list of (table_name, row_count) tuples.
+    """
+    connection = sqlite3.connect(file_path)
+    try:
+        names = [row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table';"
+        )]
+        return [
+            (name, connection.execute(
+                f"SELECT COUNT(*) FROM {quote_identifier(name)}"
+            ).fetchone()[0])
+            for name in names
+        ]
+    finally:
+        connection.close()
+
+
+def build_sqlite_query(connection, table_name, columns=None, where=None,
+                       limit=None, sample=False, params=None):
+    """
+    Builds the SELECT statement used to import a SQLite table, pushing the
+    column selection, the filter and the row limit down to SQLite.
+
+    Parameters:
+    - connection (sqlite3.Connection): An open connection to the file.
+    - table_name (str): The table to read.
+    - columns (list): The columns to read (all columns if None).
+    - where (str): An optional SQL condition (without the WHERE keyword),
+      with '?' placeholders for its values.
+    - limit (int): The maximum number of rows to read.
+    - sample (bool): If True, the rows are picked at random instead of
+      taking the first ones (requires a limit).
+    - params (list): The values bound to the placeholders of 'where'.
+
+    Returns:
+    - tuple: (query, parameters) ready for connection.execute.
+    """
+    table_columns = [row[1] for row in connection.execute(
+        f"PRAGMA table_info({quote_identifier(table_name)})"
+    )]
+    if not table_columns:
+        raise ValueError(f"The table '{table_name}' does not exist.")
+
+    if columns:
+        unknown_columns = [col for col in columns if col not in table_columns]
+        if unknown_columns:
+            raise ValueError(f"Unknown columns: {', '.join(unknown_columns)}")
+        column_sql = ", ".join(quote_identifier(col) for col in columns)
+    else:
+        column_sql = "*"
+
+    query = f"SELECT {column_sql} FROM {quote_identifier(table_name)}"
+    parameters = list(params or [])
+    if where:
+        # The parentheses keep the condition from spilling into the
+        # ORDER BY and LIMIT clauses added below.
+        query += f" WHERE ({where})"
+    elif parameters:
+        raise ValueError("Query parameters require a WHERE condition.")
+    if sample:
+        if limit is None:
+            raise ValueError("A row limit is required to sample a table.")
+        query += " ORDER BY RANDOM()"
+    if limit is not None:
+        query += " LIMIT ?"
+        parameters.append(int(limit))
+    return query, parameters
+
+
+def iter_sqlite_chunks(file_path, table_name=None, columns=None, where=None,
+                       limit=None, sample=False, params=None,
+                       chunk_size=DEFAULT_CHUNK_SIZE, count_rows=True):
+    """
+    Reads a SQLite table lazily with fetchmany, one chunk of rows at a time.
+
+    Parameters:
+    - file_path (str): The path of the SQLite file.
+    - table_name (str): The table to read (the first table if None).
+    - columns, where, limit, sample, params: See build_sqlite_query.
+    - chunk_size (int): The number of rows per chunk.
+    - count_rows (bool): If True, the rows matching the query are counted
+      first to report the progress. Otherwise the progress is 0 until the
+      last chunk, which spares a scan when nobody displays it.
+
+    Yields:
+    - tuple: (pd.DataFrame, float) with the rows of each chunk and the
+      percentage of the selected rows read so far.
+    """
+    connection = sqlite3.connect(file_path)
+    try:
+        if table_name is None:
+            first_table = connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table';"
+            ).fetchone()
+            if first_table is None:
+                raise ValueError("The file does not contain any tables.")
+            table_name = first_table[0]
+
+        query, parameters = build_sqlite_query(
+            connection, table_name, columns, where, limit, sample, params
+        )
+        expected_rows = 0
+        if count_rows:
+            # Count with the same filter and limit, without the random order.
+            count_query, count_parameters = build_sqlite_query(
+                connection, table_name, None, where, limit, False, params
+            )
+            expected_rows = connection.execute(
+                f"SELECT COUNT(*) FROM ({count_query})", count_parameters
+            ).fetchone()[0]
+
+        cursor = connection.execute(query, parameters)
+        column_names = [description[0] for description in cursor.description]
+
+        rows = cursor.fetchmany(chunk_size)
+        if not rows:
+            # Keep the column names even when no row matches.
+            yield pd.DataFrame(columns=column_names), 100.0
+        rows_read = 0
+        while rows:
+            # Fetch one chunk ahead to know when the last one is reached.
+            next_rows = cursor.fetchmany(chunk_size)
+            rows_read += len(rows)
+            if not next_rows:
+                progress = 100.0
+            elif not expected_rows:
+                progress = 0.0
+            else:
+                progress = min(rows_read * 100.0 / expected_rows, 100.0)
+            yield pd.DataFrame.from_records(rows, columns=column_names), progress
+            rows = next_rows
+    finally:
+        connection.close()
+
+
+def read_sqlite_or_db(file_path, table_name=None, columns=None, where=None,
+                      limit=None, sample=False, params=None):
+    """Helper function to read SQLite or DB files."""
+    chunks = [chunk for chunk, _ in iter_sqlite_chunks(
+        file_path, table_name, columns, where, limit, sample, params,
+        count_rows=False
+    )]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_file_chunks(file_path, options=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Reads a CSV (possibly compressed), Excel or SQLite file lazily,
+    one chunk of rows at a time.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - options (dict): The reader options (see import_file).
+    - chunk_size (int): The number of rows per chunk.
+
+    Yields:
+    - tuple: (pd.DataFrame, float) with the parsed chunk and the progress
+      percentage of the read.
+    """
+    options = options or {}
+    extension = get_file_extension(file_path)
+    if extension == 'csv':
+        sniff_csv_schema(file_path)
+        return iter_csv_chunks(file_path, chunk_size, columns=options.get('columns'))
+    if extension in ['xlsx', 'xls']:
+        return iter_excel_chunks(file_path, chunk_size=chunk_size, **options)
+    if extension in ['sqlite', 'db']:
+        return iter_sqlite_chunks(file_path, chunk_size=chunk_size, **options)
+    raise ValueError("Unsupported file format or empty file.")
+
+
+def sample_file(file_path, n_rows, options=None, seed=None,
+                chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None,
+                cancel_event=None):
+    """
+    Draws a uniform random sample of rows from a file in a single streaming
+    pass (reservoir sampling), while counting the rows and missing values
+    of the whole file exactly.
+
+    Every row gets a random key and the reservoir keeps the n_rows rows with
+    the smallest keys, which is a uniform sample without replacement. Each
+    chunk is processed at once with NumPy.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - n_rows (int): The size of the sample.
+    - options (dict): The reader options (see import_file).
+    - seed (int): The seed of the random generator.
+    - chunk_size (int): The number of rows per chunk.
+    - progress_callback (callable): Called with the progress percentage.
+    - cancel_event (threading.Event): When set, ImportCancelledError is raised.
+
+    Returns:
+    - pd.DataFrame: The sampled rows, in their original order.
+    - pd.DataFrame: For each column of the file, the exact number of rows
+      ('rows') and of missing values ('nan_count').
+    """
+    rng = np.random.default_rng(seed)
+    reservoir = None
+    reservoir_keys = np.empty(0)
+    row_offset = 0
+    total_rows = 0
+    nan_counts = None
+
+    for chunk, progress in iter_file_chunks(file_path, options, chunk_size):
+        if cancel_event is not None and cancel_event.is_set():
+            raise ImportCancelledError("The import was cancelled by the user.")
+        if reservoir is None:
+            validate_dataframe(chunk)
+
+        chunk = chunk.set_axis(np.arange(row_offset, row_offset + len(chunk)))
+        row_offset += len(chunk)
+        total_rows += len(chunk)
+        chunk_nans = chunk.isnull().sum()
+        nan_counts = chunk_nans if nan_counts is None else nan_counts.add(chunk_nans, fill_value=0)
+
+        keys = rng.random(len(chunk))
+        if reservoir is not None and len(reservoir) >= n_rows:
+            # Only rows beating the current worst key can enter the reservoir.
+            selected = keys < reservoir_keys.max()
+            chunk, keys = chunk[selected], keys[selected]
+        if reservoir is None:
+            reservoir, reservoir_keys = chunk, keys
+        elif len(chunk):
+            reservoir = pd.concat([reservoir, chunk])
+            reservoir_keys = np.concatenate([reservoir_keys, keys])
+        if len(reservoir) > n_rows:
+            keep = np.argpartition(reservoir_keys, n_rows - 1)[:n_rows]
+            reservoir, reservoir_keys = reservoir.iloc[keep], reservoir_keys[keep]
+
+        if progress_callback is not None:
+            progress_callback(progress)
+
+    if reservoir is None or total_rows == 0:
+        raise ValueError("The file does not contain any data.")
+
+    sample = reservoir.sort_index().reset_index(drop=True)
+    stats = pd.DataFrame({
+        'rows': total_rows,
+        'nan_count': nan_counts.astype('int64')
+    })
+    return sample, stats
+
+
 def validate_dataframe(data_frame):
     """Helper function to validate that the
     DataFrame is not empty and has valid data types."""
     if data_frame.empty:
         raise ValueError("The file does not contain any data.")
 
-    # Validate that the DataFrame columns contain valid data types.
-    for col in data_frame.columns:
-        if not (pd.api.types.is_numeric_dtype(data_frame[col]) or
-                pd.api.types.is_string_dtype(data_frame[col])):
+    # Validate that the DataFrame columns contain valid data types
+    # (including the compact categorical columns). The dtypes are checked
+    # all at once; only object columns need their values inspected.
+    dtypes = data_frame.dtypes
+    is_object = dtypes.map(pd.api.types.is_object_dtype).to_numpy()
+    is_valid = dtypes.map(
+        lambda dtype: pd.api.types.is_numeric_dtype(dtype) or
+        isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype))
+    ).to_numpy()
+    if not is_valid[~is_object].all():
+        raise ValueError("The file contains malformed or unreadable data.")
+    for position in is_object.nonzero()[0]:
+        if not pd.api.types.is_string_dtype(data_frame.iloc[:, position]):
             raise ValueError("The file contains malformed or unreadable data.")
 
 
-def import_file(file_path):
+def import_file(file_path, cache=None, options=None, progress_callback=None):
     """
     Function to load a CSV, DB, SQLite, XLS, or XLSX file.
     Handles cases where the file is corrupted, empty, or incompatible.
+
+    If a DatasetCache is given, an unchanged file is loaded from its cached
+    columnar copy and freshly parsed files are added to the cache.
+    The options dict is passed as keyword arguments to the reader
+    (e.g. table_name, columns, where, params, limit and sample for SQLite files,
+    sheet_name and columns for Excel files). The progress_callback receives
+    the percentage of rows read from Excel files.
     """
+    options = options or {}
+    cache_variant = json.dumps(options, sort_keys=True) if options else ""
     try:
+        if cache is not None:
+            data_frame = cache.load(file_path, cache_variant)
+            if data_frame is not None:
+                return data_frame
+
         # Extract the file extension and determine
         # the appropriate reader function.
-        extension = file_path.split('.')[-1].lower()
+        # Compressed files (e.g. "data.csv.gz") are read as their inner format.
+        extension = get_file_extension(file_path)
 
         if extension == 'csv':
-            data_frame = read_csv(file_path)
+            # Fail fast on malformed files, then parse with the sampled schema.
+            schema = sniff_csv_schema(file_path)
+            data_frame = read_csv(file_path, dtype=schema)
         elif extension in ['xlsx', 'xls']:
-            data_frame = read_excel(file_path)
+            data_frame = read_excel(file_path, progress_callback=progress_callback,
+                                    **options)
         elif extension in ['sqlite', 'db']:
-            data_frame = read_sqlite_or_db(file_path)
+            data_frame = read_sqlite_or_db(file_path, **options)
         else:
             raise ValueError("Unsupported file format or empty file.")
 
         # Validate the data in the DataFrame.
         validate_dataframe(data_frame)
 
+        if cache is not None:
+            cache.store(file_path, data_frame, cache_variant)
+
         return data_frame
 
     except (pd.errors.EmptyDataError, pd.errors.ParserError, ValueError) as e:
@@ -0,0 +1,84 @@
+# src/data/memory_optimizer.py
+
+import numpy as np
+import pandas as pd
+
+# Text columns whose ratio of distinct values to rows is at most this value
+# are stored as categoricals.
+DEFAULT_CATEGORY_THRESHOLD = 0.5
+
+
+def _compact_series(series, category_threshold):
+    """
+    Returns the most compact lossless representation of a column.
+
+    Parameters:
+    - series (pd.Series): The column to convert.
+    - category_threshold (float): See compact_dtypes.
+
+    Returns:
+    - pd.Series: The converted column (or the original one).
+    """
+    dtype = series.dtype
+
+    if pd.api.types.is_bool_dtype(dtype):
+        return series
+
+    if pd.api.types.is_integer_dtype(dtype):
+        return pd.to_numeric(series, downcast='integer')
+
+    if pd.api.types.is_float_dtype(dtype):
+        if dtype == np.float32 or series.empty:
+            return series
+        values = series.to_numpy(dtype='float64', na_value=np.nan)
+        as_float32 = values.astype('float32')
+        # Only downcast when every value survives the round trip unchanged.
+        if np.array_equal(values, as_float32.astype('float64'), equal_nan=True):
+            return pd.Series(as_float32, index=series.index, name=series.name)
+        return series
+
+    if (pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)) \
+            and not isinstance(dtype, pd.CategoricalDtype):
+        if pd.api.types.infer_dtype(series, skipna=True) not in ('string', 'empty'):
+            return series
+        non_null = series.count()
+        if non_null and series.nunique() / non_null <= category_threshold:
+            return series.astype('category')
+        if pd.api.types.is_object_dtype(dtype):
+            return series.astype('string[pyarrow]')
+
+    return series
+
+
+def compact_dtypes(df, category_threshold=DEFAULT_CATEGORY_THRESHOLD):
+    """
+    Converts the columns of a DataFrame to the smallest safe dtypes:
+    integers are downcast, floats become float32 when no precision is lost,
+    low-cardinality text becomes categorical and other text is stored as
+    Arrow-backed strings.
+
+    Parameters:
+    - df (pd.DataFrame): The DataFrame to compact.
+    - category_threshold (float): The maximum ratio of distinct values to
+      non-null rows for a text column to become categorical.
+
+    Returns:
+    - pd.DataFrame: The compacted DataFrame.
+    - pd.DataFrame: A report with, for each column, the old and new dtypes
+      and the memory used before and after (in bytes).
+    """
+    bytes_before = df.memory_usage(deep=True, index=False)
+    compact_df = pd.DataFrame(
+        {col: _compact_series(df[col], category_threshold) for col in df.columns},
+        index=df.index
+    )
+    bytes_after = compact_df.memory_usage(deep=True, index=False)
+
+    report = pd.DataFrame({
+        'old_dtype': df.dtypes.astype(str),
+        'new_dtype': compact_df.dtypes.astype(str),
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+    })
+    report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+    return compact_df, report
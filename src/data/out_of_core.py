@@ -0,0 +1,237 @@
+# src/data/out_of_core.py
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.data.data_handler import fill_nan_values
+from src.data.file_importer import (DEFAULT_CHUNK_SIZE, ImportCancelledError,
+                                    iter_file_chunks, validate_dataframe)
+from src.data.streaming_stats import KLLSketch, k_for_rank_error
+
+# Default normalized rank error of the streamed medians.
+DEFAULT_RANK_ERROR = 0.001
+
+# Arrow type written for each kind of column.
+ARROW_TYPES = {
+    'integer': pa.int64(),
+    'float': pa.float64(),
+    'bool': pa.bool_(),
+    'text': pa.string(),
+}
+
+
+def _column_kind(dtype):
+    """Returns the kind ('integer', 'float', 'bool' or 'text') of a chunk column."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return 'bool'
+    if pd.api.types.is_integer_dtype(dtype):
+        return 'integer'
+    if pd.api.types.is_numeric_dtype(dtype):
+        return 'float'
+    return 'text'
+
+
+def _merge_kinds(first, second):
+    """Returns the kind able to hold the values of two chunks of a column."""
+    if first == second:
+        return first
+    if {first, second} <= {'integer', 'float'}:
+        return 'float'
+    return 'text'
+
+
+def _check_cancelled(cancel_event):
+    if cancel_event is not None and cancel_event.is_set():
+        raise ImportCancelledError("The operation was cancelled by the user.")
+
+
+def compute_column_statistics(file_path, options=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                              rank_error=DEFAULT_RANK_ERROR, seed=None,
+                              progress_callback=None, cancel_event=None):
+    """
+    Computes the statistics of every column of a file in a single streaming
+    pass, without loading the file in memory: means are exact (running sums)
+    and medians are approximated with a KLL quantile sketch.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - options (dict): The reader options (see import_file).
+    - chunk_size (int): The number of rows per chunk.
+    - rank_error (float): The tolerated normalized rank error of the medians
+      (0.001 means that each median lies between the 49.9th and the 50.1st
+      percentiles).
+    - seed (int): The seed of the sketches.
+    - progress_callback (callable): Called with the progress percentage.
+    - cancel_event (threading.Event): When set, ImportCancelledError is raised.
+
+    Returns:
+    - pd.DataFrame: For each column, its kind ('integer', 'float', 'bool' or
+      'text', unified over all chunks), the number of rows ('rows') and of
+      missing values ('nan_count'), and for numeric columns the 'mean' and
+      approximate 'median'.
+    """
+    k = k_for_rank_error(rank_error)
+    kinds, nan_counts, sums, counts, sketches = {}, {}, {}, {}, {}
+    total_rows = 0
+
+    for chunk, progress in iter_file_chunks(file_path, options, chunk_size):
+        _check_cancelled(cancel_event)
+        if not kinds:
+            validate_dataframe(chunk)
+        total_rows += len(chunk)
+        for col, dtype in chunk.dtypes.items():
+            kind = _column_kind(dtype)
+            kinds[col] = _merge_kinds(kinds.get(col, kind), kind)
+        chunk_nans = chunk.isnull().sum()
+        for col, count in chunk_nans.items():
+            nan_counts[col] = nan_counts.get(col, 0) + int(count)
+
+        numeric = chunk.select_dtypes(include='number').select_dtypes(exclude='bool')
+        if len(numeric.columns):
+            values = numeric.to_numpy(dtype='float64', na_value=np.nan)
+            chunk_sums = np.nansum(values, axis=0)
+            chunk_counts = np.count_nonzero(~np.isnan(values), axis=0)
+            for position, col in enumerate(numeric.columns):
+                sums[col] = sums.get(col, 0.0) + chunk_sums[position]
+                counts[col] = counts.get(col, 0) + int(chunk_counts[position])
+                if col not in sketches:
+                    sketches[col] = KLLSketch(k, seed)
+                sketches[col].update(values[:, position])
+
+        if progress_callback is not None:
+            progress_callback(progress)
+
+    if not kinds or total_rows == 0:
+        raise ValueError("The file does not contain any data.")
+
+    stats = pd.DataFrame({
+        'kind': pd.Series(kinds),
+        'rows': total_rows,
+        'nan_count': pd.Series(nan_counts, dtype='int64'),
+    })
+    stats['mean'] = np.nan
+    stats['median'] = np.nan
+    for col, sketch in sketches.items():
+        if kinds[col] in ('integer', 'float') and counts[col]:
+            stats.loc[col, 'mean'] = sums[col] / counts[col]
+            stats.loc[col, 'median'] = sketch.median()
+    return stats
+
+
+def _to_arrow(chunk, schema):
+    """Converts a chunk to an Arrow table with the unified schema of the file."""
+    arrays = []
+    for field in schema:
+        series = chunk[field.name] if field.name in chunk else pd.Series(
+            [None] * len(chunk), dtype=object
+        )
+        if pa.types.is_string(field.type) and not pd.api.types.is_string_dtype(series.dtype):
+            series = series.astype('string')
+        arrays.append(pa.array(series, type=field.type, from_pandas=True))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def _output_format(output_path):
+    """Returns 'parquet' or 'feather' depending on the extension of the output file."""
+    extension = output_path.lower().rsplit('.', 1)[-1]
+    if extension == 'parquet':
+        return 'parquet'
+    if extension in ['feather', 'arrow']:
+        return 'feather'
+    raise ValueError("The output file must be a .parquet, .feather or .arrow file.")
+
+
+def clean_large_file(file_path, output_path, option, constant_value=None,
+                     options=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                     rank_error=DEFAULT_RANK_ERROR, seed=None,
+                     progress_callback=None, cancel_event=None):
+    """
+    Handles the NaN values of a file larger than memory in two streaming
+    passes: the first one computes the column statistics (see
+    compute_column_statistics) and the second one drops or fills the NaN
+    values chunk by chunk and writes the result to a columnar file.
+
+    Parameters:
+    - file_path (str): The path of the file to clean.
+    - output_path (str): The path of the .parquet, .feather or .arrow file
+      written.
+    - option (str): The option of handle_nan_values ("1" to remove the rows
+      with NaN values, "2" to fill with the mean, "3" with the median, "4"
+      with constant_value).
+    - constant_value (float): The value used by option "4".
+    - options (dict): The reader options (see import_file).
+    - chunk_size (int): The number of rows per chunk.
+    - rank_error (float): The tolerated normalized rank error of the medians.
+    - seed (int): The seed of the median sketches.
+    - progress_callback (callable): Called with the overall progress percentage.
+    - cancel_event (threading.Event): When set, ImportCancelledError is raised.
+
+    Returns:
+    - dict: A summary with the number of rows read ('rows_read') and
+      written ('rows_written'), the number of cells filled in each column
+      ('filled', a pd.Series) and the values used ('fill_values', a pd.Series).
+    """
+    if option not in ("1", "2", "3", "4"):
+        raise ValueError(f"Unknown option: {option}")
+    if option == "4" and constant_value is None:
+        raise ValueError("A constant value is required to fill NaN values with a constant.")
+    output_format = _output_format(output_path)
+
+    def report(offset):
+        if progress_callback is not None:
+            return lambda progress: progress_callback(offset + progress / 2)
+        return None
+
+    stats = compute_column_statistics(
+        file_path, options, chunk_size, rank_error, seed, report(0), cancel_event
+    )
+    numeric_columns = stats.index[stats['kind'].isin(['integer', 'float'])]
+    if option == "2":
+        fill_values = stats.loc[numeric_columns, 'mean']
+    elif option == "3":
+        fill_values = stats.loc[numeric_columns, 'median']
+    elif option == "4":
+        fill_values = pd.Series(float(constant_value), index=numeric_columns)
+    else:
+        fill_values = pd.Series(dtype='float64')
+    fill_values = fill_values.dropna()
+
+    kinds = stats['kind'].copy()
+    # Integer columns containing NaN are read as floats; a fractional fill
+    # value keeps them floats.
+    for col in numeric_columns:
+        if kinds[col] == 'integer' and stats.loc[col, 'nan_count']:
+            kinds[col] = 'float'
+    schema = pa.schema([(col, ARROW_TYPES[kind]) for col, kind in kinds.items()])
+
+    rows_written = 0
+    filled = pd.Series(0, index=fill_values.index, dtype='int64')
+    if output_format == 'parquet':
+        writer = pq.ParquetWriter(output_path, schema)
+    else:
+        # Feather files are Arrow IPC files.
+        writer = pa.ipc.new_file(output_path, schema)
+    try:
+        for chunk, progress in iter_file_chunks(file_path, options, chunk_size):
+            _check_cancelled(cancel_event)
+            if option == "1":
+                chunk = chunk.dropna()
+            elif len(fill_values):
+                chunk, chunk_filled = fill_nan_values(
+                    chunk, None, inplace=True, statistics=fill_values
+                )
+                filled = filled.add(chunk_filled, fill_value=0).astype('int64')
+            writer.write_table(_to_arrow(chunk, schema))
+            rows_written += len(chunk)
+            if progress_callback is not None:
+                progress_callback(50 + progress / 2)
+    finally:
+        writer.close()
+
+    return {
+        'rows_read': int(stats['rows'].iloc[0]),
+        'rows_written': rows_written,
+        'filled': filled[filled > 0],
+        'fill_values': fill_values,
+    }
@@ -0,0 +1,284 @@
+# src/data/pipeline.py
+
+import json
+import pandas as pd
+from src.data.data_handler import fill_nan_values
+from src.data.file_importer import import_file
+
+# Version of the serialized pipeline format (2: fill steps keep their fitted values).
+PIPELINE_FORMAT_VERSION = 2
+
+# Operations a pipeline step can perform.
+OPERATIONS = ('dropna', 'fillna', 'select_columns')
+FILL_METHODS = ('mean', 'median', 'constant')
+
+
+class PreprocessingPipeline:
+    """
+    A list of preprocessing steps (removing rows with NaN values, filling
+    NaN values, selecting columns) recorded as plain dictionaries, so that
+    they can be saved with a model and replayed on new data without the GUI.
+
+    A fill step by mean or median keeps the values computed on the data it
+    was recorded on ('values'), and the replay fills new data with them, so
+    the scoring rows are filled exactly like the training rows. Steps saved
+    without values (older pipelines) compute them on the data they are
+    applied to.
+
+    When the pipeline is applied, consecutive steps are fused into passes:
+    each pass selects the columns and removes the rows of all its steps with
+    a single indexing operation, then fills the NaN values of all its steps
+    with a single call to fill_nan_values.
+    """
+
+    def __init__(self, steps=None):
+        self.steps = []
+        for step in steps or []:
+            self.add_step(step)
+
+    def add_step(self, step):
+        """
+        Validates and appends a step.
+
+        Parameters:
+        - step (dict): The step, with an 'op' key and the operation parameters.
+
+        Returns:
+        - PreprocessingPipeline: The pipeline itself, so calls can be chained.
+        """
+        op = step.get('op')
+        if op not in OPERATIONS:
+            raise ValueError(f"Unknown preprocessing operation: {op}")
+        if op == 'fillna':
+            if step.get('method') not in FILL_METHODS:
+                raise ValueError(f"Unknown fill method: {step.get('method')}")
+            if step['method'] == 'constant' and step.get('value') is None:
+                raise ValueError("A constant value is required to fill NaN values with a constant.")
+        if op == 'select_columns' and not step.get('columns'):
+            raise ValueError("At least one column must be selected.")
+        self.steps.append(dict(step))
+        return self
+
+    def drop_nan_rows(self, subset=None):
+        """
+        Records the removal of the rows containing NaN values.
+
+        Parameters:
+        - subset (list): The columns checked for NaN values (all columns if None).
+        """
+        return self.add_step({'op': 'dropna', 'subset': list(subset) if subset else None})
+
+    def fill_nan(self, method, value=None, columns=None, values=None):
+        """
+        Records the filling of the NaN values of numeric columns.
+
+        Parameters:
+        - method (str): "mean", "median" or "constant".
+        - value (float): The value used by the "constant" method.
+        - columns (list): The columns to fill (all numeric columns if None).
+        - values (dict or pd.Series): The mean or median of each column
+          computed on the training data, used when the step is replayed
+          (computed on the replayed data if None).
+        """
+        return self.add_step({
+            'op': 'fillna', 'method': method,
+            'value': float(value) if value is not None else None,
+            'columns': list(columns) if columns else None,
+            'values': {col: float(fill) for col, fill in dict(values).items() if pd.notna(fill)}
+            if values is not None and method != 'constant' else None
+        })
+
+    def select_columns(self, columns):
+        """
+        Records the selection of columns (the other columns are dropped).
+
+        Parameters:
+        - columns (list): The columns to keep, in order.
+        """
+        return self.add_step({'op': 'select_columns', 'columns': list(columns)})
+
+    def _plan(self):
+        """
+        Fuses the steps into passes. A column selection can move to the start
+        of its pass since the fills are column-wise, unless a NaN row removal
+        of the pass checks columns that the selection drops. A row removal
+        after a fill needs a new pass, because the fill statistics depend on
+        the rows kept.
+
+        Returns:
+        - list: The passes, as dicts with 'columns', 'drops' and 'fills' keys.
+        """
+        passes = []
+        current = None
+        for step in self.steps:
+            op = step['op']
+            if current is not None and op == 'select_columns':
+                selection = set(step['columns'])
+                if any(subset is None or not set(subset) <= selection
+                       for subset in current['drops']):
+                    current = None
+            if current is None or (op == 'dropna' and current['fills']):
+                current = {'columns': None, 'drops': [], 'fills': []}
+                passes.append(current)
+            if op == 'select_columns':
+                if current['columns'] is not None and not set(step['columns']) <= set(current['columns']):
+                    missing = [col for col in step['columns'] if col not in current['columns']]
+                    raise ValueError(f"Unknown columns: {', '.join(map(str, missing))}")
+                current['columns'] = step['columns']
+            elif op == 'dropna':
+                current['drops'].append(step['subset'])
+            else:
+                current['fills'].append(step)
+        return passes
+
+    def apply(self, df, inplace=False):
+        """
+        Applies the steps to a DataFrame.
+
+        Parameters:
+        - df (pd.DataFrame): The DataFrame to process.
+        - inplace (bool): If True, fills modify df directly when no rows or
+          columns are removed before them, instead of copying it.
+
+        Returns:
+        - pd.DataFrame: The processed DataFrame.
+        - dict: A report with the number of rows removed ('rows_removed') and
+          the number of cells filled in each column ('filled', a pd.Series).
+        """
+        rows_before = len(df)
+        filled = pd.Series(dtype='int64')
+        owned = inplace
+
+        for current in self._plan():
+            columns = current['columns']
+            if columns is not None:
+                missing = [col for col in columns if col not in df.columns]
+                if missing:
+                    raise ValueError(f"Unknown columns: {', '.join(map(str, missing))}")
+
+            if current['drops']:
+                mask = pd.Series(False, index=df.index)
+                for subset in current['drops']:
+                    if subset is None:
+                        # Columns dropped by the selection of the pass are not checked.
+                        checked = df if columns is None else df[columns]
+                    else:
+                        checked = df[subset]
+                    mask |= checked.isnull().any(axis=1)
+                df = df.loc[~mask, columns] if columns is not None else df.loc[~mask]
+                owned = True
+            elif columns is not None:
+                df = df[columns]
+                owned = True
+
+            if current['fills']:
+                fill_values = self._fill_values(df, current['fills'])
+                df, pass_filled = fill_nan_values(
+                    df, None, inplace=owned, statistics=fill_values
+                )
+                filled = filled.add(pass_filled, fill_value=0).astype('int64')
+                owned = True
+
+        report = {'rows_removed': rows_before - len(df), 'filled': filled}
+        return df, report
+
+    @staticmethod
+    def _fill_values(df, fills):
+        """
+        Returns the values of consecutive fills: the values fitted when the
+        steps were recorded, or for steps without them, the values computed
+        with one reduction per method. Each column is filled by the first
+        step covering it (the later ones find no NaN left in it).
+
+        Returns:
+        - pd.Series: The fill value of each column.
+        """
+        numeric = df.select_dtypes(include='number')
+        with_nans = numeric.columns[numeric.isnull().any()]
+        methods = {}
+        for step in fills:
+            targets = with_nans if step['columns'] is None else [
+                col for col in step['columns'] if col in with_nans
+            ]
+            for col in targets:
+                methods.setdefault(col, step)
+
+        fill_values = pd.Series(index=list(methods), dtype='float64')
+        for method in FILL_METHODS:
+            cols = [col for col, step in methods.items() if step['method'] == method]
+            if method == 'constant':
+                fill_values[cols] = [methods[col]['value'] for col in cols]
+                continue
+            # Fitted values; a column without one was not filled when recorded.
+            fitted = [col for col in cols if methods[col].get('values') is not None]
+            for col in fitted:
+                fill_values[col] = methods[col]['values'].get(col, float('nan'))
+            computed = [col for col in cols if col not in fitted]
+            if not computed:
+                continue
+            if method == 'mean':
+                fill_values[computed] = numeric[computed].mean()
+            else:
+                fill_values[computed] = numeric[computed].median()
+        return fill_values
+
+    def apply_file(self, file_path, options=None, cache=None):
+        """
+        Imports a file and applies the steps to it.
+
+        Parameters:
+        - file_path (str): The path of the file.
+        - options (dict): The reader options (see import_file).
+        - cache (DatasetCache): The cache used by import_file.
+
+        Returns:
+        - pd.DataFrame: The processed DataFrame.
+        - dict: The report of apply.
+        """
+        df = import_file(file_path, cache=cache, options=options)
+        return self.apply(df, inplace=True)
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The serializable description of the pipeline.
+        """
+        return {'version': PIPELINE_FORMAT_VERSION, 'steps': [dict(step) for step in self.steps]}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds a pipeline from the output of to_dict.
+
+        Parameters:
+        - data (dict): The description of the pipeline.
+
+        Returns:
+        - PreprocessingPipeline: The pipeline.
+        """
+        if data.get('version', PIPELINE_FORMAT_VERSION) > PIPELINE_FORMAT_VERSION:
+            raise ValueError("The pipeline was saved by a newer version of PredictEase.")
+        return cls(data.get('steps', []))
+
+    def to_json(self):
+        """
+        Returns:
+        - str: The pipeline as a JSON document.
+        """
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Rebuilds a pipeline from the output of to_json.
+
+        Parameters:
+        - text (str): The JSON document.
+
+        Returns:
+        - PreprocessingPipeline: The pipeline.
+        """
+        return cls.from_dict(json.loads(text))
+
+    def __len__(self):
+        return len(self.steps)
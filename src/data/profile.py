@@ -0,0 +1,186 @@
+# src/data/profile.py
+
+import copy
+import numpy as np
+import pandas as pd
+from src.data.streaming_stats import HyperLogLog, KLLSketch, k_for_rank_error
+
+# Default normalized rank error of the quantile sketches.
+DEFAULT_RANK_ERROR = 0.001
+
+# Quantiles reported in the profile.
+PROFILE_QUANTILES = (0.25, 0.5, 0.75)
+
+# Number of values of a column converted to float64 at once for its sketch.
+SKETCH_BLOCK_SIZE = 65536
+
+
+class DatasetProfile:
+    """
+    Per-column statistics of a dataset: number of values and of missing
+    values, min, max, mean, variance, quantiles and an estimate of the
+    number of distinct values.
+
+    The profile is computed once when the dataset is loaded, with one
+    vectorized reduction per statistic over all the numeric columns at
+    once, and then updated incrementally: filling NaN values only merges
+    the fill values into the statistics of the filled columns.
+    """
+
+    def __init__(self, stats, rows, sketches, distinct, rank_error=DEFAULT_RANK_ERROR):
+        self.stats = stats
+        self.rows = rows
+        self.sketches = sketches
+        self.distinct = distinct
+        self.rank_error = rank_error
+
+    @classmethod
+    def from_dataframe(cls, df, rank_error=DEFAULT_RANK_ERROR):
+        """
+        Computes the profile of a DataFrame.
+
+        Parameters:
+        - df (pd.DataFrame): The dataset.
+        - rank_error (float): The tolerated normalized rank error of the quantiles.
+
+        Returns:
+        - DatasetProfile: The profile.
+        """
+        nulls = df.isnull().sum()
+        stats = pd.DataFrame({
+            'dtype': df.dtypes.astype(str),
+            'count': len(df) - nulls,
+            'nulls': nulls,
+        }, index=df.columns)
+        for name in ('min', 'max', 'mean', 'var') + tuple(_quantile_name(q) for q in PROFILE_QUANTILES):
+            stats[name] = np.nan
+        stats['distinct'] = 0
+
+        sketches = {}
+        numeric = df.select_dtypes(include='number')
+        if len(numeric.columns) and len(df):
+            # pandas reduces each block in place: no float64 copy of the data.
+            stats.loc[numeric.columns, 'mean'] = numeric.mean().astype('float64')
+            stats.loc[numeric.columns, 'var'] = numeric.var().astype('float64')
+            stats.loc[numeric.columns, 'min'] = numeric.min().astype('float64')
+            stats.loc[numeric.columns, 'max'] = numeric.max().astype('float64')
+
+            k = k_for_rank_error(rank_error)
+            for position, col in enumerate(numeric.columns):
+                sketch = KLLSketch(k, seed=position)
+                column = numeric[col]
+                for start in range(0, len(column), SKETCH_BLOCK_SIZE):
+                    block = column.iloc[start:start + SKETCH_BLOCK_SIZE]
+                    sketch.update(block.to_numpy(dtype='float64', na_value=np.nan))
+                sketches[col] = sketch
+
+        distinct = {}
+        for col in df.columns:
+            distinct[col] = HyperLogLog()
+            distinct[col].update(df[col])
+
+        profile = cls(stats, len(df), sketches, distinct, rank_error)
+        profile._refresh_estimates()
+        return profile
+
+    def _refresh_estimates(self, columns=None):
+        """Recomputes the quantiles and distinct counts from the sketches."""
+        columns = self.stats.index if columns is None else columns
+        for col in columns:
+            sketch = self.sketches.get(col)
+            if sketch is not None and sketch.count:
+                self.stats.loc[col, [_quantile_name(q) for q in PROFILE_QUANTILES]] = \
+                    sketch.quantile(list(PROFILE_QUANTILES))
+            self.stats.loc[col, 'distinct'] = self.distinct[col].count()
+
+    def nan_counts(self):
+        """
+        Returns:
+        - pd.Series: The number of missing values of each column.
+        """
+        return self.stats['nulls']
+
+    def is_empty(self):
+        """
+        Returns:
+        - bool: True if the dataset has no rows or only missing values.
+        """
+        return self.rows == 0 or bool((self.stats['count'] == 0).all())
+
+    def fill_statistics(self, method, constant_value=None, df=None):
+        """
+        Returns the values used to fill the NaN values of the numeric columns
+        (see fill_nan_values). The values are exact, so they match the ones
+        replayed by the preprocessing pipeline; the approximate quantiles of
+        the sketches are only displayed.
+
+        Parameters:
+        - method (str): "mean", "median" or "constant".
+        - constant_value (float): The value used by the "constant" method.
+        - df (pd.DataFrame): The dataset, needed by the "median" method.
+
+        Returns:
+        - pd.Series: The fill value of each numeric column (also recorded
+          in the preprocessing pipeline, to fill new data the same way).
+        """
+        columns = list(self.sketches)
+        if method == "mean":
+            return self.stats.loc[columns, 'mean'].astype('float64')
+        if method == "median":
+            if df is None:
+                raise ValueError("The dataset is required to compute the medians.")
+            return df[columns].median().astype('float64')
+        if method == "constant":
+            return pd.Series(float(constant_value), index=columns)
+        raise ValueError(f"Unknown fill method: {method}")
+
+    def after_fill(self, df, fill_values):
+        """
+        Returns the profile of the dataset once its NaN values have been
+        filled with fill_values, without scanning it again.
+
+        Parameters:
+        - df (pd.DataFrame): The filled dataset (only its dtypes are read).
+        - fill_values (pd.Series): The value used for each numeric column
+          (NaN for the columns left untouched).
+
+        Returns:
+        - DatasetProfile: The updated profile (this one is left unchanged).
+        """
+        fill_values = fill_values.dropna()
+        filled_counts = self.stats.loc[fill_values.index, 'nulls']
+        profile = DatasetProfile(self.stats.copy(), self.rows, copy.deepcopy(self.sketches),
+                                 copy.deepcopy(self.distinct), self.rank_error)
+        stats = profile.stats
+        stats['dtype'] = df.dtypes.astype(str).reindex(stats.index)
+        for col, filled in filled_counts.items():
+            if not filled:
+                continue
+            value = float(fill_values[col])
+            count, mean, var = stats.loc[col, ['count', 'mean', 'var']]
+            total = count + filled
+            # Chan et al. combination with a group of identical values.
+            delta = value - mean if count else 0.0
+            squares = (var * (count - 1) if count > 1 else 0.0) + delta ** 2 * count * filled / total
+            stats.loc[col, 'mean'] = mean + delta * filled / total if count else value
+            stats.loc[col, 'var'] = squares / (total - 1) if total > 1 else np.nan
+            stats.loc[col, 'min'] = np.fmin(stats.loc[col, 'min'], value)
+            stats.loc[col, 'max'] = np.fmax(stats.loc[col, 'max'], value)
+            stats.loc[col, 'count'] = total
+            stats.loc[col, 'nulls'] -= filled
+            profile.sketches[col].update(np.full(int(filled), value))
+            profile.distinct[col].update([value])
+        profile._refresh_estimates(filled_counts.index[filled_counts > 0])
+        return profile
+
+    def to_frame(self):
+        """
+        Returns:
+        - pd.DataFrame: The statistics, one row per column, for display.
+        """
+        return self.stats.rename_axis('column').reset_index()
+
+
+def _quantile_name(q):
+    """Returns the name of the statistic of a quantile (e.g. 'p50')."""
+    return f"p{int(round(q * 100))}"
@@ -0,0 +1,132 @@
+# src/data/schema_sniffer.py
+
+import csv
+import io
+import os
+import random
+import pandas as pd
+from src.data.compression import detect_compression, open_decompressed
+
+# Size of the blocks read at the start, end and random offsets of the file.
+HEAD_BLOCK_SIZE = 256 * 1024
+SAMPLE_BLOCK_SIZE = 64 * 1024
+DEFAULT_RANDOM_BLOCKS = 8
+
+
+def _read_block_lines(handle, offset, block_size, file_size):
+    """
+    Reads the complete lines of a block of the file.
+
+    Parameters:
+    - handle (file): The file opened in binary mode.
+    - offset (int): The byte offset of the block.
+    - block_size (int): The number of bytes to read.
+    - file_size (int): The size of the file in bytes, or None if unknown
+      (decompressed streams).
+
+    Returns:
+    - list: The decoded lines (partial first and last lines are dropped).
+    """
+    if offset > 0:
+        handle.seek(offset)
+    # Decompressing streams may return fewer bytes than requested.
+    data = b''
+    while len(data) < block_size:
+        part = handle.read(block_size - len(data))
+        if not part:
+            break
+        data += part
+    lines = data.split(b'\n')
+    if offset > 0:
+        # The block starts in the middle of a line.
+        lines = lines[1:]
+    if file_size is None:
+        at_end = len(data) < block_size
+    else:
+        at_end = offset + len(data) >= file_size
+    if not at_end:
+        # The block ends in the middle of a line.
+        lines = lines[:-1]
+    return [line.decode('utf-8').rstrip('\r') for line in lines]
+
+
+def _check_field_counts(lines, expected_fields, location):
+    """
+    Raises a ParserError if a line has more fields than the header
+    (pandas accepts shorter lines and fills them with NaN).
+    """
+    for line_number, fields in enumerate(csv.reader(lines), start=1):
+        if len(fields) > expected_fields:
+            raise pd.errors.ParserError(
+                f"Expected {expected_fields} fields {location(line_number)}, "
+                f"saw {len(fields)}."
+            )
+
+
+def sniff_csv_schema(file_path, random_blocks=DEFAULT_RANDOM_BLOCKS, seed=0):
+    """
+    Validates a CSV file from its header and a stratified sample of rows
+    (head, tail and random byte offsets) and infers its schema, so that a
+    malformed file is rejected without parsing it entirely.
+
+    Parameters:
+    - file_path (str): The path of the CSV file.
+    - random_blocks (int): The number of blocks sampled at random offsets.
+    - seed (int): The seed used to pick the random offsets.
+
+    Returns:
+    - dict: The dtypes that can be forced on the full parse, as accepted by
+      pd.read_csv. Only text columns are included: a numeric or boolean
+      dtype inferred from the sample could be contradicted by a row outside
+      it (a missing value in an integer column, a word in a number column),
+      whereas any field can be read as text.
+
+    Raises:
+    - pd.errors.EmptyDataError: If the file is empty.
+    - pd.errors.ParserError: If a sampled row does not match the header.
+    """
+    file_size = os.path.getsize(file_path)
+    if file_size == 0:
+        raise pd.errors.EmptyDataError("No columns to parse from file")
+
+    compression = detect_compression(file_path)
+    with open(file_path, 'rb') as raw_handle:
+        # Compressed files are decompressed on the fly and only their head
+        # is sampled, since random offsets cannot be reached without
+        # decompressing everything before them.
+        handle = open_decompressed(raw_handle, compression)
+        head_lines = _read_block_lines(
+            handle, 0, HEAD_BLOCK_SIZE, None if compression else file_size
+        )
+        head_lines = [line for line in head_lines if line.strip()]
+        if not head_lines:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+        header_line = head_lines[0]
+        expected_fields = len(next(csv.reader([header_line])))
+
+        _check_field_counts(
+            head_lines[1:], expected_fields,
+            lambda line_number: f"in line {line_number + 1}"
+        )
+
+        sampled_lines = head_lines[1:]
+        # Quoted fields may contain newlines, so blocks starting at an
+        # arbitrary offset can only be checked when the file has no quotes.
+        if (compression is None and file_size > HEAD_BLOCK_SIZE
+                and '"' not in "".join(head_lines)):
+            rng = random.Random(seed)
+            offsets = [file_size - SAMPLE_BLOCK_SIZE] + [
+                rng.randrange(HEAD_BLOCK_SIZE, file_size) for _ in range(random_blocks)
+            ]
+            for offset in sorted(set(offsets)):
+                lines = [line for line in _read_block_lines(
+                    handle, offset, SAMPLE_BLOCK_SIZE, file_size) if line.strip()]
+                _check_field_counts(
+                    lines, expected_fields,
+                    lambda line_number, offset=offset: f"near byte offset {offset}"
+                )
+                sampled_lines.extend(lines)
+
+    sample = pd.read_csv(io.StringIO("\n".join([header_line] + sampled_lines)))
+    return {col: str for col, dtype in sample.dtypes.items()
+            if pd.api.types.is_string_dtype(dtype)}
@@ -0,0 +1,195 @@
+# src/data/streaming_stats.py
+
+import math
+import numpy as np
+import pandas as pd
+
+# Ratio between the capacities of two consecutive KLL compactor levels.
+CAPACITY_RATIO = 2.0 / 3.0
+
+# Empirical normalized rank error of a KLL sketch is about this value divided by k.
+RANK_ERROR_CONSTANT = 2.7
+
+
+def k_for_rank_error(rank_error):
+    """
+    Returns the KLL parameter k giving the requested rank error.
+
+    Parameters:
+    - rank_error (float): The tolerated normalized rank error (e.g. 0.01
+      means that the median returned lies between the 49th and the 51st
+      percentiles).
+
+    Returns:
+    - int: The value of k.
+    """
+    if not 0 < rank_error < 1:
+        raise ValueError("The rank error must be between 0 and 1.")
+    return max(8, int(math.ceil(RANK_ERROR_CONSTANT / rank_error)))
+
+
+class KLLSketch:
+    """
+    A mergeable quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in a hierarchy of compactors: an item at level h stands
+    for 2**h input values. When a level is over capacity it is sorted and
+    every other item (from a random start) is promoted to the next level,
+    so memory stays in O(k log(n / k)) whatever the number of values.
+    Updates and compactions work on whole NumPy arrays.
+    """
+
+    def __init__(self, k=200, seed=None):
+        self.k = k
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        """
+        Adds values to the sketch (NaN values are ignored).
+
+        Parameters:
+        - values (array-like): The values to add.
+        """
+        values = np.asarray(values, dtype='float64').ravel()
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        """
+        Merges another sketch (e.g. computed by a parallel worker) into this one.
+
+        Parameters:
+        - other (KLLSketch): The sketch to merge.
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for height, items in enumerate(other.levels):
+            self.levels[height] = np.concatenate([self.levels[height], items])
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q):
+        """
+        Returns an approximate quantile of the values added so far.
+
+        Parameters:
+        - q (float or array-like): The quantile(s), between 0 and 1.
+
+        Returns:
+        - float or np.ndarray: The quantile value(s), NaN if the sketch is empty.
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(len(level), 2.0 ** height) for height, level in enumerate(self.levels)
+        ])
+        order = np.argsort(items, kind='mergesort')
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(q) * cumulative[-1], side='left')
+        result = items[np.minimum(positions, len(items) - 1)]
+        return result if np.ndim(q) else float(result)
+
+    def median(self):
+        """
+        Returns:
+        - float: The approximate median.
+        """
+        return self.quantile(0.5)
+
+    def size(self):
+        """
+        Returns:
+        - int: The number of items retained by the sketch.
+        """
+        return sum(len(level) for level in self.levels)
+
+    def _capacity(self, height):
+        """Returns the capacity of a level (the top level holds k items)."""
+        depth = len(self.levels) - height - 1
+        return max(2, int(math.ceil(self.k * CAPACITY_RATIO ** depth)))
+
+    def _compress(self):
+        """Compacts the lowest level over capacity until every level fits."""
+        while True:
+            over = [height for height, level in enumerate(self.levels)
+                    if len(level) > self._capacity(height)]
+            if not over:
+                return
+            height = over[0]
+            if height + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            level = np.sort(self.levels[height])
+            # An odd item out stays at its level.
+            keep = level[-1:] if len(level) % 2 else level[:0]
+            pairs = level[:len(level) - len(keep)]
+            promoted = pairs[self.rng.integers(2)::2]
+            self.levels[height] = keep
+            self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+
+
+class HyperLogLog:
+    """
+    A mergeable estimator of the number of distinct values (Flajolet et al.,
+    2007). Values are hashed to 64 bits: the first `precision` bits select a
+    register, which keeps the longest run of leading zeros seen in the other
+    bits. The relative error is about 1.04 / sqrt(2**precision).
+    """
+
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 16:
+            raise ValueError("The precision must be between 4 and 16.")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype='uint8')
+
+    def update(self, values):
+        """
+        Adds values to the estimator (NaN and None values are ignored).
+
+        Parameters:
+        - values (array-like): The values to add.
+        """
+        values = pd.Series(values) if not isinstance(values, pd.Series) else values
+        values = values.dropna()
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        bits = 64 - self.precision
+        registers = (hashes >> np.uint64(bits)).astype('int64')
+        remainder = hashes & np.uint64((1 << bits) - 1)
+        # Position of the leftmost 1 bit in the remaining bits (exact since
+        # they fit in the 53-bit mantissa of a float64).
+        _, exponents = np.frexp(remainder.astype('float64'))
+        ranks = np.where(remainder == 0, bits + 1, bits - exponents + 1).astype('uint8')
+        np.maximum.at(self.registers, registers, ranks)
+
+    def merge(self, other):
+        """
+        Merges another estimator with the same precision into this one.
+
+        Parameters:
+        - other (HyperLogLog): The estimator to merge.
+        """
+        if other.precision != self.precision:
+            raise ValueError("Only estimators with the same precision can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """
+        Returns:
+        - int: The estimated number of distinct values.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype('float64')))
+        empty = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and empty:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * np.log(m / empty)
+        return int(round(estimate))
@@ -0,0 +1,243 @@
+# src/data/version_store.py
+
+import numpy as np
+import pandas as pd
+
+# Default memory budget of the stored versions (1 GB).
+DEFAULT_SNAPSHOT_BUDGET = 1024 ** 3
+
+
+# With copy-on-write (always on with pandas 3), a DataFrame modified after
+# being committed copies the shared buffers first, so the versions can keep
+# references to the column buffers instead of copies of them.
+COPY_ON_WRITE = int(pd.__version__.split('.')[0]) >= 3 or pd.get_option('mode.copy_on_write') is True
+
+
+def _same_buffer(first, second):
+    """Returns True if two columns are backed by the same buffer (an O(1) check)."""
+    first, second = first.values, second.values
+    if isinstance(first, np.ndarray) and isinstance(second, np.ndarray):
+        return first.shape == second.shape and first.strides == second.strides and \
+            first.__array_interface__['data'][0] == second.__array_interface__['data'][0]
+    return first is second
+
+
+class DatasetVersionStore:
+    """
+    Keeps the successive versions of a dataset for undo and redo.
+
+    Versions share their column buffers, with the dataset itself and with
+    each other: under copy-on-write a version only references the columns
+    of the committed DataFrame, and pandas copies a column when it is
+    modified afterwards. The change being committed names the columns it
+    modified, so the other columns are taken from the previous version
+    without being compared. When rows are removed, the kept columns are
+    stored as the previous buffer plus the positions of the remaining rows,
+    so a dropna costs one array of row positions instead of a copy of the
+    data. The oldest versions are evicted when the buffers kept for undo and
+    redo (those not used by the current version) exceed the memory budget.
+
+    The DataFrame passed to commit and the ones returned by undo and redo
+    can be modified freely: without copy-on-write (pandas < 3 with the
+    option disabled) the stored columns are private copies, so every
+    committed column costs a copy and all of them count in the budget.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_SNAPSHOT_BUDGET):
+        self.max_bytes = max_bytes
+        self.versions = []
+        self.position = -1
+
+    def commit(self, df, label, metadata=None, changed_columns=None):
+        """
+        Records a new version of the dataset. The versions that could be
+        redone are discarded.
+
+        Parameters:
+        - df (pd.DataFrame): The new version of the dataset.
+        - label (str): A description of the change (e.g. "Fill with Mean").
+        - metadata: Any object to return with the version (e.g. the
+          preprocessing steps applied so far).
+        - changed_columns (list): The columns whose values the change
+          modified; the other columns hold the values of the previous
+          version, possibly with rows removed. If None, only the columns
+          still backed by the buffers of the previous version are shared.
+
+        Returns:
+        - bool: False if the previous versions exceed the memory budget,
+          in which case the change cannot be undone.
+        """
+        previous = self.versions[self.position] if self.position >= 0 else None
+        del self.versions[self.position + 1:]
+        changed = None if changed_columns is None else set(changed_columns)
+
+        same_rows = previous is not None and df.index.equals(previous['index'])
+        row_positions = None
+        if previous is not None and not same_rows and changed is not None \
+                and previous['index'].is_unique and len(df) < len(previous['index']):
+            row_positions = previous['index'].get_indexer(df.index)
+            if (row_positions < 0).any():
+                row_positions = None
+
+        columns = {}
+        composed = {}
+        for name in df.columns:
+            column = df[name]
+            entry = None
+            if previous is not None and name in previous['columns'] \
+                    and (changed is None or name not in changed):
+                base, positions = previous['columns'][name]
+                if same_rows:
+                    if changed is not None or (positions is None and _same_buffer(base, column)):
+                        entry = (base, positions)
+                elif row_positions is not None:
+                    # Compose the row positions once per distinct array.
+                    key = id(positions)
+                    if key not in composed:
+                        composed[key] = row_positions if positions is None \
+                            else positions[row_positions]
+                    # When most rows were removed, the new column is smaller
+                    # than the positions and lets the old buffer be evicted.
+                    if 2 * len(composed[key]) >= len(base):
+                        entry = (base, composed[key])
+            if entry is None:
+                entry = (column if COPY_ON_WRITE else column.copy(), None)
+            columns[name] = entry
+
+        had_history = previous is not None
+        self.versions.append({
+            'label': label,
+            'index': previous['index'] if same_rows else df.index,
+            'order': list(df.columns),
+            'columns': columns,
+            'metadata': metadata,
+        })
+        self.position = len(self.versions) - 1
+        return self._evict() or not had_history
+
+    def set_budget(self, max_bytes):
+        """
+        Changes the memory budget, evicting versions if needed.
+
+        Parameters:
+        - max_bytes (int): The new budget in bytes.
+
+        Returns:
+        - bool: False if the other versions no longer fit and were removed.
+        """
+        self.max_bytes = max_bytes
+        had_history = len(self.versions) > 1
+        return self._evict() or not had_history
+
+    def _evict(self):
+        """
+        Removes the versions farthest from the current one (the oldest, then
+        the ones that could be redone) until the buffers kept for them fit
+        in the budget.
+
+        Returns:
+        - bool: False if every other version had to be removed.
+        """
+        while self.total_bytes() > self.max_bytes and len(self.versions) > 1:
+            if self.position > 0:
+                self.versions.pop(0)
+                self.position -= 1
+            else:
+                self.versions.pop()
+        return len(self.versions) > 1
+
+    def total_bytes(self):
+        """
+        Returns:
+        - int: The size of the buffers kept only for undo and redo, counting
+          shared buffers once. Under copy-on-write, the buffers of the
+          current version are shared with the dataset and are not counted;
+          otherwise they are private copies and are counted too.
+        """
+        current = set()
+        if COPY_ON_WRITE and self.position >= 0:
+            version = self.versions[self.position]
+            current.add(id(version['index']))
+            for base, positions in version['columns'].values():
+                current.update((id(base), id(positions)))
+        seen = {}
+        for version in self.versions:
+            seen[id(version['index'])] = version['index'].nbytes
+            for base, positions in version['columns'].values():
+                seen[id(base)] = base.nbytes
+                if positions is not None:
+                    seen[id(positions)] = positions.nbytes
+        return sum(size for key, size in seen.items() if key not in current)
+
+    def _materialize(self, version):
+        """Builds a new DataFrame from the buffers of a version."""
+        index = version['index']
+        data = {}
+        for name in version['order']:
+            base, positions = version['columns'][name]
+            column = base if positions is None else base.take(positions)
+            data[name] = column.set_axis(index)
+        # Without copy-on-write, the data is copied so the stored buffers
+        # cannot be modified through it.
+        return pd.DataFrame(data, index=index, columns=version['order'], copy=not COPY_ON_WRITE)
+
+    def can_undo(self):
+        """
+        Returns:
+        - bool: True if there is a previous version.
+        """
+        return self.position > 0
+
+    def can_redo(self):
+        """
+        Returns:
+        - bool: True if a version was undone and can be restored.
+        """
+        return 0 <= self.position < len(self.versions) - 1
+
+    def undo_label(self):
+        """
+        Returns:
+        - str: The label of the change that undo would revert, or None.
+        """
+        return self.versions[self.position]['label'] if self.can_undo() else None
+
+    def redo_label(self):
+        """
+        Returns:
+        - str: The label of the change that redo would apply again, or None.
+        """
+        return self.versions[self.position + 1]['label'] if self.can_redo() else None
+
+    def undo(self):
+        """
+        Steps back to the previous version.
+
+        Returns:
+        - pd.DataFrame: The previous version of the dataset.
+        - The metadata committed with it.
+        """
+        if not self.can_undo():
+            raise ValueError("There is nothing to undo.")
+        self.position -= 1
+        version = self.versions[self.position]
+        return self._materialize(version), version['metadata']
+
+    def redo(self):
+        """
+        Steps forward to the version that was undone.
+
+        Returns:
+        - pd.DataFrame: The next version of the dataset.
+        - The metadata committed with it.
+        """
+        if not self.can_redo():
+            raise ValueError("There is nothing to redo.")
+        self.position += 1
+        version = self.versions[self.position]
+        return self._materialize(version), version['metadata']
+
+    def clear(self):
+        """Forgets every version."""
+        self.versions = []
+        self.position = -1
@@ -3,15 +3,46 @@ import os
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog, ttk
+import numpy as np
 import pandas as pd
 from src.gui.hover_tooltip import HoverTooltip
-from src.data.file_importer import import_file
+from src.gui.components import (ask_sqlite_import_options, ask_excel_import_options,
+                                ask_large_file_cleaning_options, create_treeview)
+from src.data.file_importer import (import_file, import_csv_in_chunks, sample_file,
+                                    list_sqlite_tables, list_excel_sheets,
+                                    ImportCancelledError)
 from src.data.data_handler import handle_nan_values
+from src.data.out_of_core import clean_large_file
+from src.data.pipeline import PreprocessingPipeline
+from src.data.version_store import DatasetVersionStore
+from src.data.profile import DatasetProfile
+from src.data.compression import get_file_extension
+from src.data.dataset_cache import DatasetCache
+from src.data.batch_importer import import_files
+from src.data.memory_optimizer import compact_dtypes
 from src.models.regression import LinearRegressionModel
-from src.models.model_io import save_model_data, load_model_data
-from src.visualization.plotting import plot_regression_line
-from src.visualization.data_display import display_dataframe_in_treeview
-from src.gui.loading_indicator import show_loading_indicator, hide_loading_indicator
+from src.models.streaming_ols import accumulate_file
+from src.models.sweep import regression_sweep, r2_matrix
+from src.models.evaluation import cross_validate, bootstrap_coefficients
+from src.models.batch_predict import predict_file
+from src.models.model_io import save_model_data, load_model_data, migrate_model_file
+from src.models.model_format import is_model_file
+from src.models.runtime import export_model_data
+from src.models.registry import ModelRegistry
+from src.visualization.plotting import (plot_regression_line, plot_r2_heatmap,
+                                        downsample_points)
+from src.visualization.data_display import (display_dataframe_in_treeview,
+                                            append_dataframe_to_treeview)
+from src.gui.loading_indicator import (show_loading_indicator, hide_loading_indicator,
+                                       update_loading_indicator)
+
+# Files accepted when a saved model is opened.
+MODEL_FILE_TYPES = [("PredictEase models", "*.pemodel"), ("Joblib files", "*.joblib"),
+                    ("Pickle files", "*.pkl")]
+
+# Rows shown in the table while a CSV file is streamed; inserting every row of
+# a large file would keep the Tk main thread busy for the whole import.
+STREAM_PREVIEW_ROWS = 1000
 
 
 class DataLoaderApp:
@@ -43,6 +74,16 @@ class DataLoaderApp:
         self.selected_output = None   # The chosen output column (for regression)
         self.model_description = ""   # Optional text describing the model
         self.model = None             # Will hold the trained regression model
+        self.data_tree = None         # Treeview currently displaying the dataset
+        self.import_cancel_event = None  # Set to stop a streaming import
+        self.preview_rows = 0         # Rows shown so far by a streaming import
+        self.dataset_cache = DatasetCache()  # Columnar cache of imported files
+        self.model_registry = ModelRegistry()  # Indexed store of saved models
+        self.compact_on_import = tk.BooleanVar(value=False)  # Downcast dtypes on import
+        self.sample_source = None     # (file_path, options) while a sample is displayed
+        self.pipeline = PreprocessingPipeline()  # Preprocessing steps applied to the dataset
+        self.versions = DatasetVersionStore()    # Versions of the dataset for undo/redo
+        self.profile = None           # Per-column statistics of the dataset (DatasetProfile)
 
         # Build the various parts of the GUI
         self.build_toolbar()
@@ -86,7 +127,22 @@ class DataLoaderApp:
         )
         self.file_menu = tk.Menu(self.file_menu_button, tearoff=0, bg="#5e5e5e", fg="white")
         self.file_menu.add_command(label="Load Dataset", command=self.load_file)
+        self.file_menu.add_command(label="Load Dataset (Streaming)",
+                                   command=lambda: self.load_file(streaming=True))
+        self.file_menu.add_command(label="Load Folder", command=self.load_folder)
+        self.file_menu.add_command(label="Quick Look (Sample)",
+                                   command=lambda: self.load_file(quick_look=True))
+        self.file_menu.add_command(label="Load Full Dataset", state='disabled',
+                                   command=self.upgrade_to_full_dataset)
         self.file_menu.add_command(label="Load Model", command=self.load_model)
+        self.file_menu.add_command(label="Update Model with New Data...",
+                                   command=self.update_model_with_new_data)
+        self.file_menu.add_command(label="Model Registry...", command=self.show_model_registry)
+        self.file_menu.add_command(label="Add Model to Registry", command=self.add_model_to_registry)
+        self.file_menu.add_separator()
+        self.file_menu.add_command(label="Dataset Cache...", command=self.show_cache_info)
+        self.file_menu.add_checkbutton(label="Compact Memory on Import",
+                                       variable=self.compact_on_import)
         self.file_menu.add_separator()
         self.file_menu.add_command(label="Exit", command=self.root.quit)
         self.file_menu_button.config(menu=self.file_menu)
@@ -100,10 +156,21 @@ class DataLoaderApp:
             activebackground="#5e5e5e", activeforeground="white"
         )
         self.data_menu = tk.Menu(self.data_menu_button, tearoff=0, bg="#5e5e5e", fg="white")
+        self.data_menu.add_command(label="Undo", accelerator="Ctrl+Z", state='disabled',
+                                   command=self.undo)
+        self.data_menu.add_command(label="Redo", accelerator="Ctrl+Y", state='disabled',
+                                   command=self.redo)
+        self.data_menu.add_separator()
         self.data_menu.add_command(label="Remove rows with NaN", command=lambda: self.handle_nan(option="1"))
         self.data_menu.add_command(label="Fill with Mean", command=lambda: self.handle_nan(option="2"))
         self.data_menu.add_command(label="Fill with Median", command=lambda: self.handle_nan(option="3"))
         self.data_menu.add_command(label="Fill with Constant", command=lambda: self.handle_nan(option="4"))
+        self.data_menu.add_separator()
+        self.data_menu.add_command(label="Column Statistics", command=self.show_column_statistics)
+        self.data_menu.add_command(label="Clean Large File...", command=self.clean_large_file)
+        self.data_menu.add_command(label="Undo History Size...", command=self.set_undo_budget)
+        self.root.bind("<Control-z>", lambda event: self.undo())
+        self.root.bind("<Control-y>", lambda event: self.redo())
         self.data_menu_button.config(menu=self.data_menu)
         self.data_menu_button.pack(side="left", padx=2)
 
@@ -116,6 +183,7 @@ class DataLoaderApp:
         )
         self.prediction_menu = tk.Menu(self.prediction_menu_button, tearoff=0, bg="#5e5e5e", fg="white")
         self.prediction_menu.add_command(label="Make Prediction", command=self.make_prediction_dialog)
+        self.prediction_menu.add_command(label="Batch Predict from File...", command=self.batch_predict)
         self.prediction_menu_button.config(menu=self.prediction_menu)
         self.prediction_menu_button.pack(side="left", padx=2)
 
@@ -184,6 +252,20 @@ class DataLoaderApp:
         )
         create_button.pack(pady=10, padx=10, fill=tk.X)
 
+        # -- Evaluate Model button --
+        evaluate_button = tk.Button(
+            self.controls_frame, text="Evaluate Model", command=self.evaluate_model,
+            font=self.font_style, bg="#FF9800", fg="white", activebackground="#F57C00"
+        )
+        evaluate_button.pack(pady=5, padx=10, fill=tk.X)
+
+        # -- Rank Predictors button --
+        sweep_button = tk.Button(
+            self.controls_frame, text="Rank Predictors", command=self.run_regression_sweep,
+            font=self.font_style, bg="#9C27B0", fg="white", activebackground="#7B1FA2"
+        )
+        sweep_button.pack(pady=5, padx=10, fill=tk.X)
+
         # -- Save Model button --
         save_button = tk.Button(
             self.controls_frame, text="Save Model", command=self.save_model,
@@ -197,7 +279,7 @@ class DataLoaderApp:
         to display metrics like Formula, R², MSE, etc.
         """
         self.results_table = ttk.Treeview(
-            self.controls_frame, columns=("Name", "Value"), show='headings', height=5
+            self.controls_frame, columns=("Name", "Value"), show='headings', height=9
         )
         self.results_table.heading("Name", text="Name")
         self.results_table.heading("Value", text="Value")
@@ -206,7 +288,8 @@ class DataLoaderApp:
         self.results_table.pack(pady=10, padx=10, fill=tk.BOTH)
 
         # Initialize table with placeholders
-        self.results_names = ["Formula", "R²", "MSE", "Description", "Prediction Result"]
+        self.results_names = ["Formula", "R²", "MSE", "CV R²", "CV MSE", "Coef. 95% CI",
+                              "Intercept 95% CI", "Description", "Prediction Result"]
         self.results_items = []
         for name in self.results_names:
             item_id = self.results_table.insert("", "end", values=(name, "-"))
@@ -265,93 +348,501 @@ class DataLoaderApp:
         self.graph_frame = tk.Frame(self.graph_frame_border, bg="white")
         self.graph_frame.pack(fill="both", expand=True, padx=5, pady=5)
 
-    def load_file(self):
+    def load_file(self, streaming=False, quick_look=False):
         """
         Load a data file (CSV, Excel, or SQLite) using a file dialog, then process it.
+        With streaming=True, CSV files are read in chunks and displayed progressively.
+        With quick_look=True, only a uniform random sample of the rows is loaded.
         """
         file_types = [
             ("CSV Files", ".csv"),
+            ("Compressed CSV Files", ".csv.gz .csv.bz2 .csv.xz .csv.zst"),
             ("Excel Files", ".xlsx .xls"),
             ("SQLite Files", ".sqlite *.db")
         ]
         file_path = filedialog.askopenfilename(filetypes=file_types)
         if file_path:
+            # For SQLite files, let the user pick the table and what to read from it
+            options = None
+            if file_path.lower().endswith(('.sqlite', '.db')):
+                options = self.ask_sqlite_options(file_path)
+                if options is None:
+                    return
+            # For Excel files, let the user pick the sheet and the columns
+            elif file_path.lower().endswith(('.xlsx', '.xls')):
+                options = self.ask_excel_options(file_path)
+                if options is None:
+                    return
+
+            n_rows = None
+            if quick_look:
+                n_rows = simpledialog.askinteger(
+                    "Quick Look", "Number of rows to sample:",
+                    initialvalue=10000, minvalue=1
+                )
+                if n_rows is None:
+                    return
+
             # Update the label to show the selected file path
             self.file_path_label.config(text=file_path)
 
-            # Reset controls and clear existing graph
-            self.reset_controls()
-            self.clear_graph()
+            self.restore_dataset_view()
 
-            # If a model was previously loaded, remove that UI and restore main frames
-            if hasattr(self, 'model_details_frame') and self.model_details_frame:
-                self.model_details_frame.destroy()
-            if hasattr(self, 'prediction_frame') and self.prediction_frame:
-                self.prediction_frame.destroy()
+            # Use a separate thread to import/process the file
+            compact = self.compact_on_import.get()
+            if quick_look:
+                threading.Thread(target=self.process_sample_import,
+                                 args=(file_path, n_rows, options, compact)).start()
+            else:
+                threading.Thread(target=self.process_import,
+                                 args=(file_path, streaming, options, compact)).start()
 
-            # Re-pack the frames that might have been hidden
-            self.file_path_label.pack(pady=10)
-            self.table_frame_border.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
-            self.controls_frame_border.pack(side="left", fill="y", padx=10, pady=5)
-            self.graph_frame_border.pack(side="right", fill=tk.BOTH, expand=True, padx=10, pady=5)
+    def restore_dataset_view(self):
+        """
+        Prepares the main window for a new dataset: resets the controls and the graph,
+        and brings back the frames hidden while a loaded model was displayed.
+        """
+        # Reset controls and clear existing graph
+        self.reset_controls()
+        self.clear_graph()
 
-            # Disable the "Prediction" menu again if a new dataset is loaded
-            self.prediction_menu_button.config(state='disabled')
+        # If a model was previously loaded, remove that UI and restore main frames
+        if hasattr(self, 'model_details_frame') and self.model_details_frame:
+            self.model_details_frame.destroy()
+        if hasattr(self, 'prediction_frame') and self.prediction_frame:
+            self.prediction_frame.destroy()
 
-            # Use a separate thread to import/process the file
-            threading.Thread(target=self.process_import, args=(file_path,)).start()
+        # Re-pack the frames that might have been hidden
+        self.file_path_label.pack(pady=10)
+        self.table_frame_border.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.controls_frame_border.pack(side="left", fill="y", padx=10, pady=5)
+        self.graph_frame_border.pack(side="right", fill=tk.BOTH, expand=True, padx=10, pady=5)
 
-    def process_import(self, file_path):
+        # Disable the "Prediction" menu again if a new dataset is loaded
+        self.prediction_menu_button.config(state='disabled')
+
+        # A new dataset replaces any sample being displayed
+        self.sample_source = None
+        self.pipeline = PreprocessingPipeline()
+        self.profile = None
+        self.versions.clear()
+        self.update_undo_menu()
+        self.file_path_label.config(fg="black")
+        self.file_menu.entryconfig("Load Full Dataset", state='disabled')
+
+    def load_folder(self):
+        """
+        Load every data file of a directory in parallel and combine them into one dataset.
+        """
+        directory = filedialog.askdirectory()
+        if not directory:
+            return
+
+        self.file_path_label.config(text=directory)
+        self.restore_dataset_view()
+
+        compact = self.compact_on_import.get()
+        threading.Thread(target=self.process_folder_import, args=(directory, compact)).start()
+
+    def process_folder_import(self, directory, compact=False):
+        """
+        Threaded function that imports all the files of a directory and updates the GUI.
+        Files that cannot be imported are reported without aborting the others.
+        """
+        show_loading_indicator(self.root, "Loading files, please wait...", determinate=True)
+        try:
+            self.df, failures = import_files(
+                directory, source_column="source_file",
+                progress_callback=lambda done, total: self.root.after(
+                    0, lambda: update_loading_indicator(
+                        self.root, done * 100.0 / total, f"{done} of {total} files"))
+            )
+            success_message = "Files loaded successfully."
+            if failures:
+                success_message += "\n\nThe following files could not be imported:\n" + "\n".join(
+                    f"{os.path.basename(path)}: {error}" for path, error in failures.items()
+                )
+            self.finish_import(compact, success_message=success_message)
+
+        except ValueError as e:
+            error_message = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        except Exception as e:
+            error_message = f"An error occurred: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            hide_loading_indicator(self.root)
+
+    def ask_sqlite_options(self, file_path):
+        """
+        Lists the tables of a SQLite file and asks the user which one to import,
+        with optional column selection, filter and row limit.
+        """
+        try:
+            tables = list_sqlite_tables(file_path)
+        except Exception as e:
+            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            return None
+        if not tables:
+            messagebox.showerror("Error", "Invalid or corrupted file.")
+            return None
+        return ask_sqlite_import_options(self.root, tables)
+
+    def ask_excel_options(self, file_path):
+        """
+        Lists the sheets of an Excel file and asks the user which one to import
+        and which columns to read.
+        """
+        try:
+            sheets = list_excel_sheets(file_path)
+        except Exception:
+            messagebox.showerror("Error", "Invalid or corrupted file.")
+            return None
+        return ask_excel_import_options(self.root, sheets)
+
+    def ask_data_source(self):
+        """
+        Asks for a CSV, Excel or SQLite file to stream, and for the sheet or table
+        to read when needed.
+
+        Returns:
+        - tuple: (file_path, options) with the reader options (see import_file),
+          or None if the user cancelled.
+        """
+        file_types = [
+            ("CSV Files", ".csv"),
+            ("Compressed CSV Files", ".csv.gz .csv.bz2 .csv.xz .csv.zst"),
+            ("Excel Files", ".xlsx .xls"),
+            ("SQLite Files", ".sqlite *.db")
+        ]
+        file_path = filedialog.askopenfilename(filetypes=file_types)
+        if not file_path:
+            return None
+
+        options = None
+        if file_path.lower().endswith(('.sqlite', '.db')):
+            options = self.ask_sqlite_options(file_path)
+            if options is None:
+                return None
+        elif file_path.lower().endswith(('.xlsx', '.xls')):
+            options = self.ask_excel_options(file_path)
+            if options is None:
+                return None
+        return file_path, options
+
+    def process_import(self, file_path, streaming=False, options=None, compact=False):
         """
         Threaded function that imports the dataset and updates the GUI accordingly.
         """
-        show_loading_indicator(self.root, "Loading dataset, please wait...")
+        # Only CSV files can be parsed chunk by chunk
+        streaming = streaming and get_file_extension(file_path) == 'csv'
+        is_excel = file_path.lower().endswith(('.xlsx', '.xls'))
+        if streaming:
+            self.import_cancel_event = threading.Event()
+            show_loading_indicator(
+                self.root, "Loading dataset, please wait...",
+                determinate=True, cancel_command=self.import_cancel_event.set
+            )
+        elif is_excel:
+            # Excel sheets are streamed row by row with real progress
+            show_loading_indicator(self.root, "Loading dataset, please wait...", determinate=True)
+        else:
+            show_loading_indicator(self.root, "Loading dataset, please wait...")
         try:
             # Check if the file is empty
             if os.path.getsize(file_path) == 0:
                 raise ValueError("The selected file is empty (size is zero bytes).")
 
             # Import the file (CSV, Excel, or SQLite)
-            self.df = import_file(file_path)
-
-            # Check if the resulting DataFrame is empty
-            if self.df is None or self.df.empty:
-                raise ValueError("The imported file is empty (no rows or columns found).")
-
-            # Check if columns are all empty
-            if not self.df.columns.any() or self.df.dropna(how='all').empty:
-                raise ValueError("The imported file has only empty columns or rows.")
-
-            # Check for missing values
-            if self.df.isnull().values.any():
-                nan_counts = self.df.isnull().sum()
-                nan_columns = nan_counts[nan_counts > 0].index.tolist()
-                total_nans = nan_counts.sum()
-                message = (
-                    f"The dataset contains {total_nans} missing values "
-                    f"in columns: {', '.join(nan_columns)}"
-                )
-                self.root.after(0, lambda: messagebox.showinfo("Missing Values Detected", message))
+            if streaming:
+                # A cached copy makes streaming unnecessary
+                self.df = self.dataset_cache.load(file_path)
+                if self.df is None:
+                    self.df = import_csv_in_chunks(
+                        file_path,
+                        chunk_callback=self.on_import_chunk,
+                        progress_callback=self.on_import_progress,
+                        cancel_event=self.import_cancel_event
+                    )
+                    self.dataset_cache.store(file_path, self.df)
+                else:
+                    streaming = False
+            else:
+                self.df = import_file(file_path, cache=self.dataset_cache, options=options,
+                                      progress_callback=self.on_import_progress)
 
-            # Update the UI in the main thread
-            self.root.after(0, self.display_data)
-            self.root.after(0, self.populate_selectors)
-            self.root.after(0, lambda: messagebox.showinfo("Success", "File loaded successfully."))
+            self.finish_import(compact, display=not streaming)
 
+        except ImportCancelledError:
+            self.df = None
+            self.root.after(0, self.clear_table)
+            self.root.after(0, lambda: messagebox.showinfo("Info", "Import cancelled by user."))
         except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError):
+            self.discard_streamed_preview(streaming)
             error_message = "Invalid or corrupted file."
             self.root.after(0, lambda: messagebox.showerror("Error", error_message))
         except Exception as e:
+            self.discard_streamed_preview(streaming)
             error_message = f"An error occurred: {str(e)}"
             self.root.after(0, lambda: messagebox.showerror("Error", error_message))
         finally:
+            self.import_cancel_event = None
             hide_loading_indicator(self.root)
 
-    def display_data(self):
+    def discard_streamed_preview(self, streaming):
         """
-        Display the current DataFrame 'self.df' in the table_frame using the helper function.
+        Drops the rows shown by a streaming import that failed, so the table
+        does not show a partial dataset that was never loaded.
         """
-        display_dataframe_in_treeview(self.df, self.table_frame)
+        if streaming:
+            self.df = None
+            self.root.after(0, self.clear_table)
+
+    def process_sample_import(self, file_path, n_rows, options=None, compact=False):
+        """
+        Threaded function that loads a uniform random sample of a file in one streaming
+        pass, while counting the rows and missing values of the whole file.
+        """
+        self.import_cancel_event = threading.Event()
+        show_loading_indicator(
+            self.root, "Sampling dataset, please wait...",
+            determinate=True, cancel_command=self.import_cancel_event.set
+        )
+        try:
+            if os.path.getsize(file_path) == 0:
+                raise ValueError("The selected file is empty (size is zero bytes).")
+
+            self.df, stats = sample_file(
+                file_path, n_rows, options,
+                progress_callback=self.on_import_progress,
+                cancel_event=self.import_cancel_event
+            )
+            total_rows = int(stats['rows'].iloc[0])
+            sample_rows = len(self.df)
+            self.sample_source = (file_path, options)
+            self.finish_import(
+                compact,
+                success_message=f"Sample of {sample_rows} rows out of {total_rows} loaded.",
+                nan_counts=stats['nan_count']
+            )
+            self.root.after(0, lambda: self.show_sample_status(file_path, sample_rows, total_rows))
+
+        except ImportCancelledError:
+            self.df = None
+            self.root.after(0, lambda: messagebox.showinfo("Info", "Import cancelled by user."))
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError):
+            error_message = "Invalid or corrupted file."
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        except Exception as e:
+            error_message = f"An error occurred: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            self.import_cancel_event = None
+            hide_loading_indicator(self.root)
+
+    def show_sample_status(self, file_path, sample_rows, total_rows):
+        """
+        Flags the displayed dataset as a sample and offers to load the full dataset.
+        """
+        self.file_path_label.config(
+            text=f"SAMPLE ({sample_rows:,} of {total_rows:,} rows) - {file_path}",
+            fg="#b36b00"
+        )
+        self.file_menu.entryconfig("Load Full Dataset", state='normal')
+
+    def upgrade_to_full_dataset(self):
+        """
+        Replaces the displayed sample with the full dataset, loaded in the background
+        so the sample can still be used in the meantime.
+        """
+        if self.sample_source is None:
+            messagebox.showwarning("Warning", "The displayed dataset is not a sample.")
+            return
+
+        file_path, options = self.sample_source
+        self.file_menu.entryconfig("Load Full Dataset", state='disabled')
+        self.file_path_label.config(text=self.file_path_label.cget("text")
+                                    + " (loading full dataset in the background...)")
+        threading.Thread(target=self._load_full_dataset_thread,
+                         args=(file_path, options), daemon=True).start()
+
+    def _load_full_dataset_thread(self, file_path, options):
+        """
+        Threaded function that imports the full dataset behind a sample.
+        """
+        try:
+            df = import_file(file_path, cache=self.dataset_cache, options=options)
+            # Replay the preprocessing already applied to the sample
+            df, _ = self.pipeline.apply(df, inplace=True)
+            profile = DatasetProfile.from_dataframe(df)
+            self.root.after(0, lambda: self._replace_sample(df, profile, file_path, options))
+        except Exception as e:
+            error_message = f"An error occurred while loading the full dataset: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+            self.root.after(0, lambda: self.file_menu.entryconfig("Load Full Dataset", state='normal'))
+
+    def _replace_sample(self, df, profile, file_path, options):
+        """
+        Swaps the sample for the full dataset, unless another dataset was loaded meanwhile.
+        """
+        if self.sample_source != (file_path, options):
+            return
+        self.df = df
+        self.profile = profile
+        self.sample_source = None
+        self.file_path_label.config(text=file_path, fg="black")
+        self.versions.clear()
+        self.record_version("Load full dataset")
+        self.display_data()
+        self.populate_selectors()
+        messagebox.showinfo("Success", f"Full dataset loaded ({len(df)} rows).")
+
+    def finish_import(self, compact=False, display=True,
+                      success_message="File loaded successfully.", nan_counts=None):
+        """
+        Checks the freshly imported 'self.df', optionally compacts it, reports missing
+        values and updates the GUI. Raises ValueError if the dataset is unusable.
+        The nan_counts of the whole file can be given when 'self.df' is only a sample.
+        """
+        # Check if the resulting DataFrame is empty
+        if self.df is None or self.df.empty:
+            raise ValueError("The imported file is empty (no rows or columns found).")
+
+        # Statistics of every column, computed once and reused afterwards
+        self.profile = DatasetProfile.from_dataframe(self.df)
+
+        # Check if columns are all empty
+        if not self.df.columns.any() or self.profile.is_empty():
+            raise ValueError("The imported file has only empty columns or rows.")
+
+        # Store the columns with the smallest safe dtypes if requested
+        if compact:
+            self.df, report = compact_dtypes(self.df)
+            self.profile.stats['dtype'] = self.df.dtypes.astype(str)
+            self.root.after(0, lambda: self.show_memory_report(report))
+
+        # First version of the undo history
+        self.record_version("Load dataset")
+
+        # Check for missing values
+        if nan_counts is None:
+            nan_counts = self.profile.nan_counts()
+        if nan_counts.any():
+            nan_columns = nan_counts[nan_counts > 0].index.tolist()
+            total_nans = nan_counts.sum()
+            message = (
+                f"The dataset contains {total_nans} missing values "
+                f"in columns: {', '.join(nan_columns)}"
+            )
+            self.root.after(0, lambda: messagebox.showinfo("Missing Values Detected", message))
+
+        # Update the UI in the main thread (a streamed import keeps its preview)
+        if display:
+            self.root.after(0, self.display_data)
+        self.root.after(0, self.populate_selectors)
+        self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+
+    def on_import_chunk(self, chunk, is_first):
+        """
+        Called from the import thread for every chunk of a streaming import.
+        The first chunk replaces the table, the following ones are appended
+        until STREAM_PREVIEW_ROWS rows are shown.
+        """
+        if is_first:
+            self.preview_rows = 0
+        remaining = STREAM_PREVIEW_ROWS - self.preview_rows
+        if remaining <= 0:
+            return
+        rows = chunk.head(remaining)
+        self.preview_rows += len(rows)
+        if is_first:
+            self.root.after(0, lambda: self.display_data(rows))
+        else:
+            self.root.after(0, lambda: append_dataframe_to_treeview(rows, self.data_tree))
+
+    def on_import_progress(self, percent):
+        """
+        Called from the import thread with the percentage of the file read so far.
+        """
+        self.root.after(0, lambda: update_loading_indicator(self.root, percent))
+
+    def show_memory_report(self, report):
+        """
+        Shows how much memory the compact dtypes saved, per column.
+        """
+        before_mb = report['bytes_before'].sum() / 1024 ** 2
+        after_mb = report['bytes_after'].sum() / 1024 ** 2
+        changed = report[report['bytes_saved'] > 0].sort_values('bytes_saved', ascending=False)
+        lines = [
+            f"{col}: {row['old_dtype']} -> {row['new_dtype']}, "
+            f"saved {row['bytes_saved'] / 1024:.1f} KB"
+            for col, row in changed.head(15).iterrows()
+        ]
+        if len(changed) > 15:
+            lines.append(f"... and {len(changed) - 15} more columns")
+        message = (
+            f"Memory usage reduced from {before_mb:.1f} MB to {after_mb:.1f} MB.\n\n"
+            + ("\n".join(lines) if lines else "No column could be made smaller.")
+        )
+        messagebox.showinfo("Memory Report", message)
+
+    def show_column_statistics(self):
+        """
+        Shows the statistics of every column of the dataset (from its profile).
+        """
+        if self.df is None or self.profile is None:
+            messagebox.showwarning("Warning", "No dataset loaded.")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title("Column Statistics")
+        window.geometry("900x400")
+        frame = tk.Frame(window)
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        stats = self.profile.to_frame().round(4).astype(object)
+        display_dataframe_in_treeview(stats.where(stats.notna(), "-"), frame)
+
+    def show_cache_info(self):
+        """
+        Shows the content of the dataset cache and offers to clear it.
+        """
+        entries = self.dataset_cache.entries()
+        if not entries:
+            messagebox.showinfo("Dataset Cache", "The dataset cache is empty.")
+            return
+
+        total_mb = self.dataset_cache.total_size() / 1024 ** 2
+        max_mb = self.dataset_cache.max_bytes / 1024 ** 2
+        lines = [
+            f"{os.path.basename(entry['source_path'])}: "
+            f"{entry['sidecar_size'] / 1024 ** 2:.1f} MB"
+            for entry in entries
+        ]
+        message = (
+            f"{len(entries)} cached datasets ({total_mb:.1f} MB of {max_mb:.0f} MB):\n\n"
+            + "\n".join(lines)
+            + "\n\nDo you want to clear the cache?"
+        )
+        if messagebox.askyesno("Dataset Cache", message):
+            self.dataset_cache.clear()
+            messagebox.showinfo("Dataset Cache", "The dataset cache has been cleared.")
+
+    def display_data(self, df=None):
+        """
+        Display the current DataFrame 'self.df' (or the given one) in the table_frame
+        using the helper function.
+        """
+        self.data_tree = display_dataframe_in_treeview(
+            self.df if df is None else df, self.table_frame
+        )
+
+    def clear_table(self):
+        """
+        Destroys any existing widgets in the table_frame (i.e., clears the data table).
+        """
+        for widget in self.table_frame.winfo_children():
+            widget.destroy()
+        self.data_tree = None
 
     def populate_selectors(self):
         """
@@ -371,20 +862,50 @@ class DataLoaderApp:
             messagebox.showwarning("Warning", "No dataset loaded.")
             return
 
+        constant_value = None
+        if option == "4":  # Fill with a constant
+            constant_value_input = simpledialog.askstring("Input", "Enter a constant value:")
+            if constant_value_input is None:
+                return
+            try:
+                constant_value = float(constant_value_input)
+            except ValueError:
+                messagebox.showerror("Error", "Invalid constant value entered.")
+                return
+
         show_loading_indicator(self.root, "Processing data, please wait...")
-        threading.Thread(target=self._handle_nan_thread, args=(option,)).start()
+        threading.Thread(target=self._handle_nan_thread, args=(option, constant_value)).start()
 
-    def _handle_nan_thread(self, option):
+    def _handle_nan_thread(self, option, constant_value=None):
         """
         Threaded function to handle NaN values (remove rows, fill with mean, median, or constant).
+        The step is recorded in the preprocessing pipeline saved with the model.
         """
         try:
-            self.df, success_message = handle_nan_values(self.df, option)
-            if self.df is not None:
-                self.root.after(0, self.display_data)
-                self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+            # The fill values come from the profile instead of a new scan
+            statistics = None
+            if option != "1":
+                method = {"2": "mean", "3": "median", "4": "constant"}[option]
+                statistics = self.profile.fill_statistics(method, constant_value, self.df)
+            self.df, success_message = handle_nan_values(
+                self.df, option, constant_value, inplace=True, statistics=statistics
+            )
+            if option == "1":
+                # Removing rows changes every statistic, but no value
+                changed_columns = []
+                self.profile = DatasetProfile.from_dataframe(self.df)
+                self.pipeline.drop_nan_rows()
             else:
-                self.root.after(0, lambda: messagebox.showinfo("Info", success_message))
+                nulls = self.profile.stats['nulls'].reindex(statistics.dropna().index)
+                changed_columns = list(nulls.index[nulls > 0])
+                self.profile = self.profile.after_fill(self.df, statistics)
+                self.pipeline.fill_nan(method, constant_value, values=statistics)
+            label = {"1": "Remove rows with NaN", "2": "Fill with Mean",
+                     "3": "Fill with Median", "4": "Fill with Constant"}[option]
+            if not self.record_version(label, changed_columns):
+                success_message += "\n\nThis change cannot be undone: the previous version is larger than the undo history size."
+            self.root.after(0, self.display_data)
+            self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
 
         except Exception as e:
             error_message = f"An error occurred while handling NaN values: {str(e)}"
@@ -392,6 +913,142 @@ class DataLoaderApp:
         finally:
             hide_loading_indicator(self.root)
 
+    def record_version(self, label, changed_columns=None):
+        """
+        Records the current dataset and preprocessing steps in the undo history.
+        Only the columns changed since the previous version (changed_columns,
+        as reported by the change) take extra memory.
+
+        Returns:
+        - bool: False if the dataset does not fit in the undo history.
+        """
+        stored = self.versions.commit(
+            self.df, label, {'pipeline': self.pipeline.to_dict(), 'profile': self.profile},
+            changed_columns
+        )
+        self.root.after(0, self.update_undo_menu)
+        return stored
+
+    def update_undo_menu(self):
+        """
+        Updates the labels and states of the 'Undo' and 'Redo' entries of the Data menu.
+        """
+        undo_label = self.versions.undo_label()
+        redo_label = self.versions.redo_label()
+        self.data_menu.entryconfig(0, label=f"Undo {undo_label}" if undo_label else "Undo",
+                                   state='normal' if undo_label else 'disabled')
+        self.data_menu.entryconfig(1, label=f"Redo {redo_label}" if redo_label else "Redo",
+                                   state='normal' if redo_label else 'disabled')
+
+    def undo(self):
+        """
+        Restores the previous version of the dataset.
+        """
+        if self.versions.can_undo():
+            show_loading_indicator(self.root, "Restoring data, please wait...")
+            threading.Thread(target=self._restore_version_thread, args=(self.versions.undo,)).start()
+
+    def redo(self):
+        """
+        Applies again the last change that was undone.
+        """
+        if self.versions.can_redo():
+            show_loading_indicator(self.root, "Restoring data, please wait...")
+            threading.Thread(target=self._restore_version_thread, args=(self.versions.redo,)).start()
+
+    def _restore_version_thread(self, step):
+        """
+        Threaded function that rebuilds a version of the dataset (step is the
+        undo or redo method of the version store) and displays it.
+        """
+        try:
+            self.df, metadata = step()
+            self.pipeline = PreprocessingPipeline.from_dict(metadata['pipeline'])
+            self.profile = metadata['profile']
+            self.root.after(0, self.display_data)
+            self.root.after(0, self.populate_selectors)
+        except Exception as e:
+            error_message = f"An error occurred while restoring the data: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            self.root.after(0, self.update_undo_menu)
+            hide_loading_indicator(self.root)
+
+    def set_undo_budget(self):
+        """
+        Asks for the memory budget of the undo history (oldest versions are evicted first).
+        """
+        budget = simpledialog.askinteger(
+            "Undo History", "Memory available for the undo history (MB):",
+            initialvalue=self.versions.max_bytes // 1024 ** 2, minvalue=0
+        )
+        if budget is None:
+            return
+        if not self.versions.set_budget(budget * 1024 ** 2):
+            messagebox.showinfo("Info", "The previous versions are larger than the undo history "
+                                        "size: the history has been cleared.")
+        self.update_undo_menu()
+
+    def clean_large_file(self):
+        """
+        Handles the NaN values of a file too large for memory: the file is streamed
+        twice (statistics, then cleaning) and the result is written to a Parquet
+        or Feather file instead of being loaded.
+        """
+        source = self.ask_data_source()
+        if source is None:
+            return
+        file_path, options = source
+
+        cleaning = ask_large_file_cleaning_options(self.root)
+        if cleaning is None:
+            return
+
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".parquet",
+            filetypes=[("Parquet Files", "*.parquet"), ("Feather Files", "*.feather")]
+        )
+        if not output_path:
+            return
+
+        self.import_cancel_event = threading.Event()
+        show_loading_indicator(
+            self.root, "Cleaning file, please wait...",
+            determinate=True, cancel_command=self.import_cancel_event.set
+        )
+        threading.Thread(target=self._clean_large_file_thread,
+                         args=(file_path, output_path, cleaning, options)).start()
+
+    def _clean_large_file_thread(self, file_path, output_path, cleaning, options):
+        """
+        Threaded function that cleans a large file chunk by chunk and reports the result.
+        """
+        try:
+            summary = clean_large_file(
+                file_path, output_path, cleaning['option'], cleaning['constant_value'],
+                options=options, progress_callback=self.on_import_progress,
+                cancel_event=self.import_cancel_event
+            )
+            success_message = (
+                f"The cleaned data has been saved to {output_path}.\n"
+                f"Rows read: {summary['rows_read']}, rows written: {summary['rows_written']}."
+            )
+            if len(summary['filled']):
+                details = ", ".join(f"{col} ({count})" for col, count in summary['filled'].items())
+                success_message += f"\nCells filled: {details}"
+            self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+
+        except ImportCancelledError:
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            self.root.after(0, lambda: messagebox.showinfo("Info", "Cleaning cancelled by user."))
+        except Exception as e:
+            error_message = f"An error occurred while cleaning the file: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            self.import_cancel_event = None
+            hide_loading_indicator(self.root)
+
     def create_regression_model(self):
         """
         Triggered when user clicks 'Create Model'. Creates a linear regression model
@@ -424,23 +1081,29 @@ class DataLoaderApp:
         """
         try:
             # Extract X and y from the DataFrame columns
-            X = self.df[[self.selected_input]].values
-            y = self.df[self.selected_output].values
-
-            # Create and fit the model
-            model = LinearRegressionModel()
-            model.fit(X, y)
-
-            # Generate predictions and compute metrics
-            predictions = model.predict(X)
-            mse = model.mean_squared_error(y, predictions)
-            r2 = model.r2_score(y, predictions)
+            X = self.df[self.selected_input].to_numpy(dtype='float64', na_value=np.nan)
+            y = self.df[self.selected_output].to_numpy(dtype='float64', na_value=np.nan)
+
+            if self.sample_source is not None and not len(self.pipeline):
+                # Only a sample is loaded: fit on the whole file in one streaming
+                # pass, keeping only the regression sums in memory
+                file_path, options = self.sample_source
+                accumulator = accumulate_file(
+                    file_path, self.selected_input, self.selected_output, options
+                )
+                model = LinearRegressionModel.from_statistics(accumulator)
+            else:
+                # Create and fit the model (the metrics are computed while fitting)
+                model = LinearRegressionModel()
+                model.fit(X, y)
+            mse = model.mse_
+            r2 = model.r2_
             formula = model.get_formula(self.selected_input, self.selected_output)
 
-            # Store data for plotting
-            self.X_plot = X
-            self.y_plot = y
-            self.predictions_plot = predictions
+            # Store a downsampled set of points for plotting; predictions are
+            # only computed for these points
+            self.X_plot, self.y_plot = downsample_points(X, y)
+            self.predictions_plot = model.predict(self.X_plot)
             self.model = model
 
             # Update the GUI (main thread)
@@ -452,6 +1115,107 @@ class DataLoaderApp:
         finally:
             hide_loading_indicator(self.root)
 
+    def evaluate_model(self, k=5, n_resamples=1000):
+        """
+        Triggered when user clicks 'Evaluate Model'. Estimates the out-of-sample R² and
+        MSE of the model with k-fold cross-validation and the confidence intervals of
+        its coefficients with bootstrap resampling.
+        """
+        if self.model is None or self.df is None:
+            messagebox.showwarning("Warning", "Create a model on a loaded dataset first.")
+            return
+        if self.selected_input not in self.df.columns or self.selected_output not in self.df.columns:
+            messagebox.showwarning("Warning", "The columns of the model are not in the dataset.")
+            return
+
+        show_loading_indicator(self.root, "Evaluating model, please wait...")
+        threading.Thread(target=self._evaluate_model_thread, args=(k, n_resamples)).start()
+
+    def _evaluate_model_thread(self, k, n_resamples):
+        """
+        Threaded function that runs the cross-validation and the bootstrap and
+        shows the results in the results table.
+        """
+        try:
+            x = self.df[self.selected_input].to_numpy(dtype='float64', na_value=np.nan)
+            y = self.df[self.selected_output].to_numpy(dtype='float64', na_value=np.nan)
+            cv = cross_validate(x, y, k=k)
+            bootstrap = bootstrap_coefficients(x, y, n_resamples=n_resamples)
+            updates = {
+                "CV R²": f"{cv['r2_mean']:.2f} ± {cv['r2_std']:.2f} ({k} folds)",
+                "CV MSE": f"{cv['mse_mean']:.2f} ± {cv['mse_std']:.2f}",
+                "Coef. 95% CI": "[{:.4f}, {:.4f}]".format(*bootstrap['coef_ci']),
+                "Intercept 95% CI": "[{:.4f}, {:.4f}]".format(*bootstrap['intercept_ci']),
+            }
+            self.root.after(0, lambda: self.update_results_table(updates))
+        except ValueError as e:
+            # e.g. too few rows left once the missing values are dropped
+            error_message = f"The model cannot be evaluated on this dataset.\n\n{e}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        except Exception as e:
+            error_message = f"An error occurred while evaluating the model: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            hide_loading_indicator(self.root)
+
+    def run_regression_sweep(self):
+        """
+        Triggered when user clicks 'Rank Predictors'. Fits a simple regression for every
+        pair of numeric columns, or for every column against the selected output column.
+        """
+        if self.df is None:
+            messagebox.showwarning("Warning", "No dataset loaded.")
+            return
+
+        target = self.output_selector.get() or None
+        show_loading_indicator(self.root, "Ranking predictors, please wait...")
+        threading.Thread(target=self._regression_sweep_thread, args=(target,)).start()
+
+    def _regression_sweep_thread(self, target):
+        """
+        Threaded function that runs the regression sweep and shows the ranking.
+        """
+        try:
+            sweep = regression_sweep(self.df, target=target)
+            if sweep.empty:
+                raise ValueError("No pair of numeric columns could be fitted.")
+            self.root.after(0, lambda: self.show_sweep_results(sweep, target))
+        except ValueError as e:
+            error_message = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        except Exception as e:
+            error_message = f"An error occurred while ranking the predictors: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            hide_loading_indicator(self.root)
+
+    def show_sweep_results(self, sweep, target, max_rows=500):
+        """
+        Shows the pairs ranked by R² next to a heatmap of all the R².
+        Double-clicking a pair selects its columns for 'Create Model'.
+        """
+        window = tk.Toplevel(self.root)
+        window.title(f"Best Predictors of {target}" if target else "Best Predictors")
+        window.geometry("1200x600")
+
+        table_frame = tk.Frame(window)
+        table_frame.pack(side="left", fill=tk.BOTH, expand=True, padx=10, pady=10)
+        ranking = sweep.head(max_rows).round({'r2': 4, 'coef': 4, 'intercept': 4, 'mse': 4})
+        tree = display_dataframe_in_treeview(ranking, table_frame)
+
+        graph_frame = tk.Frame(window, bg="white")
+        graph_frame.pack(side="right", fill=tk.BOTH, expand=True, padx=10, pady=10)
+        plot_r2_heatmap(r2_matrix(sweep), graph_frame)
+
+        def on_double_click(event):
+            selection = tree.selection()
+            if selection:
+                input_column, output_column = tree.item(selection[0], "values")[:2]
+                self.input_selector.set(input_column)
+                self.output_selector.set(output_column)
+
+        tree.bind("<Double-1>", on_double_click)
+
     def update_after_model_creation(self, formula, r2, mse):
         """
         Called once the regression model is created. Plots the regression line,
@@ -475,10 +1239,29 @@ class DataLoaderApp:
             "Formula": formula,
             "R²": f"{r2:.2f}",
             "MSE": f"{mse:.2f}",
+            "CV R²": "-",
+            "CV MSE": "-",
+            "Coef. 95% CI": "-",
+            "Intercept 95% CI": "-",
             "Description": self.model_description or "No description provided",
             "Prediction Result": "-"
         })
 
+    def current_model_data(self):
+        """
+        Returns the current model and its info (formula, metrics, etc.) as saved
+        in model files.
+        """
+        return {
+            'input_column': self.selected_input,
+            'output_column': self.selected_output,
+            'model_description': self.model_description or "No description provided",
+            'formula': self.model.get_formula(self.selected_input, self.selected_output),
+            'metrics': {'R²': self.model.r2_, 'MSE': self.model.mse_},
+            'preprocessing': self.pipeline.to_dict(),  # Steps to replay on new data
+            'model': self.model  # The actual model object
+        }
+
     def save_model(self):
         """
         Saves the current regression model and its info (formula, metrics, etc.) to a file.
@@ -488,65 +1271,259 @@ class DataLoaderApp:
             return
 
         file_path = filedialog.asksaveasfilename(
-            defaultextension=".joblib",
-            filetypes=[("Joblib files", "*.joblib"), ("Pickle files", "*.pkl")]
+            defaultextension=".pemodel",
+            filetypes=[("PredictEase models", "*.pemodel"), ("Joblib files", "*.joblib"),
+                       ("Pickle files", "*.pkl"), ("Coefficients for scoring (JSON)", "*.json")]
         )
         if not file_path:
             return  # The user canceled the save dialog
 
         try:
-            # Prepare the model data to save
-            model_data = {
-                'input_column': self.selected_input,
-                'output_column': self.selected_output,
-                'model_description': self.model_description or "No description provided",
-                'formula': self.model.get_formula(self.selected_input, self.selected_output),
-                'metrics': {
-                    'R²': self.model.r2_score(self.y_plot, self.predictions_plot),
-                    'MSE': self.model.mean_squared_error(self.y_plot, self.predictions_plot)
-                },
-                'model': self.model  # The actual model object
-            }
-            # Save it
-            save_model_data(model_data, file_path)
+            model_data = self.current_model_data()
+            # Save it (a JSON file only keeps the coefficients, for the prediction runtime)
+            if file_path.lower().endswith('.json'):
+                export_model_data(model_data, file_path)
+            else:
+                save_model_data(model_data, file_path)
             messagebox.showinfo("Success", f"Model data saved successfully at {file_path}.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred while saving the model: {e}")
 
     def load_model(self):
         """
-        Loads a previously saved model (joblib/pickle), displays the model info,
-        and allows the user to make predictions with it.
+        Loads a previously saved model (compact .pemodel file, or joblib/pickle
+        from older versions), displays the model info, and allows the user to make
+        predictions with it. Old files can be converted to the compact format.
         """
-        file_path = filedialog.askopenfilename(
-            filetypes=[("Joblib files", "*.joblib"), ("Pickle files", "*.pkl")]
-        )
+        file_path = filedialog.askopenfilename(filetypes=MODEL_FILE_TYPES)
         if not file_path:
             return  # User canceled
 
         try:
-            # Load the model data
+            # Load the model data and show it
             model_data = load_model_data(file_path)
+            self.apply_model_data(model_data)
+            messagebox.showinfo("Success", "Model loaded successfully.")
+
+            # Pickled files are slow to load and depend on the sklearn version
+            if not is_model_file(file_path) and messagebox.askyesno(
+                    "Convert Model",
+                    "This model was saved in the old joblib/pickle format. "
+                    "Save a copy in the compact .pemodel format?"):
+                new_path = migrate_model_file(file_path)
+                messagebox.showinfo("Success", f"Model converted and saved at {new_path}.")
+
+        except Exception as e:
+            error_message = f"Error while loading the model: {str(e)}"
+            messagebox.showerror("Error", error_message)
+
+    def apply_model_data(self, model_data):
+        """
+        Makes a loaded model (see load_model_data) the current model and shows its details.
+        """
+        model = model_data.get('model', None)
+        if model is None:
+            raise ValueError("The model object is missing in the loaded file.")
+
+        # Extract info from the loaded dictionary
+        self.selected_input = model_data['input_column']
+        self.selected_output = model_data['output_column']
+        self.model_description = model_data.get('model_description', 'No description provided')
+        formula = model_data['formula']
+        r2 = model_data['metrics']['R²']
+        mse = model_data['metrics']['MSE']
+        self.model = model
+        self.pipeline = PreprocessingPipeline.from_dict(model_data.get('preprocessing', {}))
+        self.versions.clear()
+        self.update_undo_menu()
+
+        # Models saved by older versions do not store their metrics
+        if getattr(self.model, 'r2_', None) is None:
+            self.model.r2_, self.model.mse_ = r2, mse
+
+        # Update the interface to show the model's details
+        self.update_interface_for_model(formula, r2, mse)
+
+    def update_model_with_new_data(self):
+        """
+        Updates a saved model with the rows of a new file, without its original
+        training data: the new rows are folded into the regression statistics
+        stored in the model, optionally after down-weighting the older data.
+        The updated model is saved back to its file and shown.
+        """
+        model_path = filedialog.askopenfilename(
+            title="Select the model to update", filetypes=MODEL_FILE_TYPES
+        )
+        if not model_path:
+            return
 
-            # Extract info from the loaded dictionary
-            self.selected_input = model_data['input_column']
-            self.selected_output = model_data['output_column']
-            self.model_description = model_data.get('model_description', 'No description provided')
-            formula = model_data['formula']
-            r2 = model_data['metrics']['R²']
-            mse = model_data['metrics']['MSE']
-            self.model = model_data.get('model', None)
+        source = self.ask_data_source()
+        if source is None:
+            return
+        file_path, options = source
+
+        decay = simpledialog.askfloat(
+            "Forgetting Factor",
+            "Weight kept by the data already in the model (1 = keep everything,\n"
+            "lower values favour the new rows when the data drifts):",
+            initialvalue=1.0, minvalue=0.0, maxvalue=1.0, parent=self.root
+        )
+        if decay is None:
+            return
+
+        show_loading_indicator(self.root, "Updating model, please wait...", determinate=True)
+        threading.Thread(target=self._update_model_thread,
+                         args=(model_path, file_path, options, decay)).start()
 
-            if self.model is None:
+    def _update_model_thread(self, model_path, file_path, options, decay):
+        """
+        Threaded function that streams the new rows, updates the model and saves it.
+        """
+        try:
+            model_data = load_model_data(model_path)
+            model = model_data.get('model')
+            if model is None:
                 raise ValueError("The model object is missing in the loaded file.")
+            input_column, output_column = model_data['input_column'], model_data['output_column']
+
+            accumulator = accumulate_file(file_path, input_column, output_column, options,
+                                          progress_callback=self.on_import_progress)
+            if accumulator.n == 0:
+                raise ValueError("The file does not contain any valid rows for the model.")
+            model.update_statistics(accumulator, decay)
+
+            model_data['formula'] = model.get_formula(input_column, output_column)
+            model_data['metrics'] = {'R²': model.r2_, 'MSE': model.mse_}
+            save_model_data(model_data, model_path)
+
+            def show_updated_model():
+                self.apply_model_data(model_data)
+                messagebox.showinfo(
+                    "Success",
+                    f"Model updated with {accumulator.n} new rows and saved to {model_path}."
+                )
 
-            # Update the interface to show the model's details
-            self.update_interface_for_model(formula, r2, mse)
-            messagebox.showinfo("Success", "Model loaded successfully.")
+            self.root.after(0, show_updated_model)
+        except ValueError as e:
+            error_message = str(e)
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        except Exception as e:
+            error_message = f"An error occurred while updating the model: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            hide_loading_indicator(self.root)
+
+    def add_model_to_registry(self):
+        """
+        Saves the current model in the model registry under a name chosen by the user.
+        """
+        if self.model is None:
+            messagebox.showwarning("Warning", "No model has been created to save.")
+            return
 
+        name = simpledialog.askstring(
+            "Add Model to Registry", "Model name (leave empty for an automatic name):",
+            parent=self.root
+        )
+        if name is None:
+            return
+        try:
+            name = self.model_registry.register(self.current_model_data(), name.strip() or None)
+            messagebox.showinfo("Success", f"Model added to the registry as '{name}'.")
         except Exception as e:
-            error_message = f"Error while loading the model: {str(e)}"
-            messagebox.showerror("Error", error_message)
+            messagebox.showerror("Error", f"An error occurred while saving the model: {e}")
+
+    def show_model_registry(self):
+        """
+        Lists the models of the registry, filtered by a search text and sorted by
+        their metrics. Only the index is read; a model is loaded when it is opened
+        (from memory if it was opened recently).
+        """
+        window = tk.Toplevel(self.root)
+        window.title("Model Registry")
+        window.geometry("1000x500")
+        sort_options = {
+            "Best R²": ('r2', True),
+            "Lowest MSE": ('mse', False),
+            "Newest": ('created', True),
+            "Name": ('name', False),
+        }
+
+        filters = tk.Frame(window)
+        filters.pack(fill=tk.X, padx=10, pady=5)
+        tk.Label(filters, text="Search:").pack(side="left")
+        search_entry = tk.Entry(filters, width=40)
+        search_entry.pack(side="left", padx=5)
+        tk.Label(filters, text="Sort by:").pack(side="left", padx=(15, 0))
+        sort_selector = ttk.Combobox(filters, values=list(sort_options), state="readonly", width=15)
+        sort_selector.current(0)
+        sort_selector.pack(side="left", padx=5)
+
+        columns = ("name", "input_column", "output_column", "r2", "mse", "created", "description")
+        tree = create_treeview(
+            window, columns,
+            ("Name", "Input", "Output", "R²", "MSE", "Created", "Description"),
+            (200, 110, 110, 70, 90, 140, 240), 15
+        )
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        def refresh(event=None):
+            sort_by, descending = sort_options[sort_selector.get()]
+            try:
+                models = self.model_registry.list_models(
+                    search=search_entry.get().strip() or None,
+                    sort_by=sort_by, descending=descending
+                )
+            except Exception as e:
+                messagebox.showerror("Error", f"An error occurred: {e}", parent=window)
+                return
+            tree.delete(*tree.get_children())
+            for row in models.itertuples(index=False):
+                created = pd.Timestamp(row.created, unit='s').strftime("%Y-%m-%d %H:%M")
+                tree.insert("", "end", iid=row.name, values=(
+                    row.name, row.input_column, row.output_column,
+                    "-" if pd.isna(row.r2) else f"{row.r2:.4f}",
+                    "-" if pd.isna(row.mse) else f"{row.mse:.4f}",
+                    created, row.description or ""
+                ))
+
+        def open_selected(event=None):
+            selection = tree.selection()
+            if not selection:
+                return
+            try:
+                self.apply_model_data(self.model_registry.load(selection[0]))
+            except Exception as e:
+                messagebox.showerror("Error", f"Error while loading the model: {e}", parent=window)
+
+        def import_model_file():
+            file_path = filedialog.askopenfilename(filetypes=MODEL_FILE_TYPES, parent=window)
+            if not file_path:
+                return
+            try:
+                self.model_registry.import_file(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Error while loading the model: {e}", parent=window)
+            refresh()
+
+        def delete_selected():
+            selection = tree.selection()
+            if selection and messagebox.askyesno(
+                    "Delete Model", f"Delete the model '{selection[0]}' from the registry?",
+                    parent=window):
+                self.model_registry.delete(selection[0])
+                refresh()
+
+        buttons = tk.Frame(window)
+        buttons.pack(pady=5)
+        tk.Button(buttons, text="Open", command=open_selected, width=12).pack(side="left", padx=5)
+        tk.Button(buttons, text="Import File...", command=import_model_file, width=12).pack(side="left", padx=5)
+        tk.Button(buttons, text="Delete", command=delete_selected, width=12).pack(side="left", padx=5)
+
+        search_entry.bind("<KeyRelease>", refresh)
+        sort_selector.bind("<<ComboboxSelected>>", refresh)
+        tree.bind("<Double-1>", open_selected)
+        refresh()
 
     def update_interface_for_model(self, formula, r2, mse):
         """
@@ -572,10 +1549,13 @@ class DataLoaderApp:
         if not self.model_description or self.model_description.strip() == "":
             self.model_description = "No description provided"
 
+        # A metric is undefined (None) for a model fitted on a single point
+        r2_text = "undefined" if r2 is None else f"{r2:.2f}"
+        mse_text = "undefined" if mse is None else f"{mse:.2f}"
         model_info = (
             f"Formula: {formula}\n"
-            f"R²: {r2:.2f}\n"
-            f"MSE: {mse:.2f}\n\n"
+            f"R²: {r2_text}\n"
+            f"MSE: {mse_text}\n\n"
             f"Description: {self.model_description}"
         )
         self.model_info_label = tk.Label(
@@ -634,6 +1614,68 @@ class DataLoaderApp:
         except Exception as e:
             messagebox.showerror("Prediction Error", f"An error occurred during prediction: {e}")
 
+    def batch_predict(self):
+        """
+        Predicts every row of a CSV, Excel or SQLite file with the current model and
+        streams the predictions to a CSV or Parquet file, or to a table of a SQLite file.
+        """
+        if self.model is None:
+            messagebox.showwarning("Warning", "No model is available for prediction.")
+            return
+
+        source = self.ask_data_source()
+        if source is None:
+            return
+        file_path, options = source
+
+        output_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV Files", "*.csv"), ("Parquet Files", "*.parquet"),
+                       ("SQLite Files", "*.sqlite *.db")]
+        )
+        if not output_path:
+            return
+
+        self.import_cancel_event = threading.Event()
+        show_loading_indicator(
+            self.root, "Predicting, please wait...",
+            determinate=True, cancel_command=self.import_cancel_event.set
+        )
+        threading.Thread(target=self._batch_predict_thread,
+                         args=(file_path, output_path, options)).start()
+
+    def _batch_predict_thread(self, file_path, output_path, options):
+        """
+        Threaded function that streams the predictions of a file and reports the throughput.
+        """
+        def on_progress(percent, rows, rows_per_second):
+            message = f"{rows:,} rows ({rows_per_second:,.0f} rows/s)"
+            self.root.after(0, lambda: update_loading_indicator(self.root, percent, message))
+
+        try:
+            summary = predict_file(
+                self.model, file_path, output_path, self.selected_input,
+                output_column=f"predicted_{self.selected_output}", options=options,
+                progress_callback=on_progress, cancel_event=self.import_cancel_event,
+                pipeline=self.pipeline
+            )
+            success_message = (
+                f"The predictions have been saved to {output_path}.\n"
+                f"Rows predicted: {summary['rows']:,} in {summary['seconds']:.1f} s "
+                f"({summary['rows_per_second']:,.0f} rows/s)."
+            )
+            self.root.after(0, lambda: messagebox.showinfo("Success", success_message))
+
+        except ImportCancelledError:
+            # predict_file leaves no partial output behind
+            self.root.after(0, lambda: messagebox.showinfo("Info", "Prediction cancelled by user."))
+        except Exception as e:
+            error_message = f"An error occurred during the batch prediction: {str(e)}"
+            self.root.after(0, lambda: messagebox.showerror("Error", error_message))
+        finally:
+            self.import_cancel_event = None
+            hide_loading_indicator(self.root)
+
     def update_results_table(self, updates):
         """
         Update the Treeview results table (Formula, R², MSE, etc.).
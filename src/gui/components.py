@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
 
 
 def create_menu_button(parent, text, menu_items, font_style,
@@ -90,3 +90,177 @@ def create_treeview(parent, columns, headings, column_widths, height):
         treeview.heading(col, text=heading)
         treeview.column(col, anchor="center", width=width)
     return treeview
+
+
+def ask_sqlite_import_options(parent, tables):
+    """
+    Opens a modal dialog to choose the SQLite table to import and the
+    columns, filter and row limit pushed down to the query.
+
+    Parameters:
+    - parent: The parent Tkinter window.
+    - tables (list): (table_name, row_count) tuples from list_sqlite_tables.
+
+    Returns:
+    - dict: The import options (table_name, columns, where, params, limit, sample),
+      or None if the user cancelled the dialog.
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title("Import SQLite Table")
+    dialog.resizable(False, False)
+    dialog.grab_set()
+    result = {}
+
+    tk.Label(dialog, text="Table:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
+    table_labels = [f"{name} ({count} rows)" for name, count in tables]
+    table_selector = ttk.Combobox(dialog, values=table_labels, state="readonly", width=40)
+    table_selector.current(0)
+    table_selector.grid(row=0, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="Columns (comma-separated, empty for all):").grid(
+        row=1, column=0, sticky="w", padx=10, pady=5)
+    columns_entry = tk.Entry(dialog, width=43)
+    columns_entry.grid(row=1, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="WHERE condition, with ? for values (optional):").grid(
+        row=2, column=0, sticky="w", padx=10, pady=5)
+    where_entry = tk.Entry(dialog, width=43)
+    where_entry.grid(row=2, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="Values of the ? (comma-separated):").grid(
+        row=3, column=0, sticky="w", padx=10, pady=5)
+    params_entry = tk.Entry(dialog, width=43)
+    params_entry.grid(row=3, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="Maximum rows (optional):").grid(
+        row=4, column=0, sticky="w", padx=10, pady=5)
+    limit_entry = tk.Entry(dialog, width=43)
+    limit_entry.grid(row=4, column=1, padx=10, pady=5)
+
+    sample_var = tk.BooleanVar(value=False)
+    tk.Checkbutton(dialog, text="Pick the rows at random", variable=sample_var).grid(
+        row=5, column=1, sticky="w", padx=10, pady=5)
+
+    def on_ok():
+        limit_text = limit_entry.get().strip()
+        if limit_text and not limit_text.isdigit():
+            messagebox.showerror("Input Error", "The maximum rows must be a positive integer.",
+                                 parent=dialog)
+            return
+        columns_text = columns_entry.get().strip()
+        params_text = params_entry.get().strip()
+        result.update({
+            'table_name': tables[table_selector.current()][0],
+            'columns': [col.strip() for col in columns_text.split(",") if col.strip()] or None,
+            'where': where_entry.get().strip() or None,
+            'params': [value.strip() for value in params_text.split(",")] if params_text else None,
+            'limit': int(limit_text) if limit_text else None,
+            'sample': sample_var.get() and bool(limit_text)
+        })
+        dialog.destroy()
+
+    buttons = tk.Frame(dialog)
+    buttons.grid(row=6, column=0, columnspan=2, pady=10)
+    tk.Button(buttons, text="Import", command=on_ok, width=10).pack(side="left", padx=5)
+    tk.Button(buttons, text="Cancel", command=dialog.destroy, width=10).pack(side="left", padx=5)
+
+    parent.wait_window(dialog)
+    return result or None
+
+
+def ask_excel_import_options(parent, sheets):
+    """
+    Opens a modal dialog to choose the Excel sheet to import and the columns to read.
+
+    Parameters:
+    - parent: The parent Tkinter window.
+    - sheets (list): The sheet names from list_excel_sheets.
+
+    Returns:
+    - dict: The import options (sheet_name, columns), or None if the user
+      cancelled the dialog.
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title("Import Excel Sheet")
+    dialog.resizable(False, False)
+    dialog.grab_set()
+    result = {}
+
+    tk.Label(dialog, text="Sheet:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
+    sheet_selector = ttk.Combobox(dialog, values=sheets, state="readonly", width=40)
+    sheet_selector.current(0)
+    sheet_selector.grid(row=0, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="Columns (comma-separated, empty for all):").grid(
+        row=1, column=0, sticky="w", padx=10, pady=5)
+    columns_entry = tk.Entry(dialog, width=43)
+    columns_entry.grid(row=1, column=1, padx=10, pady=5)
+
+    def on_ok():
+        columns_text = columns_entry.get().strip()
+        result.update({
+            'sheet_name': sheet_selector.get(),
+            'columns': [col.strip() for col in columns_text.split(",") if col.strip()] or None
+        })
+        dialog.destroy()
+
+    buttons = tk.Frame(dialog)
+    buttons.grid(row=2, column=0, columnspan=2, pady=10)
+    tk.Button(buttons, text="Import", command=on_ok, width=10).pack(side="left", padx=5)
+    tk.Button(buttons, text="Cancel", command=dialog.destroy, width=10).pack(side="left", padx=5)
+
+    parent.wait_window(dialog)
+    return result or None
+
+
+def ask_large_file_cleaning_options(parent):
+    """
+    Opens a modal dialog to choose how the NaN values of a large file are handled.
+
+    Parameters:
+    - parent: The parent Tkinter window.
+
+    Returns:
+    - dict: The cleaning options (option, constant_value), as accepted by
+      clean_large_file, or None if the user cancelled the dialog.
+    """
+    dialog = tk.Toplevel(parent)
+    dialog.title("Clean Large File")
+    dialog.resizable(False, False)
+    dialog.grab_set()
+    result = {}
+    choices = {
+        "Remove rows with NaN": "1",
+        "Fill with Mean": "2",
+        "Fill with Median (approximate)": "3",
+        "Fill with Constant": "4",
+    }
+
+    tk.Label(dialog, text="NaN handling:").grid(row=0, column=0, sticky="w", padx=10, pady=5)
+    method_selector = ttk.Combobox(dialog, values=list(choices), state="readonly", width=40)
+    method_selector.current(0)
+    method_selector.grid(row=0, column=1, padx=10, pady=5)
+
+    tk.Label(dialog, text="Constant value:").grid(row=1, column=0, sticky="w", padx=10, pady=5)
+    constant_entry = tk.Entry(dialog, width=43)
+    constant_entry.grid(row=1, column=1, padx=10, pady=5)
+
+    def on_ok():
+        option = choices[method_selector.get()]
+        constant_value = None
+        if option == "4":
+            try:
+                constant_value = float(constant_entry.get())
+            except ValueError:
+                messagebox.showerror("Error", "Invalid constant value entered.", parent=dialog)
+                return
+        result.update({'option': option, 'constant_value': constant_value})
+        dialog.destroy()
+
+    buttons = tk.Frame(dialog)
+    buttons.grid(row=2, column=0, columnspan=2, pady=10)
+    tk.Button(buttons, text="Clean", command=on_ok, width=10).pack(side="left", padx=5)
+    tk.Button(buttons, text="Cancel", command=dialog.destroy, width=10).pack(side="left", padx=5)
+
+    parent.wait_window(dialog)
+    return result or None
@@ -4,13 +4,18 @@ import tkinter as tk
 from tkinter import ttk
 
 
-def show_loading_indicator(root, message):
+def show_loading_indicator(root, message, determinate=False,
+                           cancel_command=None):
     """
     Displays a loading indicator window with a progress bar.
 
     Parameters:
     - root: The root Tkinter window.
     - message (str): The message to display above the progress bar.
+    - determinate (bool): If True, the progress bar shows a percentage
+      updated through update_loading_indicator instead of spinning.
+    - cancel_command (callable): If given, a "Cancel" button calling it
+      is added below the progress bar.
     """
     loading_window = tk.Toplevel(root)
     loading_window.title("Loading")
@@ -35,15 +40,51 @@ def show_loading_indicator(root, message):
     label.pack(pady=30)
 
     # Create and pack the progress bar
-    progress = ttk.Progressbar(loading_window, mode='indeterminate',
-                               length=400)
-    progress.pack(pady=20)
-    progress.start(10)  # Adjust the speed as needed
+    if determinate:
+        progress = ttk.Progressbar(loading_window, mode='determinate',
+                                   length=400, maximum=100)
+        progress.pack(pady=10)
+        percent_label = tk.Label(loading_window, text="0%",
+                                 font=("Helvetica", 10))
+        percent_label.pack()
+        loading_window.percent_label = percent_label
+    else:
+        progress = ttk.Progressbar(loading_window, mode='indeterminate',
+                                   length=400)
+        progress.pack(pady=20)
+        progress.start(10)  # Adjust the speed as needed
+    loading_window.progress = progress
+
+    # Optional button allowing the user to stop the running task
+    if cancel_command is not None:
+        cancel_button = tk.Button(loading_window, text="Cancel",
+                                  command=cancel_command,
+                                  font=("Helvetica", 10))
+        cancel_button.pack(pady=5)
 
     # Attach the loading window to the root for easy access
     root.loading_window = loading_window
 
 
+def update_loading_indicator(root, percent, message=None):
+    """
+    Updates the progress shown by a determinate loading indicator.
+
+    Parameters:
+    - root: The root Tkinter window.
+    - percent (float): The progress percentage (0-100).
+    - message (str): Optional text to display next to the percentage.
+    """
+    loading_window = getattr(root, 'loading_window', None)
+    if not loading_window or not hasattr(loading_window, 'percent_label'):
+        return
+    loading_window.progress['value'] = percent
+    text = f"{percent:.0f}%"
+    if message:
+        text = f"{text} - {message}"
+    loading_window.percent_label.config(text=text)
+
+
 def hide_loading_indicator(root):
     """
     Closes the loading indicator window.
@@ -0,0 +1,260 @@
+# src/models/batch_predict.py
+
+import os
+import sqlite3
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.data.file_importer import (DEFAULT_CHUNK_SIZE, ImportCancelledError,
+                                    iter_file_chunks, quote_identifier)
+
+
+def _output_format(output_path):
+    """Returns 'csv', 'parquet' or 'sqlite' depending on the extension of the output file."""
+    extension = output_path.lower().rsplit('.', 1)[-1]
+    if extension == 'csv':
+        return 'csv'
+    if extension == 'parquet':
+        return 'parquet'
+    if extension in ['sqlite', 'db']:
+        return 'sqlite'
+    raise ValueError("The output file must be a .csv, .parquet, .sqlite or .db file.")
+
+
+def _staging_path(output_path):
+    """
+    Returns the temporary file, next to the output file, written until the
+    prediction completes. The output file (which may be the input file) is
+    then replaced at once, and left untouched if the prediction fails.
+    """
+    directory, name = os.path.split(os.path.abspath(output_path))
+    return os.path.join(directory, f".{name}.{os.getpid()}.partial")
+
+
+def _finish_staging(staging_path, output_path, completed):
+    """Moves a completed staging file to the output file, or removes it."""
+    if completed and os.path.exists(staging_path):
+        os.replace(staging_path, output_path)
+    elif os.path.exists(staging_path):
+        os.remove(staging_path)
+
+
+class _CsvOutput:
+    """Appends the predictions to a CSV file, writing the header once."""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.staging_path = _staging_path(output_path)
+        self.handle = open(self.staging_path, 'w', newline='', encoding='utf-8')
+        self.header = True
+
+    def write(self, frame):
+        frame.to_csv(self.handle, header=self.header, index=False)
+        self.header = False
+
+    def close(self, completed=True):
+        self.handle.close()
+        _finish_staging(self.staging_path, self.output_path, completed)
+
+
+class _ParquetOutput:
+    """
+    Appends the predictions to a Parquet file. The schema is fixed by the
+    first chunk: numeric columns are written as floats (a later chunk may
+    contain missing values), booleans as booleans and the rest as text.
+    """
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.staging_path = _staging_path(output_path)
+        self.writer = None
+        self.schema = None
+
+    def write(self, frame):
+        if self.writer is None:
+            fields = []
+            for col, dtype in frame.dtypes.items():
+                if pd.api.types.is_bool_dtype(dtype):
+                    fields.append((col, pa.bool_()))
+                elif pd.api.types.is_numeric_dtype(dtype):
+                    fields.append((col, pa.float64()))
+                else:
+                    fields.append((col, pa.string()))
+            self.schema = pa.schema(fields)
+            self.writer = pq.ParquetWriter(self.staging_path, self.schema)
+        arrays = []
+        for field in self.schema:
+            series = frame[field.name]
+            if pa.types.is_string(field.type) and not pd.api.types.is_string_dtype(series.dtype):
+                series = series.astype('string')
+            arrays.append(pa.array(series, type=field.type, from_pandas=True))
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self, completed=True):
+        if self.writer is not None:
+            self.writer.close()
+        _finish_staging(self.staging_path, self.output_path, completed)
+
+
+class _SqliteOutput:
+    """
+    Writes the predictions to a table of a SQLite file, replacing the table
+    if it exists. The rows are staged in a temporary database (the output
+    may be the file being read, whose open read cursor would block the
+    writes) and the table of the output file is replaced in a single
+    transaction once the prediction completes, so a failed or cancelled
+    prediction leaves the output file untouched.
+    """
+
+    def __init__(self, output_path, table_name):
+        self.output_path = output_path
+        self.table_name = table_name
+        handle, self.staging_path = tempfile.mkstemp(
+            suffix='.sqlite', dir=os.path.dirname(os.path.abspath(output_path))
+        )
+        os.close(handle)
+        self.connection = sqlite3.connect(self.staging_path)
+
+    def write(self, frame):
+        frame.to_sql(self.table_name, self.connection, if_exists='append', index=False)
+
+    def close(self, completed=True):
+        try:
+            try:
+                self.connection.commit()
+            finally:
+                self.connection.close()
+            if completed:
+                self._replace_table()
+        finally:
+            os.remove(self.staging_path)
+
+    def _replace_table(self):
+        table = quote_identifier(self.table_name)
+        # Explicit transactions: sqlite3 would commit the DROP TABLE at once.
+        connection = sqlite3.connect(self.output_path, isolation_level=None)
+        try:
+            connection.execute("ATTACH DATABASE ? AS staging", (self.staging_path,))
+            create_sql = connection.execute(
+                "SELECT sql FROM staging.sqlite_master WHERE type = 'table' AND name = ?",
+                (self.table_name,)
+            ).fetchone()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(f"DROP TABLE IF EXISTS main.{table}")
+                if create_sql is not None:
+                    # Same declared column types as the staged table
+                    connection.execute(create_sql[0])
+                    connection.execute(f"INSERT INTO main.{table} SELECT * FROM staging.{table}")
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("DETACH DATABASE staging")
+        finally:
+            connection.close()
+
+
+def predict_file(model, input_path, output_path, input_column,
+                 output_column="prediction", options=None, keep_columns=None,
+                 table_name="predictions", chunk_size=DEFAULT_CHUNK_SIZE,
+                 progress_callback=None, cancel_event=None, pipeline=None):
+    """
+    Predicts the target of every row of a file, one chunk at a time, and
+    streams the predictions to a CSV, Parquet or SQLite file, so files of
+    any size can be scored with constant memory. Each chunk is predicted
+    at once from the coefficients of the model; rows with a missing input
+    get a missing prediction.
+
+    Parameters:
+    - model (LinearRegressionModel or LinearPredictor): The fitted model.
+    - input_path (str): The path of the CSV (possibly compressed), Excel or
+      SQLite file to score.
+    - output_path (str): The path of the .csv, .parquet, .sqlite or .db file
+      written. It may be the input file: the predictions are written to a
+      temporary file (or database) that replaces the output file (or
+      table) once every row is predicted, so a failed or cancelled
+      prediction leaves no partial output and never truncates the input.
+    - input_column (str): The column holding the input of the model.
+    - output_column (str): The name of the column of predictions.
+    - options (dict): The reader options (see import_file).
+    - keep_columns (list): The columns copied next to the predictions (all
+      the columns if None). The input column is always copied.
+    - table_name (str): The table written when the output is a SQLite file.
+    - chunk_size (int): The number of rows per chunk.
+    - progress_callback (callable): Called with the progress percentage,
+      the number of rows predicted so far and the rows per second.
+    - cancel_event (threading.Event): When set, ImportCancelledError is raised.
+    - pipeline (PreprocessingPipeline): The preprocessing saved with the
+      model, replayed on every chunk before it is predicted, so missing
+      inputs are filled with the values fitted on the training data. Rows
+      removed by the pipeline are not written.
+
+    Returns:
+    - dict: A summary with the number of rows predicted ('rows'), the
+      elapsed time ('seconds'), the throughput ('rows_per_second') and the
+      output file ('output_path').
+    """
+    output_format = _output_format(output_path)
+    options = dict(options or {})
+    if pipeline is not None and not len(pipeline):
+        pipeline = None
+    if keep_columns is not None:
+        keep_columns = [col for col in keep_columns if col != input_column]
+        if pipeline is None:
+            # Only parse the columns that are written (the steps may need others).
+            options['columns'] = list(keep_columns) + [input_column]
+
+    coef = float(model.coef_)
+    intercept = float(model.intercept_)
+    if output_format == 'csv':
+        writer = _CsvOutput(output_path)
+    elif output_format == 'parquet':
+        writer = _ParquetOutput(output_path)
+    else:
+        writer = _SqliteOutput(output_path, table_name)
+
+    rows = 0
+    start = time.perf_counter()
+    completed = False
+    try:
+        for chunk, progress in iter_file_chunks(input_path, options, chunk_size):
+            if cancel_event is not None and cancel_event.is_set():
+                raise ImportCancelledError("The prediction was cancelled by the user.")
+            if pipeline is not None:
+                chunk, _ = pipeline.apply(chunk, inplace=True)
+            if input_column not in chunk.columns:
+                raise ValueError(f"Column not found in {input_path}: {input_column}")
+            if output_column in chunk.columns:
+                raise ValueError(f"The file already has a column named {output_column}.")
+            try:
+                x = chunk[input_column].to_numpy(dtype='float64', na_value=np.nan)
+            except (TypeError, ValueError):
+                raise ValueError(f"The input column {input_column} must be numeric.")
+
+            columns = list(chunk.columns) if keep_columns is None \
+                else list(keep_columns) + [input_column]
+            missing = [col for col in columns if col not in chunk.columns]
+            if missing:
+                raise ValueError(f"Column not found in {input_path}: {', '.join(map(str, missing))}")
+            writer.write(chunk[columns].assign(**{output_column: intercept + coef * x}))
+
+            rows += len(chunk)
+            if progress_callback is not None:
+                elapsed = time.perf_counter() - start
+                progress_callback(progress, rows, rows / elapsed if elapsed > 0 else 0.0)
+        completed = True
+    finally:
+        writer.close(completed)
+
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'seconds': seconds,
+        'rows_per_second': rows / seconds if seconds > 0 else 0.0,
+        'output_path': output_path,
+    }
+
@@ -0,0 +1,178 @@
+# src/models/evaluation.py
+
+import numpy as np
+
+# Upper bound on the number of cells of the resampling weight matrices
+# built at once by bootstrap_coefficients (about 32 MB of float64).
+BOOTSTRAP_BATCH_CELLS = 4_000_000
+
+
+def _valid_points(x, y):
+    """Returns x and y as float64 vectors without the points where one of them is NaN."""
+    x = np.asarray(x, dtype='float64').ravel()
+    y = np.asarray(y, dtype='float64').ravel()
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same number of values.")
+    valid = ~(np.isnan(x) | np.isnan(y))
+    return x[valid], y[valid]
+
+
+def _check_point_count(n, total, minimum, purpose):
+    """
+    Raises a ValueError telling how many points are usable when fewer than
+    'minimum' of the 'total' points have both values.
+    """
+    if n >= minimum:
+        return
+    message = f"{purpose} needs at least {minimum} rows with both values, but "
+    if n < total:
+        message += (f"only {n} remain after dropping the {total - n} rows with a missing value "
+                    f"(out of {total}).")
+    else:
+        message += f"the data has only {n}."
+    raise ValueError(message)
+
+
+def _fit_from_sums(n, sx, sy, sxx, sxy):
+    """
+    Fits a simple regression from raw sums (vectorized over any shape).
+    A constant input gets a slope of 0, like sklearn's least squares.
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_x = sxx - sx * sx / n
+        cov = sxy - sx * sy / n
+        coef = np.where(var_x > 1e-12 * sxx, cov / var_x, 0.0)
+        intercept = (sy - coef * sx) / n
+    return coef, intercept
+
+
+def cross_validate(x, y, k=5, seed=0):
+    """
+    Estimates the out-of-sample R² and MSE of a simple linear regression
+    with k-fold cross-validation.
+
+    The points are assigned to random folds, and the sums needed by the
+    regression (Σx, Σy, Σx², Σy², Σxy) are computed for all the folds at
+    once with np.bincount. The model trained without a fold is fitted from
+    the totals minus the sums of the fold, and its test error is derived
+    from the sums of the fold, so no model is refitted on the data.
+
+    Parameters:
+    - x (array-like): The input values.
+    - y (array-like): The target values. Points with a NaN are ignored.
+    - k (int): The number of folds.
+    - seed (int): The seed of the assignment of the points to the folds.
+
+    Returns:
+    - dict: The R² ('r2') and MSE ('mse') of each fold, their means
+      ('r2_mean', 'mse_mean') and standard deviations ('r2_std', 'mse_std'),
+      and the number of folds ('k').
+    """
+    total = np.size(x)
+    x, y = _valid_points(x, y)
+    n = len(x)
+    if k < 2:
+        raise ValueError("At least two folds are needed.")
+    _check_point_count(n, total, 2 * k, f"{k}-fold cross-validation")
+
+    # Centering the data keeps the differences of sums accurate.
+    x = x - x.mean()
+    y = y - y.mean()
+    rng = np.random.default_rng(seed)
+    folds = rng.permutation(n) % k
+
+    fold_n = np.bincount(folds, minlength=k).astype('float64')
+    fold_x = np.bincount(folds, weights=x, minlength=k)
+    fold_y = np.bincount(folds, weights=y, minlength=k)
+    fold_xx = np.bincount(folds, weights=x * x, minlength=k)
+    fold_yy = np.bincount(folds, weights=y * y, minlength=k)
+    fold_xy = np.bincount(folds, weights=x * y, minlength=k)
+
+    coef, intercept = _fit_from_sums(
+        n - fold_n, fold_x.sum() - fold_x, fold_y.sum() - fold_y,
+        fold_xx.sum() - fold_xx, fold_xy.sum() - fold_xy
+    )
+    # Σ(y - a - bx)² over the fold, expanded in terms of its sums.
+    sse = (fold_yy - 2 * intercept * fold_y - 2 * coef * fold_xy + fold_n * intercept ** 2
+           + 2 * intercept * coef * fold_x + coef ** 2 * fold_xx)
+    sse = np.maximum(sse, 0.0)
+    sst = fold_yy - fold_y ** 2 / fold_n
+    mse = sse / fold_n
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r2 = np.where(sst > 0, 1.0 - sse / sst, np.where(sse == 0, 1.0, 0.0))
+
+    return {
+        'k': k,
+        'r2': r2,
+        'mse': mse,
+        'r2_mean': float(r2.mean()),
+        'r2_std': float(r2.std(ddof=1)),
+        'mse_mean': float(mse.mean()),
+        'mse_std': float(mse.std(ddof=1)),
+    }
+
+
+def bootstrap_coefficients(x, y, n_resamples=1000, confidence=0.95, seed=0,
+                           batch_cells=BOOTSTRAP_BATCH_CELLS):
+    """
+    Computes bootstrap confidence intervals of the slope and intercept of a
+    simple linear regression.
+
+    Each resample is represented by the number of times each point is
+    drawn. The resamples are processed in batches: the draws of a batch form
+    an index matrix, turned into a matrix of counts with one np.bincount,
+    and a single matrix product with the columns (1, x, y, x², xy) gives the
+    regression sums of every resample of the batch.
+
+    Parameters:
+    - x (array-like): The input values.
+    - y (array-like): The target values. Points with a NaN are ignored.
+    - n_resamples (int): The number of bootstrap resamples.
+    - confidence (float): The confidence level of the intervals.
+    - seed (int): The seed of the resampling.
+    - batch_cells (int): The maximum size of the count matrix of a batch.
+
+    Returns:
+    - dict: The percentile intervals of the slope ('coef_ci') and of the
+      intercept ('intercept_ci') as (low, high) tuples, their standard
+      errors ('coef_se', 'intercept_se'), the estimates of every resample
+      ('coefs', 'intercepts') and the confidence level ('confidence').
+    """
+    total = np.size(x)
+    x, y = _valid_points(x, y)
+    n = len(x)
+    _check_point_count(n, total, 3, "Bootstrap intervals")
+    if not 0 < confidence < 1:
+        raise ValueError("The confidence level must be between 0 and 1.")
+
+    mean_x, mean_y = x.mean(), y.mean()
+    xc, yc = x - mean_x, y - mean_y
+    columns = np.column_stack([np.ones(n), xc, yc, xc * xc, xc * yc])
+
+    rng = np.random.default_rng(seed)
+    batch_size = max(1, min(n_resamples, batch_cells // n))
+    coefs = np.empty(n_resamples)
+    intercepts = np.empty(n_resamples)
+    for start in range(0, n_resamples, batch_size):
+        size = min(batch_size, n_resamples - start)
+        draws = rng.integers(0, n, size=(size, n))
+        draws += np.arange(size)[:, None] * n
+        counts = np.bincount(draws.ravel(), minlength=size * n).reshape(size, n)
+        sums = counts @ columns
+        coef, intercept = _fit_from_sums(*sums.T)
+        coefs[start:start + size] = coef
+        # Back to the original scale of the data.
+        intercepts[start:start + size] = intercept + mean_y - coef * mean_x
+
+    tail = (1 - confidence) / 2 * 100
+    coef_low, coef_high = np.percentile(coefs, [tail, 100 - tail])
+    intercept_low, intercept_high = np.percentile(intercepts, [tail, 100 - tail])
+    return {
+        'coef_ci': (float(coef_low), float(coef_high)),
+        'intercept_ci': (float(intercept_low), float(intercept_high)),
+        'coef_se': float(coefs.std(ddof=1)),
+        'intercept_se': float(intercepts.std(ddof=1)),
+        'coefs': coefs,
+        'intercepts': intercepts,
+        'confidence': confidence,
+    }
@@ -0,0 +1,150 @@
+# src/models/model_format.py
+
+import json
+import math
+import struct
+
+# First bytes of every compact model file.
+MODEL_MAGIC = b"PEMODEL\x00"
+
+# Version of the layout of the compact model files written by this module.
+MODEL_SCHEMA_VERSION = 1
+
+# Extension of the compact model files.
+MODEL_EXTENSION = ".pemodel"
+
+# Magic bytes, schema version and length of the JSON metadata, little-endian.
+_HEADER = struct.Struct("<8sHI")
+
+# Regression statistics stored in the payload when the model keeps them.
+STATISTICS_FIELDS = ('n', 'mean_x', 'mean_y', 'sxx', 'syy', 'sxy')
+
+# Every numeric value a model file may store; the others are rejected.
+PAYLOAD_FIELDS = ('coef', 'intercept') + STATISTICS_FIELDS
+
+
+def is_model_file(file_path):
+    """
+    Checks whether a file is a compact model file, from its first bytes.
+
+    Parameters:
+    - file_path (str): The path of the file.
+
+    Returns:
+    - bool: True if the file starts with the magic bytes of the format.
+    """
+    with open(file_path, 'rb') as handle:
+        return handle.read(len(MODEL_MAGIC)) == MODEL_MAGIC
+
+
+def write_model_file(file_path, metadata, values):
+    """
+    Writes a compact model file: a fixed header (magic bytes, schema
+    version and metadata length), the metadata as UTF-8 JSON and the
+    numeric values as a float64 array. Nothing is pickled.
+
+    This is the format the application saves models in; it keeps the
+    regression statistics, so a loaded model can still be updated. The
+    JSON coefficients file of runtime.LinearPredictor is an export of the
+    same coefficients and metadata for other tools, and LinearPredictor
+    reads both.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - metadata (dict): JSON-serializable information (column names,
+      metrics, description, ...).
+    - values (dict): The numeric values of the model (coefficients and
+      regression statistics), by name.
+    """
+    names = list(values)
+    metadata = dict(metadata, payload=names)
+    encoded = json.dumps(metadata, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    payload = struct.pack(f"<{len(names)}d", *(float(values[name]) for name in names))
+    with open(file_path, 'wb') as handle:
+        handle.write(_HEADER.pack(MODEL_MAGIC, MODEL_SCHEMA_VERSION, len(encoded)))
+        handle.write(encoded)
+        handle.write(payload)
+
+
+def read_model_file(file_path):
+    """
+    Reads a compact model file written by write_model_file.
+
+    Parameters:
+    - file_path (str): The path of the file.
+
+    Returns:
+    - dict: The metadata.
+    - dict: The numeric values, by name, as floats.
+
+    Raises:
+    - ValueError: If the file is not a compact model file, is truncated,
+      stores values other than PAYLOAD_FIELDS or was written by a newer
+      version of the format.
+    """
+    with open(file_path, 'rb') as handle:
+        content = handle.read()
+    if len(content) < _HEADER.size:
+        raise ValueError("The file is not a PredictEase model file.")
+    magic, version, metadata_length = _HEADER.unpack_from(content)
+    if magic != MODEL_MAGIC:
+        raise ValueError("The file is not a PredictEase model file.")
+    if version > MODEL_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported model file version {version} "
+            f"(this version reads up to {MODEL_SCHEMA_VERSION})."
+        )
+
+    payload_start = _HEADER.size + metadata_length
+    metadata = json.loads(content[_HEADER.size:payload_start].decode('utf-8'))
+    if not isinstance(metadata, dict):
+        raise ValueError("The model file is corrupted.")
+    names = metadata.pop('payload', [])
+    if not isinstance(names, list) or not all(isinstance(name, str) for name in names):
+        raise ValueError("The model file is corrupted.")
+    unknown_names = [name for name in names if name not in PAYLOAD_FIELDS]
+    if unknown_names:
+        raise ValueError(f"The model file stores unknown values: {', '.join(unknown_names)}.")
+    if len(set(names)) != len(names) or 'coef' not in names or 'intercept' not in names:
+        raise ValueError("The model file is corrupted.")
+    if len(content) - payload_start != 8 * len(names):
+        raise ValueError("The model file is truncated or corrupted.")
+    payload = struct.unpack_from(f"<{len(names)}d", content, payload_start)
+    return metadata, dict(zip(names, payload))
+
+
+def metric_values(metrics):
+    """
+    Converts metrics to JSON values: floats, or None for a metric that is
+    undefined (None or NaN, e.g. the R² of a single point).
+
+    Parameters:
+    - metrics (dict): The metrics, by name.
+
+    Returns:
+    - dict: The converted metrics.
+    """
+    converted = {}
+    for name, value in metrics.items():
+        value = None if value is None else float(value)
+        converted[name] = None if value is None or math.isnan(value) else value
+    return converted
+
+
+def model_values(model):
+    """
+    Collects the numeric values of a fitted model stored in a model file:
+    the coefficients and, when the model keeps them, its regression
+    statistics (needed to update it later with new data).
+
+    Parameters:
+    - model: The fitted model (LinearRegressionModel or LinearPredictor).
+
+    Returns:
+    - dict: The values, by name.
+    """
+    values = {'coef': float(model.coef_), 'intercept': float(model.intercept_)}
+    stats = getattr(model, 'stats_', None)
+    if stats is not None:
+        values.update({name: float(getattr(stats, name)) for name in STATISTICS_FIELDS})
+    return values
@@ -1,22 +1,42 @@
 # src/models/model_io.py
 
+import os
 import joblib
+from src.models.model_format import (MODEL_EXTENSION, STATISTICS_FIELDS, is_model_file,
+                                     metric_values, model_values, read_model_file,
+                                     write_model_file)
+from src.models.regression import LinearRegressionModel
+from src.models.streaming_ols import OLSAccumulator
+
+# Entries of the model data kept as metadata in a compact model file.
+METADATA_KEYS = ('input_column', 'output_column', 'model_description', 'formula',
+                 'metrics', 'preprocessing')
 
 
 def save_model_data(model_data, file_path):
     """
-    Saves the model data to a file.
+    Saves the model data to a file. A file with the .pemodel extension is
+    written in the compact format (see write_model_file); any other file is
+    written with joblib.
 
     Parameters:
     - model_data (dict): The model data to save.
     - file_path (str): The file path where to save the model data.
     """
-    joblib.dump(model_data, file_path)
+    if not file_path.lower().endswith(MODEL_EXTENSION):
+        joblib.dump(model_data, file_path)
+        return
+
+    metadata = {key: model_data[key] for key in METADATA_KEYS if key in model_data}
+    if 'metrics' in metadata:
+        metadata['metrics'] = metric_values(metadata['metrics'])
+    write_model_file(file_path, metadata, model_values(model_data['model']))
 
 
 def load_model_data(file_path):
     """
-    Loads the model data from a file.
+    Loads the model data from a file, in the compact format (recognized by
+    its first bytes) or saved with joblib by older versions.
 
     Parameters:
     - file_path (str): The file path from where to load the model data.
@@ -24,5 +44,41 @@ def load_model_data(file_path):
     Returns:
     - dict: The loaded model data.
     """
-    model_data = joblib.load(file_path)
-    return model_data
+    if not is_model_file(file_path):
+        model_data = joblib.load(file_path)
+        return model_data
+
+    metadata, values = read_model_file(file_path)
+    if all(name in values for name in STATISTICS_FIELDS):
+        model = LinearRegressionModel.from_statistics(
+            OLSAccumulator.from_dict({name: values[name] for name in STATISTICS_FIELDS})
+        )
+    else:
+        model = LinearRegressionModel()
+        metrics = metadata.get('metrics', {})
+        model.r2_, model.mse_ = metrics.get('R²'), metrics.get('MSE')
+    # The stored coefficients are authoritative (the statistics reproduce them).
+    model.set_coefficients(values['coef'], values['intercept'])
+    return dict(metadata, model=model)
+
+
+def migrate_model_file(file_path, output_path=None):
+    """
+    Converts a model saved with joblib (.joblib or .pkl) to the compact
+    format.
+
+    Parameters:
+    - file_path (str): The path of the old model file.
+    - output_path (str): The path of the new file (the same name with the
+      .pemodel extension if None).
+
+    Returns:
+    - str: The path of the new file.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(file_path)[0] + MODEL_EXTENSION
+    model_data = load_model_data(file_path)
+    if model_data.get('model') is None:
+        raise ValueError("The model object is missing in the loaded file.")
+    save_model_data(model_data, output_path)
+    return output_path
@@ -0,0 +1,289 @@
+# src/models/registry.py
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+import pandas as pd
+from src.models.model_format import MODEL_EXTENSION
+from src.models.model_io import load_model_data, save_model_data
+
+# Default location of the model registry.
+DEFAULT_REGISTRY_DIR = os.path.join(os.path.expanduser("~"), ".predictease", "models")
+
+# Number of models kept in memory by the LRU cache of the registry.
+DEFAULT_CACHE_SIZE = 32
+
+INDEX_FILE_NAME = "registry.sqlite"
+
+# Columns of the index that the listing can be sorted by.
+SORT_COLUMNS = ('name', 'input_column', 'output_column', 'r2', 'mse', 'created')
+
+LISTED_COLUMNS = ('name', 'input_column', 'output_column', 'r2', 'mse',
+                  'description', 'created', 'hash')
+
+
+def _hash_bytes(content):
+    """Returns the hexadecimal content hash of a model file."""
+    return hashlib.blake2b(content, digest_size=20).hexdigest()
+
+
+class ModelRegistry:
+    """
+    A directory of saved models (in the compact .pemodel format) with a
+    SQLite index of their name, columns, metrics, description, creation
+    time and content hash.
+
+    Listing, filtering and sorting only query the index, so they do not
+    open any model file. Models are loaded on demand and the most recently
+    used ones are kept in memory (LRU cache), so switching back to a model
+    does not read its file again.
+    """
+
+    def __init__(self, registry_dir=DEFAULT_REGISTRY_DIR, cache_size=DEFAULT_CACHE_SIZE):
+        self.registry_dir = registry_dir
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._initialized = False
+
+    def _connect(self):
+        """Opens the index, creating the registry on first use."""
+        connection = sqlite3.connect(os.path.join(self.registry_dir, INDEX_FILE_NAME))
+        if not self._initialized:
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS models (
+                    name TEXT PRIMARY KEY,
+                    file_name TEXT NOT NULL,
+                    input_column TEXT,
+                    output_column TEXT,
+                    r2 REAL,
+                    mse REAL,
+                    description TEXT,
+                    created REAL NOT NULL,
+                    hash TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS models_r2 ON models (r2);
+                CREATE INDEX IF NOT EXISTS models_mse ON models (mse);
+                CREATE INDEX IF NOT EXISTS models_created ON models (created);
+                CREATE INDEX IF NOT EXISTS models_columns ON models (output_column, input_column);
+                """
+            )
+            self._initialized = True
+        return connection
+
+    def register(self, model_data, name=None):
+        """
+        Saves a model in the registry. A model registered under an existing
+        name replaces it.
+
+        Parameters:
+        - model_data (dict): The model data (see save_model_data).
+        - name (str): The name of the model (by default, the output and
+          input columns and the creation time).
+
+        Returns:
+        - str: The name of the model.
+        """
+        created = time.time()
+        if not name:
+            name = "{} ~ {} ({})".format(
+                model_data.get('output_column'), model_data.get('input_column'),
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+            )
+        metrics = model_data.get('metrics') or {}
+        os.makedirs(self.registry_dir, exist_ok=True)
+        file_name = uuid.uuid4().hex + MODEL_EXTENSION
+        file_path = os.path.join(self.registry_dir, file_name)
+        save_model_data(model_data, file_path)
+        with open(file_path, 'rb') as handle:
+            content_hash = _hash_bytes(handle.read())
+
+        with self.lock:
+            connection = self._connect()
+            try:
+                previous = connection.execute(
+                    "SELECT file_name FROM models WHERE name = ?", (name,)
+                ).fetchone()
+                connection.execute(
+                    "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (name, file_name, model_data.get('input_column'),
+                     model_data.get('output_column'),
+                     None if metrics.get('R²') is None else float(metrics['R²']),
+                     None if metrics.get('MSE') is None else float(metrics['MSE']),
+                     model_data.get('model_description'), created, content_hash)
+                )
+                connection.commit()
+            finally:
+                connection.close()
+            self._cache.pop(name, None)
+        if previous is not None:
+            self._remove_file(previous[0])
+        return name
+
+    def import_file(self, file_path, name=None):
+        """
+        Registers a model saved to a file (compact, joblib or pickle).
+
+        Parameters:
+        - file_path (str): The path of the model file.
+        - name (str): The name of the model (by default, the file name).
+
+        Returns:
+        - str: The name of the model.
+        """
+        model_data = load_model_data(file_path)
+        if model_data.get('model') is None:
+            raise ValueError("The model object is missing in the loaded file.")
+        name = name or os.path.splitext(os.path.basename(file_path))[0]
+        return self.register(model_data, name)
+
+    def list_models(self, search=None, input_column=None, output_column=None,
+                    min_r2=None, max_mse=None, sort_by='r2', descending=None, limit=None):
+        """
+        Lists the registered models from the index, without opening them.
+
+        Parameters:
+        - search (str): Only the models whose name or description contains
+          this text (case-insensitive).
+        - input_column (str): Only the models with this input column.
+        - output_column (str): Only the models with this output column.
+        - min_r2 (float): Only the models with at least this R².
+        - max_mse (float): Only the models with at most this MSE.
+        - sort_by (str): One of SORT_COLUMNS.
+        - descending (bool): The sort order (by default, best models first
+          for 'r2' and 'mse', newest first for 'created', else ascending).
+        - limit (int): The maximum number of models returned.
+
+        Returns:
+        - pd.DataFrame: One row per model with the columns of LISTED_COLUMNS.
+        """
+        if sort_by not in SORT_COLUMNS:
+            raise ValueError(f"Cannot sort by {sort_by}; use one of {', '.join(SORT_COLUMNS)}.")
+        if descending is None:
+            descending = sort_by in ('r2', 'created')
+
+        conditions, parameters = [], []
+        if search:
+            conditions.append("(name LIKE ? ESCAPE '\\' OR description LIKE ? ESCAPE '\\')")
+            pattern = "%" + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + "%"
+            parameters += [pattern, pattern]
+        for column, value in (('input_column', input_column), ('output_column', output_column)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        if min_r2 is not None:
+            conditions.append("r2 >= ?")
+            parameters.append(float(min_r2))
+        if max_mse is not None:
+            conditions.append("mse <= ?")
+            parameters.append(float(max_mse))
+
+        query = f"SELECT {', '.join(LISTED_COLUMNS)} FROM models"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        # Models without the metric are listed last.
+        query += f" ORDER BY {sort_by} IS NULL, {sort_by} {'DESC' if descending else 'ASC'}, name"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(int(limit))
+
+        if not os.path.exists(os.path.join(self.registry_dir, INDEX_FILE_NAME)):
+            return pd.DataFrame(columns=list(LISTED_COLUMNS))
+        with self.lock:
+            connection = self._connect()
+            try:
+                rows = connection.execute(query, parameters).fetchall()
+            finally:
+                connection.close()
+        return pd.DataFrame.from_records(rows, columns=list(LISTED_COLUMNS))
+
+    def load(self, name):
+        """
+        Loads a registered model, from memory if it was used recently.
+
+        Parameters:
+        - name (str): The name of the model.
+
+        Returns:
+        - dict: The model data (shared with the cache: copy it before
+          modifying it).
+        """
+        with self.lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                return self._cache[name]
+            entry = self._entry(name)
+
+        file_path = os.path.join(self.registry_dir, entry['file_name'])
+        with open(file_path, 'rb') as handle:
+            if _hash_bytes(handle.read()) != entry['hash']:
+                raise ValueError(f"The file of the model '{name}' was modified outside the registry.")
+        model_data = load_model_data(file_path)
+
+        with self.lock:
+            self._cache[name] = model_data
+            self._cache.move_to_end(name)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return model_data
+
+    def _entry(self, name):
+        """Returns the index entry of a model (called with the lock held)."""
+        if not os.path.exists(os.path.join(self.registry_dir, INDEX_FILE_NAME)):
+            raise ValueError(f"No model named '{name}' in the registry.")
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT file_name, hash FROM models WHERE name = ?", (name,)
+            ).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            raise ValueError(f"No model named '{name}' in the registry.")
+        return {'file_name': row[0], 'hash': row[1]}
+
+    def delete(self, name):
+        """
+        Removes a model from the registry and deletes its file.
+
+        Parameters:
+        - name (str): The name of the model.
+        """
+        with self.lock:
+            entry = self._entry(name)
+            connection = self._connect()
+            try:
+                connection.execute("DELETE FROM models WHERE name = ?", (name,))
+                connection.commit()
+            finally:
+                connection.close()
+            self._cache.pop(name, None)
+        self._remove_file(entry['file_name'])
+
+    def _remove_file(self, file_name):
+        file_path = os.path.join(self.registry_dir, file_name)
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def cached_names(self):
+        """
+        Returns:
+        - list: The names of the models held in memory, least recently used first.
+        """
+        with self.lock:
+            return list(self._cache)
+
+    def __len__(self):
+        if not os.path.exists(os.path.join(self.registry_dir, INDEX_FILE_NAME)):
+            return 0
+        with self.lock:
+            connection = self._connect()
+            try:
+                return connection.execute("SELECT COUNT(*) FROM models").fetchone()[0]
+            finally:
+                connection.close()
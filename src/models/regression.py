@@ -1,7 +1,12 @@
 # src/models/regression.py
 
+import numpy as np
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_squared_error, r2_score
+from src.models.streaming_ols import OLSAccumulator
+
+# Number of points summarized at once when fitting a single feature.
+FIT_CHUNK_SIZE = 1_000_000
 
 
 class LinearRegressionModel:
@@ -14,18 +19,140 @@ class LinearRegressionModel:
         self.model = LinearRegression()
         self.coef_ = None
         self.intercept_ = None
+        self.r2_ = None      # R² on the training data
+        self.mse_ = None     # Mean squared error on the training data
+        self.stats_ = None   # OLSAccumulator of the training data (single feature)
 
     def fit(self, X, y):
         """
-        Fits the linear regression model.
+        Fits the linear regression model and computes its R² and MSE on the
+        training data. With a single feature, the coefficients and metrics
+        are derived in closed form from the regression sums, without
+        computing any prediction.
 
         Parameters:
-        - X (array-like): Feature matrix.
+        - X (array-like): Feature matrix (or vector for a single feature).
         - y (array-like): Target vector.
         """
-        self.model.fit(X, y)
-        self.coef_ = self.model.coef_[0]
-        self.intercept_ = self.model.intercept_
+        X = np.asarray(X)
+        if X.ndim == 1 or X.shape[1] == 1:
+            x = X.reshape(-1)
+            y = np.asarray(y).reshape(-1)
+            if len(x) != len(y):
+                raise ValueError("X and y must have the same number of rows.")
+            accumulator = OLSAccumulator()
+            for start in range(0, len(x), FIT_CHUNK_SIZE):
+                accumulator.update(x[start:start + FIT_CHUNK_SIZE], y[start:start + FIT_CHUNK_SIZE])
+            if accumulator.n < len(x):
+                raise ValueError("Input contains NaN.")
+            self.set_statistics(accumulator)
+        else:
+            self.model.fit(X, y)
+            self.coef_ = self.model.coef_[0]
+            self.intercept_ = self.model.intercept_
+            predictions = self.model.predict(X)
+            self.r2_ = self.r2_score(y, predictions)
+            self.mse_ = self.mean_squared_error(y, predictions)
+            self.stats_ = None
+
+    def fit_streaming(self, chunks):
+        """
+        Fits the model from an iterable of (X, y) chunks, keeping only the
+        regression statistics in memory (see OLSAccumulator).
+
+        Parameters:
+        - chunks (iterable): (X, y) pairs of array-likes with one feature.
+
+        Returns:
+        - OLSAccumulator: The statistics of all the chunks.
+        """
+        accumulator = OLSAccumulator()
+        for X, y in chunks:
+            accumulator.update(X, y)
+        self.set_statistics(accumulator)
+        return accumulator
+
+    def partial_fit(self, X, y, decay=1.0):
+        """
+        Updates the model with new rows by folding them into the regression
+        statistics stored when it was fitted, without the original training
+        data. Rows with a NaN value are ignored.
+
+        Parameters:
+        - X (array-like): The new input values (one feature).
+        - y (array-like): The new target values.
+        - decay (float): The factor applied to the weight of the data seen so
+          far before the new rows are added (1 keeps all of it; lower values
+          let the model follow drifting data).
+
+        Returns:
+        - OLSAccumulator: The updated statistics.
+        """
+        return self.update_statistics(OLSAccumulator().update(X, y), decay)
+
+    def update_statistics(self, accumulator, decay=1.0):
+        """
+        Updates the model with the regression statistics of new data (e.g.
+        computed from a file by accumulate_file).
+
+        Parameters:
+        - accumulator (OLSAccumulator): The statistics of the new data.
+        - decay (float): See partial_fit.
+
+        Returns:
+        - OLSAccumulator: The updated statistics.
+        """
+        if getattr(self, 'stats_', None) is None:
+            raise ValueError(
+                "This model does not store its training statistics and cannot be "
+                "updated; create it again from the full dataset."
+            )
+        updated = OLSAccumulator().merge(self.stats_).scale(decay).merge(accumulator)
+        self.set_statistics(updated)
+        return updated
+
+    def set_statistics(self, accumulator):
+        """
+        Sets the coefficients from regression statistics computed elsewhere
+        (e.g. merged from several files or workers).
+
+        Parameters:
+        - accumulator (OLSAccumulator): The statistics.
+        """
+        self.set_coefficients(accumulator.coef(), accumulator.intercept())
+        self.r2_ = accumulator.r2()
+        self.mse_ = accumulator.mse()
+        self.stats_ = accumulator
+
+    def set_coefficients(self, coef, intercept):
+        """
+        Sets the slope and intercept of a single-feature model (e.g. read
+        from a model file), so it can predict without being fitted.
+
+        Parameters:
+        - coef (float): The slope.
+        - intercept (float): The intercept.
+        """
+        self.coef_ = coef
+        self.intercept_ = intercept
+        self.model.coef_ = np.array([coef])
+        self.model.intercept_ = intercept
+        self.model.n_features_in_ = 1
+
+    @classmethod
+    def from_statistics(cls, accumulator):
+        """
+        Creates a fitted model from regression statistics.
+
+        Parameters:
+        - accumulator (OLSAccumulator): The statistics.
+
+        Returns:
+        - LinearRegressionModel: The fitted model.
+        """
+        model = cls()
+        model.set_statistics(accumulator)
+        return model
 
     def predict(self, X):
         """
@@ -0,0 +1,165 @@
+# src/models/runtime.py
+
+import json
+from src.models.model_format import is_model_file, metric_values, read_model_file
+
+# Version of the coefficients file written by LinearPredictor.save.
+RUNTIME_FORMAT_VERSION = 1
+
+# Value of the 'format' key identifying a coefficients file.
+RUNTIME_FORMAT_NAME = "predictease-linear"
+
+
+class LinearPredictor:
+    """
+    Predicts with the coefficients of a fitted simple linear regression
+    (y = coef_ * x + intercept_) without the estimator that produced them.
+
+    The coefficients are stored in a small JSON file, so scoring processes
+    load them without unpickling the sklearn estimator: this module imports
+    nothing heavier than NumPy, and only when an array is predicted, so
+    short-lived command line processes predicting values start quickly.
+    """
+
+    __slots__ = ('coef_', 'intercept_', 'input_column', 'output_column', 'metadata')
+
+    def __init__(self, coef, intercept, input_column=None, output_column=None, metadata=None):
+        self.coef_ = float(coef)
+        self.intercept_ = float(intercept)
+        self.input_column = input_column
+        self.output_column = output_column
+        self.metadata = metadata or {}
+
+    @classmethod
+    def from_model(cls, model, input_column=None, output_column=None, metadata=None):
+        """
+        Extracts the coefficients of a fitted model.
+
+        Parameters:
+        - model (LinearRegressionModel): The fitted model.
+        - input_column (str): The name of the input column.
+        - output_column (str): The name of the output column.
+        - metadata (dict): JSON-serializable information kept with the
+          coefficients (description, formula, metrics, ...).
+
+        Returns:
+        - LinearPredictor: The predictor.
+        """
+        return cls(model.coef_, model.intercept_, input_column, output_column, metadata)
+
+    def predict(self, x):
+        """
+        Predicts the target of one or several input values.
+
+        Parameters:
+        - x (float or array-like): An input value, a vector of values or a
+          single-column matrix.
+
+        Returns:
+        - float or np.ndarray: The prediction (a float for a scalar input,
+          otherwise a float64 vector).
+        """
+        if isinstance(x, (int, float)):
+            return self.intercept_ + self.coef_ * x
+        import numpy as np
+        values = np.asarray(x, dtype='float64')
+        if values.ndim == 0:
+            return float(self.intercept_ + self.coef_ * values)
+        if values.ndim == 2 and values.shape[1] == 1:
+            values = values.ravel()
+        predictions = values * self.coef_
+        predictions += self.intercept_
+        return predictions
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The coefficients and metadata, as JSON-serializable values.
+        """
+        return {
+            'format': RUNTIME_FORMAT_NAME,
+            'version': RUNTIME_FORMAT_VERSION,
+            'input_column': self.input_column,
+            'output_column': self.output_column,
+            'coef': self.coef_,
+            'intercept': self.intercept_,
+            'metadata': self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds a predictor from the output of to_dict.
+
+        Parameters:
+        - data (dict): The coefficients and metadata.
+
+        Returns:
+        - LinearPredictor: The predictor.
+        """
+        if data.get('format') != RUNTIME_FORMAT_NAME:
+            raise ValueError("The data does not describe a linear model.")
+        if data.get('version', 0) > RUNTIME_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported model format version {data['version']} "
+                f"(this version reads up to {RUNTIME_FORMAT_VERSION})."
+            )
+        return cls(data['coef'], data['intercept'], data.get('input_column'),
+                   data.get('output_column'), data.get('metadata'))
+
+    def save(self, file_path):
+        """
+        Writes the coefficients and metadata to a JSON file.
+
+        Parameters:
+        - file_path (str): The path of the file.
+        """
+        with open(file_path, 'w', encoding='utf-8') as handle:
+            json.dump(self.to_dict(), handle, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Reads a predictor written by save, or from a compact model file
+        (see model_format).
+
+        Parameters:
+        - file_path (str): The path of the file.
+
+        Returns:
+        - LinearPredictor: The predictor.
+        """
+        if is_model_file(file_path):
+            metadata, values = read_model_file(file_path)
+            input_column = metadata.pop('input_column', None)
+            output_column = metadata.pop('output_column', None)
+            return cls(values['coef'], values['intercept'], input_column, output_column, metadata)
+        with open(file_path, 'r', encoding='utf-8') as handle:
+            return cls.from_dict(json.load(handle))
+
+
+def export_model_data(model_data, file_path):
+    """
+    Writes the coefficients of saved model data (as built by the
+    application, see save_model_data) to a JSON file for the runtime.
+
+    Parameters:
+    - model_data (dict): The model data, with the fitted model under 'model'.
+    - file_path (str): The path of the JSON file.
+
+    Returns:
+    - LinearPredictor: The exported predictor.
+    """
+    metadata = {
+        key: model_data[key]
+        for key in ('model_description', 'formula', 'metrics', 'preprocessing')
+        if key in model_data
+    }
+    if 'metrics' in metadata:
+        metadata['metrics'] = metric_values(metadata['metrics'])
+    predictor = LinearPredictor.from_model(
+        model_data['model'], model_data.get('input_column'),
+        model_data.get('output_column'), metadata
+    )
+    predictor.save(file_path)
+    return predictor
@@ -0,0 +1,258 @@
+# src/models/streaming_ols.py
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.data.batch_importer import WORKER_START_METHOD, expand_sources
+from src.data.file_importer import DEFAULT_CHUNK_SIZE, iter_file_chunks
+from src.models.model_format import STATISTICS_FIELDS
+
+
+class OLSAccumulator:
+    """
+    Sufficient statistics of a single-feature least squares regression:
+    the number of points, the means of x and y and the centered sums of
+    squares and cross-products.
+
+    Chunks are summarized around their own means and merged with the
+    pairwise update of Chan et al. (the batch form of Welford's algorithm),
+    which avoids the cancellation of the raw sums Σx², Σxy. Accumulators
+    computed on different chunks or files can be merged in any order, so
+    a regression can be fitted in O(1) memory or in parallel.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+
+    def update(self, x, y):
+        """
+        Adds points to the statistics. Points where x or y is NaN are ignored.
+
+        Parameters:
+        - x (array-like): The input values (a vector or a single-column matrix).
+        - y (array-like): The target values.
+
+        Returns:
+        - OLSAccumulator: The accumulator itself.
+        """
+        x = np.asarray(x, dtype='float64').ravel()
+        y = np.asarray(y, dtype='float64').ravel()
+        if len(x) != len(y):
+            raise ValueError("x and y must have the same number of values.")
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[valid], y[valid]
+        if not len(x):
+            return self
+
+        chunk = OLSAccumulator()
+        chunk.n = len(x)
+        chunk.mean_x = x.mean()
+        chunk.mean_y = y.mean()
+        dx = x - chunk.mean_x
+        dy = y - chunk.mean_y
+        chunk.sxx = dx @ dx
+        chunk.syy = dy @ dy
+        chunk.sxy = dx @ dy
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Merges the statistics of other points (e.g. from another worker).
+
+        Parameters:
+        - other (OLSAccumulator): The statistics to merge.
+
+        Returns:
+        - OLSAccumulator: The accumulator itself.
+        """
+        if other.n == 0:
+            return self
+        if self.n <= 0:
+            self.n, self.mean_x, self.mean_y = other.n, other.mean_x, other.mean_y
+            self.sxx, self.syy, self.sxy = other.sxx, other.syy, other.sxy
+            return self
+
+        n = self.n + other.n
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        weight = self.n * other.n / n
+        self.sxx += other.sxx + delta_x * delta_x * weight
+        self.syy += other.syy + delta_y * delta_y * weight
+        self.sxy += other.sxy + delta_x * delta_y * weight
+        self.mean_x += delta_x * other.n / n
+        self.mean_y += delta_y * other.n / n
+        self.n = n
+        return self
+
+    def scale(self, factor):
+        """
+        Multiplies the weight of the points summarized so far by a factor,
+        e.g. to let the statistics forget old data exponentially. The number
+        of points then becomes an effective (fractional) weight.
+
+        Parameters:
+        - factor (float): The factor, between 0 and 1.
+
+        Returns:
+        - OLSAccumulator: The accumulator itself.
+        """
+        if not 0 <= factor <= 1:
+            raise ValueError("The forgetting factor must be between 0 and 1.")
+        self.n *= factor
+        self.sxx *= factor
+        self.syy *= factor
+        self.sxy *= factor
+        return self
+
+    def _check_fitted(self):
+        if self.n <= 0:
+            raise ValueError("No valid data points to fit the model.")
+
+    def coef(self):
+        """
+        Returns:
+        - float: The slope (0 if x is constant, like sklearn's least squares).
+        """
+        self._check_fitted()
+        return self.sxy / self.sxx if self.sxx > 0 else 0.0
+
+    def intercept(self):
+        """
+        Returns:
+        - float: The intercept.
+        """
+        return self.mean_y - self.coef() * self.mean_x
+
+    def sse(self):
+        """
+        Returns:
+        - float: The sum of squared residuals.
+        """
+        self._check_fitted()
+        explained = self.sxy * self.sxy / self.sxx if self.sxx > 0 else 0.0
+        return max(self.syy - explained, 0.0)
+
+    def mse(self):
+        """
+        Returns:
+        - float: The mean squared error of the fitted line on the points.
+        """
+        return self.sse() / self.n
+
+    def r2(self):
+        """
+        Returns:
+        - float: The R² score of the fitted line on the points (1 for a
+          perfect fit of a constant target, as sklearn's r2_score).
+        """
+        sse = self.sse()
+        if self.syy == 0:
+            return 1.0 if sse == 0 else 0.0
+        return 1.0 - sse / self.syy
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The statistics, as plain floats.
+        """
+        n = float(self.n)
+        return {'n': int(n) if n.is_integer() else n, 'mean_x': float(self.mean_x), 'mean_y': float(self.mean_y),
+                'sxx': float(self.sxx), 'syy': float(self.syy), 'sxy': float(self.sxy)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuilds an accumulator from the output of to_dict.
+
+        Parameters:
+        - data (dict): The statistics.
+
+        Returns:
+        - OLSAccumulator: The accumulator.
+
+        Raises:
+        - ValueError: If a statistic is missing, unknown or not a number.
+        """
+        unknown_fields = [key for key in data if key not in STATISTICS_FIELDS]
+        if unknown_fields:
+            raise ValueError(f"Unknown regression statistics: {', '.join(map(str, unknown_fields))}.")
+        accumulator = cls()
+        for name in STATISTICS_FIELDS:
+            value = data.get(name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"The regression statistic '{name}' must be a number.")
+            setattr(accumulator, name, value)
+        return accumulator
+
+
+def accumulate_file(file_path, input_column, output_column, options=None,
+                    chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+    """
+    Computes the regression statistics of two columns of a file, one chunk
+    at a time, so the file never has to fit in memory.
+
+    Parameters:
+    - file_path (str): The path of the file.
+    - input_column (str): The input column.
+    - output_column (str): The target column.
+    - options (dict): The reader options (see import_file).
+    - chunk_size (int): The number of rows per chunk.
+    - progress_callback (callable): Called with the progress percentage.
+
+    Returns:
+    - OLSAccumulator: The statistics.
+    """
+    accumulator = OLSAccumulator()
+    for chunk, progress in iter_file_chunks(file_path, options, chunk_size):
+        missing = [col for col in (input_column, output_column) if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Columns not found in {file_path}: {', '.join(missing)}")
+        try:
+            accumulator.update(chunk[input_column], chunk[output_column])
+        except (TypeError, ValueError):
+            raise ValueError("The input and output columns must be numeric.")
+        if progress_callback is not None:
+            progress_callback(progress)
+    return accumulator
+
+
+def accumulate_files(path_or_pattern, input_column, output_column, max_workers=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Computes the regression statistics of several files in parallel (one
+    process per file) and merges them.
+
+    Parameters:
+    - path_or_pattern (str): A directory or a glob pattern (see expand_sources).
+    - input_column (str): The input column.
+    - output_column (str): The target column.
+    - max_workers (int): The number of worker processes (all cores if None).
+    - chunk_size (int): The number of rows per chunk.
+
+    Returns:
+    - OLSAccumulator: The merged statistics.
+    """
+    paths = expand_sources(path_or_pattern)
+    accumulator = OLSAccumulator()
+    if len(paths) == 1:
+        return accumulator.merge(
+            accumulate_file(paths[0], input_column, output_column, chunk_size=chunk_size)
+        )
+    # Spawned like the workers of batch_importer (the GUI runs Tk and threads).
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    context = multiprocessing.get_context(WORKER_START_METHOD)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [
+            executor.submit(accumulate_file, path, input_column, output_column, None, chunk_size)
+            for path in paths
+        ]
+        for future in futures:
+            accumulator.merge(future.result())
+    return accumulator
+
@@ -0,0 +1,99 @@
+# src/models/sweep.py
+
+import numpy as np
+import pandas as pd
+
+
+def regression_sweep(df, target=None, columns=None, min_points=3):
+    """
+    Fits a simple linear regression for every pair of numeric columns (or
+    every column against a target) at once, from a few matrix products
+    instead of one fit per pair.
+
+    Each pair uses the rows where both columns have a value. With M the
+    matrix of non-missing flags and Z the values centered on their column
+    means (missing values set to 0), the products M'M, Z'M, (Z²)'M and Z'Z
+    give, for every pair, the number of common rows and the sums needed for
+    the slope, the intercept, the R² and the MSE.
+
+    Parameters:
+    - df (pd.DataFrame): The dataset.
+    - target (str): If given, only the regressions of this column on every
+      other numeric column are computed.
+    - columns (list): The candidate columns (all numeric columns if None).
+    - min_points (int): Pairs with fewer common rows are left out.
+
+    Returns:
+    - pd.DataFrame: One row per (input, output) pair with the columns
+      'input', 'output', 'r2', 'coef', 'intercept', 'mse' and 'n', sorted
+      by decreasing R².
+    """
+    numeric = df.select_dtypes(include='number')
+    if columns is not None:
+        numeric = numeric[[col for col in columns if col in numeric.columns]]
+    if target is not None:
+        if target not in df.columns or not pd.api.types.is_numeric_dtype(df[target]):
+            raise ValueError(f"The target '{target}' is not a numeric column.")
+        if target not in numeric.columns:
+            numeric = numeric.join(df[[target]])
+    if len(numeric.columns) < 2:
+        raise ValueError("At least two numeric columns are needed.")
+
+    values = numeric.to_numpy(dtype='float64', na_value=np.nan)
+    present = ~np.isnan(values)
+    counts = present.sum(axis=0)
+    means = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), 0.0)
+    centered = np.where(present, values - means, 0.0)
+    mask = present.astype('float64')
+
+    inputs = list(numeric.columns)
+    outputs = inputs if target is None else [target]
+    out_positions = [inputs.index(col) for col in outputs]
+    mask_out = mask[:, out_positions]
+    centered_out = centered[:, out_positions]
+
+    # Element [i, j] of each product refers to input i and output j.
+    n = mask.T @ mask_out
+    sum_x = centered.T @ mask_out
+    sum_y = mask.T @ centered_out
+    sum_xx = (centered ** 2).T @ mask_out
+    sum_yy = mask.T @ centered_out ** 2
+    sum_xy = centered.T @ centered_out
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sxx = sum_xx - sum_x ** 2 / n
+        syy = sum_yy - sum_y ** 2 / n
+        sxy = sum_xy - sum_x * sum_y / n
+        coef = sxy / sxx
+        intercept = (sum_y / n + means[out_positions]) - coef * (sum_x / n + means[:, None])
+        sse = np.maximum(syy - sxy * coef, 0.0)
+        r2 = 1.0 - sse / syy
+        mse = sse / n
+
+    input_index, output_index = np.meshgrid(np.arange(len(inputs)), np.arange(len(outputs)),
+                                            indexing='ij')
+    keep = (input_index != np.array(out_positions)[output_index]) \
+        & (n >= min_points) & (sxx > 1e-12 * sum_xx) & (syy > 1e-12 * sum_yy)
+    result = pd.DataFrame({
+        'input': np.array(inputs, dtype=object)[input_index[keep]],
+        'output': np.array(outputs, dtype=object)[output_index[keep]],
+        'r2': r2[keep],
+        'coef': coef[keep],
+        'intercept': intercept[keep],
+        'mse': mse[keep],
+        'n': n[keep].astype('int64'),
+    })
+    return result.sort_values('r2', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def r2_matrix(sweep):
+    """
+    Arranges the R² of a sweep as a matrix for a heatmap.
+
+    Parameters:
+    - sweep (pd.DataFrame): The output of regression_sweep.
+
+    Returns:
+    - pd.DataFrame: The R² with the inputs as rows and the outputs as columns.
+    """
+    return sweep.pivot(index='input', columns='output', values='r2')
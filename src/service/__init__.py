@@ -0,0 +1 @@
+# Initialization for service module
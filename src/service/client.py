@@ -0,0 +1,156 @@
+# src/service/client.py
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import numpy as np
+from src.service.metrics import LATENCY_BUCKETS_MS, Histogram
+from src.service.server import DEFAULT_HOST, DEFAULT_PORT, read_http_message
+
+
+async def _open_connection(host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None):
+    if unix_socket:
+        return await asyncio.open_unix_connection(unix_socket)
+    return await asyncio.open_connection(host, port)
+
+
+async def _request(reader, writer, method, path, payload=None):
+    """
+    Sends a request on an open connection and reads the response.
+
+    Returns:
+    - tuple: The status and the JSON payload of the response.
+    """
+    body = b"" if payload is None else json.dumps(payload).encode('utf-8')
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode('latin-1') + body
+    )
+    await writer.drain()
+    message = await read_http_message(reader)
+    if message is None:
+        raise ConnectionError("The server closed the connection.")
+    status_line, _, response_body = message
+    return int(status_line.split(" ")[1]), json.loads(response_body or b"null")
+
+
+async def fetch(path, payload=None, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None):
+    """
+    Sends one request to a prediction server.
+
+    Parameters:
+    - path (str): The endpoint (e.g. '/metrics').
+    - payload (dict): The JSON body, sent with POST (GET if None).
+    - host (str), port (int): The address of the server.
+    - unix_socket (str): The socket of the server, instead of host and port.
+
+    Returns:
+    - tuple: The status and the JSON payload of the response.
+    """
+    reader, writer = await _open_connection(host, port, unix_socket)
+    try:
+        return await _request(reader, writer, "GET" if payload is None else "POST", path, payload)
+    finally:
+        writer.close()
+
+
+async def run_load(requests=10000, concurrency=64, model=None, host=DEFAULT_HOST, port=DEFAULT_PORT,
+                   unix_socket=None, seed=0):
+    """
+    Sends single-value prediction requests from concurrent keep-alive
+    connections and measures the throughput and latency seen by the clients.
+
+    Parameters:
+    - requests (int): The total number of requests.
+    - concurrency (int): The number of connections sending requests at once.
+    - model (str): The name of the model (may be omitted when a single model
+      is served).
+    - host (str), port (int): The address of the server.
+    - unix_socket (str): The socket of the server, instead of host and port.
+    - seed (int): The seed of the random input values.
+
+    Returns:
+    - dict: The number of requests and errors, the elapsed seconds, the
+      requests per second and the latency histogram (in milliseconds).
+    """
+    values = np.random.default_rng(seed).normal(0.0, 100.0, requests).tolist()
+    latency = Histogram(LATENCY_BUCKETS_MS)
+    errors = 0
+    next_request = 0
+
+    async def worker():
+        nonlocal errors, next_request
+        reader, writer = await _open_connection(host, port, unix_socket)
+        try:
+            while next_request < requests:
+                value = values[next_request]
+                next_request += 1
+                payload = {'x': value} if model is None else {'model': model, 'x': value}
+                started = time.perf_counter()
+                status, _ = await _request(reader, writer, "POST", "/predict", payload)
+                latency.observe((time.perf_counter() - started) * 1000.0)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, requests)))))
+    seconds = time.perf_counter() - started
+    return {
+        'requests': requests,
+        'errors': errors,
+        'seconds': seconds,
+        'requests_per_second': requests / seconds if seconds > 0 else 0.0,
+        'latency_ms': latency.to_dict(),
+    }
+
+
+def main(argv=None):
+    """
+    Runs a load test against a prediction server from the command line, e.g.:
+
+        python -m src.service.client --requests 20000 --concurrency 128
+
+    Parameters:
+    - argv (list): The command line arguments (sys.argv[1:] if None).
+
+    Returns:
+    - int: The exit status.
+    """
+    parser = argparse.ArgumentParser(description="Load test a local prediction server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="The address of the server.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="The port of the server.")
+    parser.add_argument("--unix-socket", help="The Unix socket of the server.")
+    parser.add_argument("--model", help="The model to query (needed when several are served).")
+    parser.add_argument("--requests", type=int, default=10000, help="The total number of requests.")
+    parser.add_argument("--concurrency", type=int, default=64, help="The number of concurrent connections.")
+    args = parser.parse_args(argv)
+
+    async def load_test():
+        summary = await run_load(args.requests, args.concurrency, args.model,
+                                 args.host, args.port, args.unix_socket)
+        _, server_metrics = await fetch("/metrics", host=args.host, port=args.port,
+                                        unix_socket=args.unix_socket)
+        return summary, server_metrics
+
+    try:
+        summary, server_metrics = asyncio.run(load_test())
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    latency = summary['latency_ms']
+    print(f"{summary['requests']} requests in {summary['seconds']:.2f} s "
+          f"({summary['requests_per_second']:,.0f} requests/s), {summary['errors']} errors")
+    print(f"Client latency (ms): mean {latency['mean']:.2f}, p50 <= {latency['p50']}, "
+          f"p95 <= {latency['p95']}, p99 <= {latency['p99']}, max {latency['max']:.2f}")
+    batch_size = server_metrics['batch_size']
+    print(f"Server: {server_metrics['batches']} batches, mean size {batch_size['mean'] or 0:.1f}, "
+          f"p50 latency <= {server_metrics['latency_ms']['p50']} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# src/service/metrics.py
+
+import bisect
+import time
+
+# Upper bounds (in milliseconds) of the latency histogram buckets.
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Upper bounds of the batch size histogram buckets.
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+
+class Histogram:
+    """
+    Counts observations in fixed buckets, so recording a value costs one
+    binary search and the quantiles are read from the cumulative counts
+    (with the resolution of the buckets).
+    """
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # The last bucket has no upper bound
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value, times=1):
+        """
+        Records a value.
+
+        Parameters:
+        - value (float): The observed value.
+        - times (int): The number of observations of this value.
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += times
+        self.count += times
+        self.total += value * times
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q):
+        """
+        Returns the upper bound of the bucket holding a quantile.
+
+        Parameters:
+        - q (float): The quantile, between 0 and 1.
+
+        Returns:
+        - float: The upper bound (the largest value observed for the last
+          bucket), or None if nothing was observed.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for position, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank and count:
+                return self.bounds[position] if position < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The count, mean, maximum, main quantiles and bucket counts
+          (keyed by their upper bound, 'inf' for the last one).
+        """
+        buckets = {str(bound): count for bound, count in zip(self.bounds, self.counts)}
+        buckets['inf'] = self.counts[-1]
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else None,
+            'max': self.max if self.count else None,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'p99': self.quantile(0.99),
+            'buckets': buckets,
+        }
+
+
+class ServiceMetrics:
+    """
+    Throughput and latency counters of the prediction server.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.predictions = 0
+        self.batches = 0
+        self.reloads = 0
+        self.reload_errors = 0
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+
+    def record_request(self, seconds, predictions=0, error=False):
+        """
+        Records a served request.
+
+        Parameters:
+        - seconds (float): The time spent serving it.
+        - predictions (int): The number of values predicted.
+        - error (bool): True if the request failed.
+        """
+        self.requests += 1
+        self.predictions += predictions
+        if error:
+            self.errors += 1
+        self.latency_ms.observe(seconds * 1000.0)
+
+    def record_batch(self, size):
+        """
+        Records a micro-batch of single-value requests predicted together.
+
+        Parameters:
+        - size (int): The number of requests in the batch.
+        """
+        self.batches += 1
+        self.batch_size.observe(size)
+
+    def to_dict(self):
+        """
+        Returns:
+        - dict: The counters, the throughput since the start and the
+          latency and batch size histograms.
+        """
+        uptime = time.monotonic() - self.started
+        return {
+            'uptime_seconds': uptime,
+            'requests': self.requests,
+            'errors': self.errors,
+            'predictions': self.predictions,
+            'batches': self.batches,
+            'reloads': self.reloads,
+            'reload_errors': self.reload_errors,
+            'requests_per_second': self.requests / uptime if uptime > 0 else 0.0,
+            'predictions_per_second': self.predictions / uptime if uptime > 0 else 0.0,
+            'latency_ms': self.latency_ms.to_dict(),
+            'batch_size': self.batch_size.to_dict(),
+        }
@@ -0,0 +1,512 @@
+# src/service/server.py
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+import numpy as np
+from src.models.model_format import MODEL_EXTENSION
+from src.models.runtime import LinearPredictor
+from src.service.metrics import ServiceMetrics
+
+# Longest time (in milliseconds) a single-value request waits for others to
+# be predicted with it.
+DEFAULT_MAX_LATENCY_MS = 2.0
+
+# Largest number of single-value requests predicted together.
+DEFAULT_MAX_BATCH_SIZE = 256
+
+# Seconds between two checks of the model files for changes.
+DEFAULT_RELOAD_INTERVAL = 1.0
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Model files served (the sklearn-free formats read by LinearPredictor).
+MODEL_FILE_EXTENSIONS = (MODEL_EXTENSION, ".json")
+
+# Largest request body accepted, in bytes.
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+# Seconds the requests in progress get to be answered when the server closes.
+CLOSE_TIMEOUT = 5.0
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when the body of a message is larger than MAX_BODY_SIZE."""
+
+
+async def read_http_message(reader):
+    """
+    Reads an HTTP/1.1 request or response with a Content-Length body.
+
+    Parameters:
+    - reader (asyncio.StreamReader): The connection.
+
+    Returns:
+    - tuple: The start line, the headers (dict with lowercase names) and the
+      body (bytes), or None if the connection was closed.
+
+    Raises:
+    - PayloadTooLargeError: If the body is larger than MAX_BODY_SIZE.
+    - ValueError: If the Content-Length header is not a valid length.
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    lines = head.decode('latin-1').split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, separator, value = line.partition(":")
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise ValueError("Invalid Content-Length header.")
+    if length > MAX_BODY_SIZE:
+        raise PayloadTooLargeError("The request body is too large.")
+    body = await reader.readexactly(length) if length else b""
+    return lines[0], headers, body
+
+
+def _json_value(value):
+    """Returns a prediction as a JSON value (NaN, for a missing input, becomes null)."""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+def _is_number(value):
+    """Tells whether a JSON value is a number (booleans are not)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class ModelStore:
+    """
+    The models served, read from a model file or from the model files of a
+    directory and named after the file (without its extension).
+
+    scan() reloads the files whose modification time or size changed, adds
+    the new ones and forgets the deleted ones, so models can be replaced on
+    disk while the server runs. A file that cannot be read (e.g. while it is
+    being written) keeps the previous version of its model.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.models = {}
+        self._signatures = {}
+
+    def _files(self):
+        """Returns the model files found at the path, by model name."""
+        if os.path.isdir(self.path):
+            file_names = [os.path.join(self.path, name) for name in os.listdir(self.path)
+                          if name.lower().endswith(MODEL_FILE_EXTENSIONS)]
+        elif os.path.exists(self.path):
+            file_names = [self.path]
+        else:
+            raise ValueError(f"No model file or directory at {self.path}.")
+        return {os.path.splitext(os.path.basename(name))[0]: name for name in file_names}
+
+    def scan(self):
+        """
+        Loads the new and modified model files and forgets the deleted ones.
+
+        Returns:
+        - tuple: The names of the models (re)loaded and the errors of the
+          files that could not be read (list of str).
+        """
+        files = self._files()
+        loaded, errors = [], []
+        for name, file_path in files.items():
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue  # Deleted since it was listed
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if self._signatures.get(name) == signature:
+                continue
+            self._signatures[name] = signature
+            try:
+                self.models[name] = LinearPredictor.load(file_path)
+            except (OSError, ValueError, KeyError) as e:
+                errors.append(f"{file_path}: {e}")
+                continue
+            loaded.append(name)
+        for name in set(self.models) - set(files):
+            del self.models[name]
+            self._signatures.pop(name, None)
+        return loaded, errors
+
+    def get(self, name=None):
+        """
+        Returns a model.
+
+        Parameters:
+        - name (str): The name of the model (may be omitted when a single
+          model is served).
+
+        Returns:
+        - LinearPredictor: The model.
+        """
+        if name is None:
+            if len(self.models) != 1:
+                raise LookupError("Several models are served: name the model of the request.")
+            return next(iter(self.models.values()))
+        try:
+            return self.models[name]
+        except KeyError:
+            raise LookupError(f"No model named '{name}'.") from None
+
+
+class MicroBatcher:
+    """
+    Coalesces the single-value predictions requested concurrently.
+
+    The first request for a model starts a timer of max_latency seconds; the
+    requests arriving before it expires, or until max_batch_size of them are
+    waiting, are predicted together with one vectorised call, which costs
+    about as much as predicting one of them.
+    """
+
+    def __init__(self, store, metrics, max_latency=DEFAULT_MAX_LATENCY_MS / 1000.0,
+                 max_batch_size=DEFAULT_MAX_BATCH_SIZE):
+        self.store = store
+        self.metrics = metrics
+        self.max_latency = max_latency
+        self.max_batch_size = max_batch_size
+        self._pending = {}  # Model name -> (values, futures, timer)
+
+    def submit(self, name, value):
+        """
+        Queues a value for prediction.
+
+        Parameters:
+        - name (str): The name of the model.
+        - value (float): The input value.
+
+        Returns:
+        - asyncio.Future: The prediction.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.get(name)
+        if pending is None:
+            timer = loop.call_later(self.max_latency, self.flush, name)
+            pending = self._pending[name] = ([], [], timer)
+        pending[0].append(value)
+        pending[1].append(future)
+        if len(pending[0]) >= self.max_batch_size:
+            self.flush(name)
+        return future
+
+    def flush(self, name):
+        """
+        Predicts the values waiting for a model with its current version.
+
+        Parameters:
+        - name (str): The name of the model.
+        """
+        pending = self._pending.pop(name, None)
+        if pending is None:
+            return
+        values, futures, timer = pending
+        timer.cancel()
+        self.metrics.record_batch(len(values))
+        try:
+            predictions = self.store.get(name).predict(np.array(values, dtype='float64'))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, prediction in zip(futures, predictions.tolist()):
+            if not future.done():  # The client may have gone away
+                future.set_result(prediction)
+
+    def flush_all(self):
+        """Predicts every waiting value."""
+        for name in list(self._pending):
+            self.flush(name)
+
+
+class PredictionServer:
+    """
+    A local HTTP/1.1 prediction server (on localhost or on a Unix socket)
+    running on asyncio.
+
+    Endpoints:
+    - POST /predict: {"model": name, "x": value or list of values}. A single
+      value is micro-batched with the concurrent requests (see MicroBatcher);
+      a list is predicted at once. The model may be omitted when a single
+      model is served.
+    - GET /models: The models served, with their columns and coefficients.
+    - GET /metrics: The throughput, latency and batch size histograms.
+    - GET /health: {"status": "ok"}.
+    """
+
+    def __init__(self, models_path, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_socket=None,
+                 max_latency_ms=DEFAULT_MAX_LATENCY_MS, max_batch_size=DEFAULT_MAX_BATCH_SIZE,
+                 reload_interval=DEFAULT_RELOAD_INTERVAL):
+        if max_latency_ms < 0 or max_batch_size < 1:
+            raise ValueError("The maximum latency must be positive and the maximum batch size at least 1.")
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.reload_interval = reload_interval
+        self.store = ModelStore(models_path)
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(self.store, self.metrics, max_latency_ms / 1000.0, max_batch_size)
+        self._server = None
+        self._reload_task = None
+        self._connections = {}  # Writer -> handler task of each open connection
+        self._busy = set()      # Writers of the connections answering a request
+        self._closing = False
+
+    def reload(self):
+        """
+        Reloads the model files changed on disk.
+
+        Returns:
+        - list: The names of the models (re)loaded.
+        """
+        loaded, errors = self.store.scan()
+        self.metrics.reloads += len(loaded)
+        self.metrics.reload_errors += len(errors)
+        for error in errors:
+            sys.stderr.write(f"Cannot load the model {error}\n")
+        return loaded
+
+    async def start(self):
+        """
+        Loads the models and starts listening.
+
+        Returns:
+        - str or int: The Unix socket path, or the port (useful with port 0).
+        """
+        self.reload()
+        self._closing = False
+        if self.unix_socket:
+            if os.path.exists(self.unix_socket):
+                os.remove(self.unix_socket)  # Left over by a previous run
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=self.unix_socket)
+            address = self.unix_socket
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+            address = self.port = self._server.sockets[0].getsockname()[1]
+        if self.reload_interval:
+            self._reload_task = asyncio.create_task(self._watch_models())
+        return address
+
+    async def serve_forever(self):
+        """Serves until the task is cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stops listening, answers the requests in progress and closes every
+        connection, waiting for their handlers to finish.
+        """
+        self._closing = True
+        if self._reload_task is not None:
+            self._reload_task.cancel()
+            await asyncio.gather(self._reload_task, return_exceptions=True)
+            self._reload_task = None
+        if self._server is not None:
+            self._server.close()
+        self.batcher.flush_all()
+
+        # Idle keep-alive connections are closed at once; the others once
+        # their request is answered (see _handle_connection).
+        for writer in list(self._connections):
+            if writer not in self._busy:
+                writer.close()
+        tasks = list(self._connections.values())
+        if tasks:
+            _, stalled = await asyncio.wait(tasks, timeout=CLOSE_TIMEOUT)
+            for task in stalled:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+
+    async def _watch_models(self):
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                self.reload()
+            except (OSError, ValueError) as e:
+                sys.stderr.write(f"Cannot scan the models: {e}\n")
+
+    async def _handle_connection(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while not self._closing:
+                try:
+                    message = await read_http_message(reader)
+                except PayloadTooLargeError as e:
+                    await self._respond(writer, 413, {'error': str(e)}, keep_alive=False)
+                    break
+                except ValueError as e:
+                    await self._respond(writer, 400, {'error': str(e)}, keep_alive=False)
+                    break
+                if message is None:
+                    break
+                self._busy.add(writer)
+                start_line, headers, body = message
+                started = time.perf_counter()
+                status, payload, predictions = await self._route(start_line, body)
+                keep_alive = headers.get('connection', '').lower() != 'close' and not self._closing
+                await self._respond(writer, status, payload, keep_alive)
+                self.metrics.record_request(time.perf_counter() - started, predictions, status != 200)
+                self._busy.discard(writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.LimitOverrunError):
+            pass
+        finally:
+            self._busy.discard(writer)
+            del self._connections[writer]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _respond(self, writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body
+        )
+        await writer.drain()
+
+    async def _route(self, start_line, body):
+        """
+        Serves a request.
+
+        Returns:
+        - tuple: The status, the JSON payload and the number of predictions.
+        """
+        method, _, target = start_line.partition(" ")
+        path = target.split(" ")[0].split("?")[0]
+        if path == "/predict":
+            if method != "POST":
+                return 405, {'error': "Use POST to predict."}, 0
+            return await self._predict(body)
+        if path in ("/models", "/metrics", "/health") and method != "GET":
+            return 405, {'error': f"Use GET for {path}."}, 0
+        if path == "/models":
+            return 200, {name: {'input_column': model.input_column,
+                                'output_column': model.output_column,
+                                'coef': model.coef_, 'intercept': model.intercept_}
+                         for name, model in self.store.models.items()}, 0
+        if path == "/metrics":
+            return 200, self.metrics.to_dict(), 0
+        if path == "/health":
+            return 200, {'status': "ok", 'models': len(self.store.models)}, 0
+        return 404, {'error': f"Unknown path {path}."}, 0
+
+    async def _predict(self, body):
+        try:
+            request = json.loads(body or b"{}")
+            name = request.get('model')
+            x = request['x']
+        except (ValueError, AttributeError, KeyError):
+            return 400, {'error': 'The body must be a JSON object like {"model": "name", "x": 1.5}.'}, 0
+        if name is not None and not isinstance(name, str):
+            return 400, {'error': "The model must be given by its name."}, 0
+        try:
+            if name is None:
+                name = next(iter(self.store.models)) if len(self.store.models) == 1 else None
+            model = self.store.get(name)
+        except LookupError as e:
+            return 404, {'error': str(e)}, 0
+
+        # Only a number or a flat list of numbers (null for a missing value).
+        if isinstance(x, list):
+            if not all(value is None or _is_number(value) for value in x):
+                return 400, {'error': "x must be a number or a list of numbers."}, 0
+            try:
+                values = np.array([np.nan if value is None else value for value in x], dtype='float64')
+            except OverflowError:
+                return 400, {'error': "x is too large."}, 0
+            predictions = model.predict(values)
+            return 200, {'model': name, 'predictions': [_json_value(value) for value in predictions]}, len(x)
+        if not _is_number(x):
+            return 400, {'error': "x must be a number or a list of numbers."}, 0
+        try:
+            prediction = await self.batcher.submit(name, float(x))
+        except OverflowError:
+            return 400, {'error': "x is too large."}, 0
+        except LookupError as e:  # The model was removed while the request waited
+            return 404, {'error': str(e)}, 0
+        return 200, {'model': name, 'prediction': _json_value(prediction)}, 1
+
+
+async def _serve(server):
+    address = await server.start()
+    sys.stderr.write(f"Serving {len(server.store.models)} model(s) on "
+                     f"{address if server.unix_socket else f'http://{server.host}:{address}'}\n")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    """
+    Serves saved models from the command line, e.g.:
+
+        python -m src.service.server models/ --port 8765 --max-latency-ms 2
+
+    Parameters:
+    - argv (list): The command line arguments (sys.argv[1:] if None).
+
+    Returns:
+    - int: The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve .pemodel and .json models over HTTP with micro-batched predictions."
+    )
+    parser.add_argument("models", help="A model file or a directory of model files (reloaded when they change).")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="The address listened on.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="The port listened on.")
+    parser.add_argument("--unix-socket", help="Listen on this Unix socket instead of a port.")
+    parser.add_argument("--max-latency-ms", type=float, default=DEFAULT_MAX_LATENCY_MS,
+                        help="The longest wait for other requests to batch with.")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="The largest number of requests predicted together.")
+    parser.add_argument("--reload-interval", type=float, default=DEFAULT_RELOAD_INTERVAL,
+                        help="Seconds between checks of the model files (0 disables hot reload).")
+    args = parser.parse_args(argv)
+
+    try:
+        server = PredictionServer(args.models, args.host, args.port, args.unix_socket,
+                                  args.max_latency_ms, args.max_batch_size, args.reload_interval)
+        asyncio.run(_serve(server))
+    except KeyboardInterrupt:
+        pass
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
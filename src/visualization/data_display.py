@@ -11,6 +11,9 @@ def display_dataframe_in_treeview(df, parent_frame):
     Parameters:
     - df (pd.DataFrame): The DataFrame to display.
     - parent_frame (tk.Frame): The parent frame to place the Treeview in.
+
+    Returns:
+    - ttk.Treeview: The Treeview holding the data.
     """
     # Destroy all existing widgets in the parent frame
     for widget in parent_frame.winfo_children():
@@ -44,5 +47,17 @@ def display_dataframe_in_treeview(df, parent_frame):
         tree.column(col, anchor="center", width=100)
 
     # Insert the data into the table
+    append_dataframe_to_treeview(df, tree)
+    return tree
+
+
+def append_dataframe_to_treeview(df, tree):
+    """
+    Appends the rows of a DataFrame to an existing Treeview.
+
+    Parameters:
+    - df (pd.DataFrame): The rows to append (same columns as the Treeview).
+    - tree (ttk.Treeview): The Treeview created by display_dataframe_in_treeview.
+    """
     for _, row in df.iterrows():
         tree.insert("", "end", values=list(row))
@@ -1,8 +1,36 @@
 # src/visualization/plotting.py
 
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# Maximum number of points drawn in a scatter plot.
+MAX_PLOT_POINTS = 5000
+
+
+def downsample_points(X, y, max_points=MAX_PLOT_POINTS, seed=0):
+    """
+    Picks at most max_points (X, y) pairs at random, so that large datasets
+    can be plotted quickly.
+
+    Parameters:
+    - X (array-like): Feature values (vector or single-column matrix).
+    - y (array-like): Target values.
+    - max_points (int): The maximum number of points kept.
+    - seed (int): The seed of the random selection.
+
+    Returns:
+    - np.ndarray: The selected feature values, as a single-column matrix.
+    - np.ndarray: The matching target values.
+    """
+    X = np.asarray(X).reshape(-1, 1)
+    y = np.asarray(y).reshape(-1)
+    if len(y) > max_points:
+        rng = np.random.default_rng(seed)
+        keep = np.sort(rng.choice(len(y), max_points, replace=False))
+        X, y = X[keep], y[keep]
+    return X, y
+
 
 def plot_regression_line(X, y, predictions,
                          input_var, output_var, parent_frame):
@@ -28,3 +56,34 @@ def plot_regression_line(X, y, predictions,
     canvas = FigureCanvasTkAgg(fig, master=parent_frame)
     canvas.draw()
     canvas.get_tk_widget().pack(fill="both", expand=True)
+
+
+def plot_r2_heatmap(matrix, parent_frame, max_labels=40):
+    """
+    Plots the R² of every (input, output) pair as a heatmap.
+
+    Parameters:
+    - matrix (pd.DataFrame): The R² with the inputs as rows and the outputs
+      as columns (see r2_matrix).
+    - parent_frame (tk.Frame): The parent frame to place the plot in.
+    - max_labels (int): The axes are only labelled with the column names
+      when there are at most this many columns.
+    """
+    fig, ax = plt.subplots(figsize=(6, 5))
+    image = ax.imshow(matrix.to_numpy(dtype='float64'), cmap="viridis", vmin=0, vmax=1,
+                      aspect="auto", interpolation="nearest")
+    if len(matrix.index) <= max_labels:
+        ax.set_yticks(range(len(matrix.index)))
+        ax.set_yticklabels(matrix.index, fontsize=7)
+    if len(matrix.columns) <= max_labels:
+        ax.set_xticks(range(len(matrix.columns)))
+        ax.set_xticklabels(matrix.columns, rotation=90, fontsize=7)
+    ax.set_xlabel("Output")
+    ax.set_ylabel("Input")
+    ax.set_title("R² of Simple Regressions")
+    fig.colorbar(image, ax=ax)
+    fig.tight_layout()
+
+    canvas = FigureCanvasTkAgg(fig, master=parent_frame)
+    canvas.draw()
+    canvas.get_tk_widget().pack(fill="both", expand=True)
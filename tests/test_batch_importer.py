@@ -0,0 +1,70 @@
+# tests/test_batch_importer.py
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import pandas as pd
+from src.data.batch_importer import expand_sources, import_files
+
+
+class TestBatchImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        pd.DataFrame({'x': [1, 2], 'y': [1.5, 2.5]}).to_csv(
+            self._path('day1.csv'), index=False)
+        pd.DataFrame({'x': [3], 'y': [3.5], 'z': ['extra']}).to_csv(
+            self._path('day2.csv'), index=False)
+        with open(self._path('notes.txt'), 'w') as handle:
+            handle.write("not a dataset")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_expand_directory(self):
+        self.assertEqual(expand_sources(self.temp_dir.name),
+                         [self._path('day1.csv'), self._path('day2.csv')])
+
+    def test_expand_pattern(self):
+        self.assertEqual(expand_sources(self._path('day2*')), [self._path('day2.csv')])
+
+    def test_import_files(self):
+        df, failures = import_files(self.temp_dir.name, max_workers=2,
+                                    source_column='source_file')
+        self.assertEqual(failures, {})
+        self.assertEqual(df['x'].tolist(), [1, 2, 3])
+        self.assertEqual(list(df.columns), ['x', 'y', 'z', 'source_file'])
+        self.assertTrue(df['z'].isnull().sum() == 2)
+        self.assertEqual(df['source_file'].tolist(),
+                         ['day1.csv', 'day1.csv', 'day2.csv'])
+
+    def test_workers_are_spawned(self):
+        with mock.patch('src.data.batch_importer.ProcessPoolExecutor',
+                        wraps=ProcessPoolExecutor) as executor:
+            import_files(self.temp_dir.name, max_workers=8)
+        self.assertEqual(executor.call_args.kwargs['max_workers'], 2)
+        self.assertEqual(executor.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+
+    def test_source_column_must_be_new(self):
+        with self.assertRaises(ValueError):
+            import_files(self.temp_dir.name, max_workers=2, source_column='z')
+
+    def test_failures_do_not_abort_batch(self):
+        with open(self._path('broken.csv'), 'w') as handle:
+            handle.write("a,b\n1,2,3\n")
+        df, failures = import_files(self.temp_dir.name, max_workers=2)
+        self.assertEqual(list(failures), [self._path('broken.csv')])
+        self.assertEqual(len(df), 3)
+
+    def test_no_matching_files(self):
+        with self.assertRaises(ValueError):
+            expand_sources(self._path('*.xlsx'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+# tests/test_batch_predict.py
+
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.file_importer import ImportCancelledError
+from src.data.pipeline import PreprocessingPipeline
+from src.models.batch_predict import predict_file
+from src.models.regression import LinearRegressionModel
+
+
+class TestBatchPredict(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model = LinearRegressionModel()
+        self.model.fit(np.array([[1.0], [2.0], [3.0]]), np.array([5.0, 7.0, 9.0]))
+        self.df = pd.DataFrame({
+            'id': range(250),
+            'x': np.arange(250, dtype='float64'),
+            'label': [f"row{i}" for i in range(250)],
+        })
+        self.df.loc[3, 'x'] = np.nan
+        self.csv_path = self.path('input.csv')
+        self.df.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def expected(self):
+        return 2.0 * self.df['x'] + 3.0
+
+    def test_csv_to_csv(self):
+        progress = []
+        summary = predict_file(
+            self.model, self.csv_path, self.path('out.csv'), 'x', chunk_size=40,
+            progress_callback=lambda *args: progress.append(args)
+        )
+        result = pd.read_csv(self.path('out.csv'))
+        self.assertEqual(summary['rows'], 250)
+        self.assertEqual(list(result.columns), ['id', 'x', 'label', 'prediction'])
+        np.testing.assert_allclose(result['prediction'], self.expected())
+        self.assertTrue(np.isnan(result.loc[3, 'prediction']))
+        self.assertEqual(len(progress), 7)
+        self.assertEqual(progress[-1][1], 250)
+
+    def test_parquet_keeps_selected_columns(self):
+        output_path = self.path('out.parquet')
+        predict_file(self.model, self.csv_path, output_path, 'x', output_column='y_hat',
+                     keep_columns=['label'], chunk_size=100)
+        result = pd.read_parquet(output_path)
+        self.assertEqual(list(result.columns), ['label', 'x', 'y_hat'])
+        np.testing.assert_allclose(result['y_hat'], self.expected())
+
+    def test_sqlite_into_the_input_file(self):
+        db_path = self.path('data.db')
+        with sqlite3.connect(db_path) as connection:
+            self.df.to_sql('measures', connection, index=False)
+        predict_file(self.model, db_path, db_path, 'x', options={'table_name': 'measures'},
+                     table_name='scored', chunk_size=60)
+        with sqlite3.connect(db_path) as connection:
+            result = pd.read_sql("SELECT * FROM scored", connection)
+        np.testing.assert_allclose(result['prediction'], self.expected())
+        self.assertEqual(os.listdir(self.temp_dir.name).count('data.db'), 1)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), 2)
+
+    def test_sqlite_table_is_replaced_only_when_complete(self):
+        db_path = self.path('scores.db')
+        with sqlite3.connect(db_path) as connection:
+            connection.execute("CREATE TABLE preds (prediction REAL)")
+            connection.execute("INSERT INTO preds VALUES (1.5)")
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(ImportCancelledError):
+            predict_file(self.model, self.csv_path, db_path, 'x', table_name='preds',
+                         cancel_event=cancel_event)
+        with sqlite3.connect(db_path) as connection:
+            self.assertEqual(connection.execute("SELECT * FROM preds").fetchall(), [(1.5,)])
+
+        predict_file(self.model, self.csv_path, db_path, 'x', table_name='preds', chunk_size=70)
+        with sqlite3.connect(db_path) as connection:
+            result = pd.read_sql("SELECT * FROM preds", connection)
+        np.testing.assert_allclose(result['prediction'], self.expected())
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ['input.csv', 'scores.db'])
+
+    def test_preprocessing_is_replayed(self):
+        # The training data had a mean of 10 for x.
+        pipeline = PreprocessingPipeline().fill_nan('mean', values={'x': 10.0})
+        predict_file(self.model, self.csv_path, self.path('out.csv'), 'x', chunk_size=40,
+                     keep_columns=['id'], pipeline=pipeline)
+        result = pd.read_csv(self.path('out.csv'))
+        self.assertEqual(result.loc[3, 'x'], 10.0)
+        self.assertEqual(result.loc[3, 'prediction'], 23.0)
+        np.testing.assert_allclose(result['prediction'].drop(3), self.expected().drop(3))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            predict_file(self.model, self.csv_path, self.path('out.csv'), 'label')
+        with self.assertRaises(ValueError):
+            predict_file(self.model, self.csv_path, self.path('out.csv'), 'x',
+                         output_column='id')
+        with self.assertRaises(ValueError):
+            predict_file(self.model, self.csv_path, self.path('out.json'), 'x')
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(ImportCancelledError):
+            predict_file(self.model, self.csv_path, self.path('out.csv'), 'x',
+                         cancel_event=cancel_event)
+
+    def test_output_is_replaced_only_when_complete(self):
+        # A failed prediction leaves the existing output untouched.
+        output_path = self.path('out.parquet')
+        predict_file(self.model, self.csv_path, output_path, 'x')
+        with self.assertRaises(ValueError):
+            predict_file(self.model, self.csv_path, output_path, 'label')
+        self.assertEqual(len(pd.read_parquet(output_path)), 250)
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ['input.csv', 'out.parquet'])
+
+        # Predicting a file onto itself does not truncate the input.
+        predict_file(self.model, self.csv_path, self.csv_path, 'x', chunk_size=40)
+        result = pd.read_csv(self.csv_path)
+        self.assertEqual(len(result), 250)
+        np.testing.assert_allclose(result['prediction'], self.expected())
+
+if __name__ == '__main__':
+    unittest.main()
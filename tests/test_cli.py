@@ -0,0 +1,134 @@
+# tests/test_cli.py
+
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.cli import main
+from src.data.pipeline import PreprocessingPipeline
+from src.models.model_io import load_model_data
+from src.models.runtime import LinearPredictor
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_cli(*argv):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+        status = main(list(argv))
+    return status, output.getvalue()
+
+
+class TestCommandLine(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = self.path("data.csv")
+        x = np.arange(20, dtype='float64')
+        y = 2.0 * x + 1.0 + np.tile([0.5, -0.5], 10)
+        x[3] = np.nan
+        pd.DataFrame({'x': x, 'y': y}).to_csv(self.data_path, index=False)
+        self.model_path = self.path("model.pemodel")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_profile_and_clean(self):
+        status, output = run_cli("profile", self.data_path)
+        self.assertEqual(status, 0)
+        self.assertIn("20 rows, 2 columns", output)
+
+        self.assertEqual(run_cli("clean", self.data_path, self.path("clean.csv"), "--method", "constant",
+                                 "--value", "0")[0], 0)
+        self.assertEqual(pd.read_csv(self.path("clean.csv"))['x'][3], 0.0)
+        self.assertEqual(run_cli("clean", self.data_path, self.path("clean.parquet"))[0], 0)
+        self.assertEqual(len(pd.read_parquet(self.path("clean.parquet"))), 19)
+        self.assertEqual(run_cli("clean", self.data_path, self.path("clean.csv"), "--method", "constant")[0], 1)
+
+    def test_fit_evaluate_and_export(self):
+        status, output = run_cli("fit", self.data_path, self.model_path,
+                                 "--input-column", "x", "--output-column", "y")
+        self.assertEqual(status, 0)
+        self.assertIn("(19 rows)", output)
+        model_data = load_model_data(self.model_path)
+        self.assertEqual(model_data['input_column'], 'x')
+        self.assertAlmostEqual(model_data['model'].coef_, 2.0, places=1)
+
+        status, output = run_cli("evaluate", self.data_path, "--model", self.model_path, "--resamples", "50")
+        self.assertEqual(status, 0)
+        self.assertIn("CV R²", output)
+        self.assertIn("Coef. 95% CI", output)
+
+        self.assertEqual(run_cli("export", self.model_path, self.path("model.json"))[0], 0)
+        self.assertEqual(run_cli("export", self.path("model.json"), self.path("model.joblib"))[0], 0)
+        self.assertAlmostEqual(load_model_data(self.path("model.joblib"))['model'].intercept_,
+                               model_data['model'].intercept_)
+        self.assertEqual(run_cli("export", self.model_path, self.path("model.txt"))[0], 1)
+
+    def test_predict(self):
+        LinearPredictor(2.0, 1.0, 'x', 'y').save(self.path("model.json"))
+        self.assertEqual(run_cli("predict", self.path("model.json"), "--x", "1", "", "1.5"),
+                         (0, "3.0\nnan\n4.0\n"))
+
+        self.assertEqual(run_cli("predict", self.path("model.json"), self.data_path,
+                                 "-o", self.path("predictions.csv"))[0], 0)
+        predictions = pd.read_csv(self.path("predictions.csv"))
+        self.assertEqual(list(predictions.columns), ['x', 'y', 'prediction'])
+        self.assertEqual(predictions['prediction'][0], 1.0)
+        self.assertTrue(np.isnan(predictions['prediction'][3]))
+
+        self.assertEqual(run_cli("predict", self.path("model.json"), self.data_path,
+                                 "-o", self.path("predictions.parquet"))[0], 0)
+        self.assertEqual(len(pd.read_parquet(self.path("predictions.parquet"))), 20)
+        self.assertEqual(run_cli("predict", self.path("model.json"), self.data_path,
+                                 "--input-column", "z")[0], 1)
+
+    def test_predict_file_with_joblib_model(self):
+        model_path = self.path("model.joblib")
+        self.assertEqual(run_cli("fit", self.data_path, model_path,
+                                 "--input-column", "x", "--output-column", "y")[0], 0)
+        self.assertEqual(run_cli("predict", model_path, self.data_path, "-o", self.path("out.csv"),
+                                 "--keep-columns", "y", "--chunk-size", "7")[0], 0)
+        result = pd.read_csv(self.path("out.csv"))
+        self.assertEqual(list(result.columns), ['y', 'x', 'prediction'])
+        expected = load_model_data(model_path)['model'].predict(result[['x']].fillna(0).to_numpy())
+        np.testing.assert_allclose(result['prediction'].dropna(), expected[result['x'].notna()])
+
+        # The input file can be predicted in place.
+        self.assertEqual(run_cli("predict", model_path, self.data_path, "-o", self.data_path)[0], 0)
+        self.assertEqual(list(pd.read_csv(self.data_path).columns), ['x', 'y', 'prediction'])
+        self.assertEqual(run_cli("predict", model_path, self.path("missing.csv"), "-o",
+                                 self.path("out.csv"))[0], 1)
+
+    def test_predict_replays_the_preprocessing(self):
+        LinearPredictor(2.0, 1.0, 'x', 'y', metadata={'preprocessing': PreprocessingPipeline().fill_nan(
+            'mean', values={'x': 10.0}).to_dict()}).save(self.path("model.json"))
+        self.assertEqual(run_cli("predict", self.path("model.json"), self.data_path,
+                                 "-o", self.path("predictions.csv"))[0], 0)
+        self.assertEqual(pd.read_csv(self.path("predictions.csv"))['prediction'][3], 21.0)
+
+    def test_predict_pipeline_does_not_import_heavy_modules(self):
+        LinearPredictor(2.0, 1.0, 'x', 'y').save(self.path("model.json"))
+        script = (
+            "import sys\n"
+            "from src.cli import main\n"
+            f"status = main(['predict', {self.path('model.json')!r}])\n"
+            "heavy = sorted(name for name in ('numpy', 'pandas', 'sklearn', 'tkinter') if name in sys.modules)\n"
+            "sys.stderr.write(str(heavy))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, input="x,id\n2,a\n,b\n",
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout, "x,id,prediction\n2,a,5.0\n,b,\n")
+        self.assertEqual(result.stderr, "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
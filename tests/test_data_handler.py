@@ -1,8 +1,9 @@
 # tests/test_data_handler.py
 
 import unittest
+import numpy as np
 import pandas as pd
-from src.data.data_handler import handle_nan_values
+from src.data.data_handler import handle_nan_values, fill_nan_values
 
 
 class TestDataHandler(unittest.TestCase):
@@ -38,16 +39,42 @@ class TestDataHandler(unittest.TestCase):
         pd.testing.assert_frame_equal(df_processed, expected_df)
 
     def test_fill_with_constant(self):
-        # Mock the simpledialog to return a constant value
-        from unittest.mock import patch
-        with patch('src.data.data_handler.simpledialog.askstring',
-                   return_value='10'):
-            df_processed, message = handle_nan_values(self.df.copy(), "4")
+        df_processed, message = handle_nan_values(self.df.copy(), "4", constant_value=10)
         expected_df = self.df.copy()
         expected_df['A'] = expected_df['A'].fillna(10)
         expected_df['B'] = expected_df['B'].fillna(10)
         pd.testing.assert_frame_equal(df_processed, expected_df)
 
+    def test_fill_with_constant_requires_value(self):
+        with self.assertRaises(ValueError):
+            handle_nan_values(self.df.copy(), "4")
+
+    def test_fill_all_numeric_dtypes(self):
+        df = pd.DataFrame({
+            'f32': np.array([1.0, np.nan, 3.0], dtype='float32'),
+            'nullable': pd.array([1, None, 4], dtype='Int64'),
+            'ints': [1, 2, 3]
+        })
+        df_processed, filled = fill_nan_values(df, "mean")
+        self.assertEqual(df_processed['f32'].dtype, np.float32)
+        self.assertEqual(df_processed['f32'].tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(df_processed['nullable'].tolist(), [1.0, 2.5, 4.0])
+        self.assertEqual(filled.to_dict(), {'f32': 1, 'nullable': 1})
+        # The original DataFrame is left untouched
+        self.assertTrue(df['f32'].isnull().any())
+
+    def test_fill_inplace(self):
+        df = self.df.copy()
+        df_processed, filled = fill_nan_values(df, "constant", 0, inplace=True)
+        self.assertIs(df_processed, df)
+        self.assertFalse(df[['A', 'B']].isnull().any().any())
+        self.assertEqual(filled.to_dict(), {'A': 1, 'B': 1})
+
+    def test_fill_message_reports_counts(self):
+        df_processed, message = handle_nan_values(self.df.copy(), "3")
+        self.assertIn("A (1)", message)
+        self.assertIn("B (1)", message)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,67 @@
+# tests/test_dataset_cache.py
+
+import os
+import tempfile
+import unittest
+import pandas as pd
+from src.data.dataset_cache import DatasetCache
+from src.data.file_importer import import_file
+
+
+class TestDatasetCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DatasetCache(os.path.join(self.temp_dir.name, 'cache'))
+        self.df = pd.DataFrame({'x': [1, 2, 3], 'y': [2.0, 4.0, None]})
+        self.csv_path = self._write_csv('data.csv', self.df)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write_csv(self, name, df):
+        path = os.path.join(self.temp_dir.name, name)
+        df.to_csv(path, index=False)
+        return path
+
+    def test_store_and_load(self):
+        self.assertIsNone(self.cache.load(self.csv_path))
+        self.assertTrue(self.cache.store(self.csv_path, self.df))
+        pd.testing.assert_frame_equal(self.cache.load(self.csv_path), self.df)
+
+    def test_import_file_uses_cache(self):
+        df_first = import_file(self.csv_path, cache=self.cache)
+        self.assertEqual(len(self.cache.entries()), 1)
+        df_second = import_file(self.csv_path, cache=self.cache)
+        pd.testing.assert_frame_equal(df_first, df_second)
+
+    def test_modified_file_invalidates_entry(self):
+        self.cache.store(self.csv_path, self.df)
+        modified = pd.DataFrame({'x': [7, 8], 'y': [1.0, 2.0]})
+        modified.to_csv(self.csv_path, index=False)
+        self.assertIsNone(self.cache.load(self.csv_path))
+        self.assertEqual(self.cache.entries(), [])
+
+    def test_lru_eviction(self):
+        self.cache.store(self.csv_path, self.df)
+        entry_size = self.cache.total_size()
+        self.cache.max_bytes = entry_size * 2
+        second_path = self._write_csv('second.csv', self.df)
+        third_path = self._write_csv('third.csv', self.df)
+        self.cache.store(second_path, self.df)
+        # Touch the first entry so the second one becomes the oldest
+        self.cache.load(self.csv_path)
+        self.cache.store(third_path, self.df)
+        cached_paths = {entry['source_path'] for entry in self.cache.entries()}
+        self.assertEqual(cached_paths, {os.path.abspath(self.csv_path),
+                                        os.path.abspath(third_path)})
+
+    def test_clear(self):
+        self.cache.store(self.csv_path, self.df)
+        self.cache.clear()
+        self.assertEqual(self.cache.entries(), [])
+        self.assertEqual(self.cache.total_size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
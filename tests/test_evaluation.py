@@ -0,0 +1,61 @@
+# tests/test_evaluation.py
+
+import unittest
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_squared_error, r2_score
+from src.models.evaluation import bootstrap_coefficients, cross_validate
+
+
+class TestEvaluation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.normal(1000.0, 5.0, 1000)
+        self.y = 3.0 * self.x - 7.0 + rng.normal(0.0, 2.0, 1000)
+
+    def test_cross_validation_matches_refits(self):
+        result = cross_validate(self.x, self.y, k=5, seed=3)
+        folds = np.random.default_rng(3).permutation(len(self.x)) % 5
+        for fold in range(5):
+            train = folds != fold
+            model = LinearRegression().fit(self.x[train, None], self.y[train])
+            predictions = model.predict(self.x[~train, None])
+            self.assertAlmostEqual(result['r2'][fold], r2_score(self.y[~train], predictions), places=8)
+            self.assertAlmostEqual(result['mse'][fold],
+                                   mean_squared_error(self.y[~train], predictions), places=6)
+        self.assertAlmostEqual(result['r2_mean'], result['r2'].mean())
+
+    def test_cross_validation_ignores_nan_and_checks_size(self):
+        x = self.x.copy()
+        x[:10] = np.nan
+        self.assertEqual(len(cross_validate(x, self.y, k=4)['r2']), 4)
+        with self.assertRaises(ValueError):
+            cross_validate(self.x[:5], self.y[:5], k=5)
+        with self.assertRaisesRegex(ValueError, "at least 10 rows .* only 2 remain after dropping "
+                                                "the 10 rows with a missing value"):
+            cross_validate(x[:12], self.y[:12], k=5)
+
+    def test_bootstrap_intervals(self):
+        result = bootstrap_coefficients(self.x, self.y, n_resamples=500, seed=1, batch_cells=30000)
+        low, high = result['coef_ci']
+        self.assertLess(low, 3.0)
+        self.assertGreater(high, 3.0)
+        # The standard error of the slope predicted by the OLS theory.
+        residuals = self.y - np.polyval(np.polyfit(self.x, self.y, 1), self.x)
+        expected_se = np.sqrt(residuals.var(ddof=2) / ((self.x - self.x.mean()) ** 2).sum())
+        self.assertAlmostEqual(result['coef_se'] / expected_se, 1.0, delta=0.15)
+        self.assertEqual(len(result['coefs']), 500)
+        intercept_low, intercept_high = result['intercept_ci']
+        self.assertLess(intercept_low, intercept_high)
+
+    def test_bootstrap_does_not_depend_on_batches(self):
+        first = bootstrap_coefficients(self.x, self.y, n_resamples=50, seed=2, batch_cells=3000)
+        second = bootstrap_coefficients(self.x, self.y, n_resamples=50, seed=2, batch_cells=10 ** 6)
+        np.testing.assert_allclose(first['coefs'], second['coefs'], rtol=1e-10)
+        with self.assertRaises(ValueError):
+            bootstrap_coefficients(self.x, self.y, confidence=1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+# tests/test_file_importer.py
+
+import bz2
+import gzip
+import lzma
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+import pandas as pd
+from src.data.compression import detect_compression, get_file_extension
+from src.data.file_importer import (import_file, iter_csv_chunks,
+                                    import_csv_in_chunks, list_sqlite_tables,
+                                    iter_sqlite_chunks, list_excel_sheets,
+                                    iter_excel_chunks, sample_file,
+                                    ImportCancelledError)
+
+
+class TestFileImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame({
+            'x': range(100),
+            'y': [value * 2.5 for value in range(100)],
+            'label': ['a', 'b'] * 50
+        })
+        self.csv_path = os.path.join(self.temp_dir.name, 'data.csv')
+        self.df.to_csv(self.csv_path, index=False)
+
+        self.db_path = os.path.join(self.temp_dir.name, 'data.db')
+        connection = sqlite3.connect(self.db_path)
+        pd.DataFrame({'z': [1, 2]}).to_sql('small', connection, index=False)
+        self.df.to_sql('values', connection, index=False)
+        connection.close()
+
+        self.xlsx_path = os.path.join(self.temp_dir.name, 'data.xlsx')
+        with pd.ExcelWriter(self.xlsx_path, engine='openpyxl') as writer:
+            pd.DataFrame({'z': [1, 2]}).to_excel(writer, sheet_name='small', index=False)
+            self.df.to_excel(writer, sheet_name='values', index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_import_csv(self):
+        df_imported = import_file(self.csv_path)
+        pd.testing.assert_frame_equal(df_imported, pd.read_csv(self.csv_path))
+
+    def test_iter_csv_chunks_progress(self):
+        chunks = list(iter_csv_chunks(self.csv_path, chunk_size=30))
+        self.assertEqual([len(chunk) for chunk, _ in chunks], [30, 30, 30, 10])
+        progresses = [progress for _, progress in chunks]
+        self.assertEqual(progresses, sorted(progresses))
+        self.assertAlmostEqual(progresses[-1], 100.0)
+
+    def test_import_csv_in_chunks(self):
+        received = []
+        df_imported = import_csv_in_chunks(
+            self.csv_path, chunk_size=40,
+            chunk_callback=lambda chunk, is_first: received.append(is_first)
+        )
+        self.assertEqual(received, [True, False, False])
+        pd.testing.assert_frame_equal(df_imported, pd.read_csv(self.csv_path))
+
+    def test_import_csv_in_chunks_cancelled(self):
+        cancel_event = threading.Event()
+        with self.assertRaises(ImportCancelledError):
+            import_csv_in_chunks(
+                self.csv_path, chunk_size=10,
+                progress_callback=lambda progress: cancel_event.set(),
+                cancel_event=cancel_event
+            )
+
+    def test_file_is_closed_when_chunks_are_not_consumed(self):
+        handles = []
+
+        def recording_open(*args, **kwargs):
+            handles.append(open(*args, **kwargs))
+            return handles[-1]
+
+        with mock.patch('src.data.file_importer.open', side_effect=recording_open, create=True):
+            chunks = iter_csv_chunks(self.csv_path, chunk_size=10)
+            next(chunks)
+            chunks.close()
+            cancel_event = threading.Event()
+            with self.assertRaises(ImportCancelledError):
+                import_csv_in_chunks(self.csv_path, chunk_size=10, cancel_event=cancel_event,
+                                     chunk_callback=lambda chunk, is_first: cancel_event.set())
+        self.assertEqual(len(handles), 2)
+        self.assertTrue(all(handle.closed for handle in handles))
+
+    def test_list_sqlite_tables(self):
+        self.assertEqual(list_sqlite_tables(self.db_path),
+                         [('small', 2), ('values', 100)])
+
+    def test_import_sqlite_first_table_by_default(self):
+        df_imported = import_file(self.db_path)
+        self.assertEqual(list(df_imported.columns), ['z'])
+
+    def test_import_sqlite_push_down(self):
+        df_imported = import_file(self.db_path, options={
+            'table_name': 'values',
+            'columns': ['x', 'y'],
+            'where': 'x >= ?',
+            'params': [10],
+            'limit': 5
+        })
+        self.assertEqual(list(df_imported.columns), ['x', 'y'])
+        self.assertEqual(df_imported['x'].tolist(), [10, 11, 12, 13, 14])
+
+        # A value cannot change the statement it is bound to.
+        chunks = list(iter_sqlite_chunks(self.db_path, 'values', where='x = ?',
+                                         params=["0 OR 1 = 1"]))
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(chunks[0][0].empty)
+
+    def test_import_sqlite_sample(self):
+        df_imported = import_file(self.db_path, options={
+            'table_name': 'values', 'limit': 20, 'sample': True
+        })
+        self.assertEqual(len(df_imported), 20)
+        self.assertEqual(df_imported['x'].nunique(), 20)
+
+    def test_iter_sqlite_chunks(self):
+        chunks = list(iter_sqlite_chunks(self.db_path, 'values', chunk_size=40))
+        self.assertEqual([len(chunk) for chunk, _ in chunks], [40, 40, 20])
+        self.assertEqual([progress for _, progress in chunks], [40.0, 80.0, 100.0])
+
+        # The progress counts the rows selected by the filter and the limit.
+        chunks = list(iter_sqlite_chunks(self.db_path, 'values', where='x < ?', params=[50],
+                                         limit=40, sample=True, chunk_size=10))
+        self.assertEqual([progress for _, progress in chunks], [25.0, 50.0, 75.0, 100.0])
+        chunks = list(iter_sqlite_chunks(self.db_path, 'values', chunk_size=40, count_rows=False))
+        self.assertEqual([progress for _, progress in chunks], [0.0, 0.0, 100.0])
+
+    def test_import_sqlite_unknown_column(self):
+        with self.assertRaises(ValueError):
+            import_file(self.db_path, options={'table_name': 'values',
+                                               'columns': ['missing']})
+
+    def test_list_excel_sheets(self):
+        self.assertEqual(list_excel_sheets(self.xlsx_path), ['small', 'values'])
+
+    def test_import_excel_first_sheet_by_default(self):
+        df_imported = import_file(self.xlsx_path)
+        pd.testing.assert_frame_equal(df_imported, pd.DataFrame({'z': [1, 2]}))
+
+    def test_import_excel_sheet_and_columns(self):
+        progresses = []
+        df_imported = import_file(
+            self.xlsx_path,
+            options={'sheet_name': 'values', 'columns': ['label', 'y']},
+            progress_callback=progresses.append
+        )
+        pd.testing.assert_frame_equal(df_imported, self.df[['label', 'y']])
+        self.assertEqual(progresses[-1], 100.0)
+
+    def test_iter_excel_chunks(self):
+        chunks = list(iter_excel_chunks(self.xlsx_path, 'values', chunk_size=30))
+        self.assertEqual([len(chunk) for chunk, _ in chunks], [30, 30, 30, 10])
+
+    def _write_compressed(self, extension, compress):
+        path = f"{self.csv_path}.{extension}"
+        with open(self.csv_path, 'rb') as source, open(path, 'wb') as target:
+            target.write(compress(source.read()))
+        return path
+
+    def test_detect_compression(self):
+        self.assertIsNone(detect_compression(self.csv_path))
+        self.assertEqual(detect_compression(self._write_compressed('gz', gzip.compress)), 'gzip')
+        self.assertEqual(detect_compression(self._write_compressed('bz2', bz2.compress)), 'bz2')
+        self.assertEqual(detect_compression(self._write_compressed('xz', lzma.compress)), 'xz')
+        self.assertEqual(get_file_extension('exports/day.csv.gz'), 'csv')
+
+    def test_import_compressed_csv(self):
+        expected_df = pd.read_csv(self.csv_path)
+        for extension, compress in [('gz', gzip.compress), ('bz2', bz2.compress),
+                                    ('xz', lzma.compress)]:
+            path = self._write_compressed(extension, compress)
+            pd.testing.assert_frame_equal(import_file(path), expected_df)
+            pd.testing.assert_frame_equal(
+                import_csv_in_chunks(path, chunk_size=30), expected_df)
+
+    def test_compressed_progress_reaches_end(self):
+        path = self._write_compressed('gz', gzip.compress)
+        progresses = [progress for _, progress in iter_csv_chunks(path, chunk_size=30)]
+        self.assertAlmostEqual(progresses[-1], 100.0)
+
+    def test_sample_file(self):
+        df_with_nans = self.df.copy()
+        df_with_nans.loc[[5, 50, 95], 'y'] = None
+        df_with_nans.to_csv(self.csv_path, index=False)
+        sample, stats = sample_file(self.csv_path, 10, seed=1, chunk_size=7)
+        self.assertEqual(len(sample), 10)
+        # The sampled rows are distinct, unchanged and in file order
+        self.assertEqual(sample['x'].tolist(), sorted(set(sample['x'])))
+        pd.testing.assert_frame_equal(
+            sample, df_with_nans.loc[sample['x']].reset_index(drop=True),
+            check_dtype=False)
+        # The counts cover the whole file, not only the sample
+        self.assertEqual(stats.loc['y', 'rows'], 100)
+        self.assertEqual(stats.loc['y', 'nan_count'], 3)
+        self.assertEqual(stats.loc['x', 'nan_count'], 0)
+
+    def test_sample_file_is_uniform(self):
+        counts = pd.Series(0, index=range(100))
+        for seed in range(100):
+            sample, _ = sample_file(self.csv_path, 10, seed=seed, chunk_size=30)
+            counts[sample['x']] += 1
+        # Each row is expected 10 times; the first and last chunks must not be favoured
+        self.assertLess(abs(counts[:30].mean() - counts[70:].mean()), 3)
+
+    def test_sample_larger_than_file(self):
+        sample, stats = sample_file(self.db_path, 1000, options={'table_name': 'values'})
+        self.assertEqual(len(sample), 100)
+
+    def test_unsupported_format(self):
+        with self.assertRaises(ValueError):
+            import_file(os.path.join(self.temp_dir.name, 'data.txt'))
+
+
+if __name__ == '__main__':
+    unittest.main()
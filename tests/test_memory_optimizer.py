@@ -0,0 +1,52 @@
+# tests/test_memory_optimizer.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.memory_optimizer import compact_dtypes
+from src.data.file_importer import validate_dataframe
+from src.data.data_handler import handle_nan_values
+
+
+class TestMemoryOptimizer(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'small_int': np.arange(1000, dtype='int64') % 100,
+            'exact_float': np.arange(1000, dtype='float64'),
+            'precise_float': np.linspace(0, 1, 1000),
+            'label': ['north', 'south'] * 500,
+            'name': [f"row {i}" for i in range(1000)]
+        })
+        self.df.loc[3, 'exact_float'] = np.nan
+
+    def test_numeric_downcast(self):
+        compact_df, report = compact_dtypes(self.df)
+        self.assertEqual(compact_df['small_int'].dtype, np.int8)
+        self.assertEqual(compact_df['exact_float'].dtype, np.float32)
+        # Values that would lose precision keep their float64 dtype
+        self.assertEqual(compact_df['precise_float'].dtype, np.float64)
+        np.testing.assert_array_equal(compact_df['small_int'], self.df['small_int'])
+
+    def test_low_cardinality_text_is_categorical(self):
+        compact_df, report = compact_dtypes(self.df)
+        self.assertIsInstance(compact_df['label'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(compact_df['name'].dtype, pd.CategoricalDtype)
+        self.assertEqual(compact_df['name'].tolist(), self.df['name'].tolist())
+
+    def test_report(self):
+        compact_df, report = compact_dtypes(self.df)
+        self.assertEqual(list(report.index), list(self.df.columns))
+        self.assertGreater(report.loc['small_int', 'bytes_saved'], 0)
+        self.assertEqual(report.loc['precise_float', 'bytes_saved'], 0)
+        self.assertEqual(report.loc['label', 'new_dtype'], 'category')
+
+    def test_compact_frame_is_valid_and_fillable(self):
+        compact_df, report = compact_dtypes(self.df)
+        validate_dataframe(compact_df)
+        df_processed, message = handle_nan_values(compact_df, "2")
+        self.assertFalse(df_processed['exact_float'].isnull().any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,12 @@
 
 import unittest
 import os
-from src.models.model_io import save_model_data, load_model_data
+import tempfile
+from src.models.model_format import (MODEL_SCHEMA_VERSION, is_model_file, read_model_file,
+                                     write_model_file)
+from src.models.model_io import save_model_data, load_model_data, migrate_model_file
 from src.models.regression import LinearRegressionModel
+from src.models.runtime import LinearPredictor, export_model_data
 import numpy as np
 
  
@@ -69,5 +73,90 @@ class TestModelIO(unittest.TestCase):
         np.testing.assert_array_almost_equal(y_pred, y_expected)
 
 
+
+class TestCompactModelFormat(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model = LinearRegressionModel()
+        self.X = np.array([[1.0], [2.0], [3.0], [5.0]])
+        self.y = np.array([2.0, 4.5, 5.5, 10.0])
+        self.model.fit(self.X, self.y)
+        self.model_data = {
+            'input_column': 'X',
+            'output_column': 'y',
+            'model_description': 'Test model',
+            'formula': self.model.get_formula('X', 'y'),
+            'metrics': {'R²': self.model.r2_, 'MSE': self.model.mse_},
+            'preprocessing': {'version': 1, 'steps': []},
+            'model': self.model
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.temp_dir.name, name)
+
+    def test_round_trip(self):
+        file_path = self.path("model.pemodel")
+        save_model_data(self.model_data, file_path)
+        self.assertTrue(is_model_file(file_path))
+        self.assertLess(os.path.getsize(file_path), 1024)
+        loaded = load_model_data(file_path)
+        for key in ('input_column', 'output_column', 'model_description', 'formula',
+                    'metrics', 'preprocessing'):
+            self.assertEqual(loaded[key], self.model_data[key])
+        model = loaded['model']
+        self.assertEqual(model.coef_, self.model.coef_)
+        self.assertEqual(model.intercept_, self.model.intercept_)
+        np.testing.assert_array_equal(model.predict(self.X), self.model.predict(self.X))
+        # The regression statistics are kept, so the model can still be updated
+        model.partial_fit([4.0], [8.0])
+        self.assertEqual(model.stats_.n, 5)
+
+    def test_undefined_metrics(self):
+        file_path = self.path("model.pemodel")
+        save_model_data(dict(self.model_data, metrics={'R²': None, 'MSE': float('nan')}), file_path)
+        loaded = load_model_data(file_path)
+        self.assertEqual(loaded['metrics'], {'R²': None, 'MSE': None})
+        export_model_data(loaded, self.path("model.json"))
+        self.assertIsNone(LinearPredictor.load(self.path("model.json")).metadata['metrics']['R²'])
+
+    def test_migrate_joblib_file(self):
+        old_path = self.path("model.joblib")
+        save_model_data(self.model_data, old_path)
+        self.assertFalse(is_model_file(old_path))
+        new_path = migrate_model_file(old_path)
+        self.assertEqual(new_path, self.path("model.pemodel"))
+        loaded = load_model_data(new_path)
+        self.assertEqual(loaded['formula'], self.model_data['formula'])
+        self.assertAlmostEqual(loaded['model'].predict([[4.0]])[0],
+                               self.model.predict([[4.0]])[0])
+
+    def test_rejects_invalid_files(self):
+        file_path = self.path("model.pemodel")
+        save_model_data(self.model_data, file_path)
+        with open(file_path, 'rb') as handle:
+            content = handle.read()
+        with open(file_path, 'wb') as handle:
+            handle.write(content[:-4])
+        with self.assertRaises(ValueError):
+            read_model_file(file_path)
+        with open(file_path, 'wb') as handle:
+            handle.write(content[:8] + (MODEL_SCHEMA_VERSION + 1).to_bytes(2, 'little') + content[10:])
+        with self.assertRaises(ValueError):
+            read_model_file(file_path)
+
+    def test_rejects_unknown_values(self):
+        file_path = self.path("model.pemodel")
+        write_model_file(file_path, {}, {'coef': 2.0, 'intercept': 1.0, '__class__': 0.0})
+        with self.assertRaises(ValueError):
+            load_model_data(file_path)
+        write_model_file(file_path, {}, {'coef': 2.0})
+        with self.assertRaises(ValueError):
+            load_model_data(file_path)
+
+
 if __name__ == '__main__':
     unittest.main()
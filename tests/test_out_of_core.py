@@ -0,0 +1,97 @@
+# tests/test_out_of_core.py
+
+import os
+import tempfile
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.file_importer import ImportCancelledError
+from src.data.out_of_core import compute_column_statistics, clean_large_file
+from src.data.streaming_stats import KLLSketch, k_for_rank_error
+
+
+class TestKLLSketch(unittest.TestCase):
+
+    def test_median_within_rank_error(self):
+        rng = np.random.default_rng(0)
+        values = rng.exponential(3.0, 200000)
+        sketch = KLLSketch(k_for_rank_error(0.01), seed=0)
+        for chunk in np.array_split(values, 20):
+            sketch.update(chunk)
+        rank = np.searchsorted(np.sort(values), sketch.median()) / len(values)
+        self.assertLess(abs(rank - 0.5), 0.01)
+        self.assertLess(sketch.size(), 5000)
+
+    def test_merge_matches_single_sketch(self):
+        left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+        left.update(np.arange(0, 50000))
+        right.update(np.arange(50000, 100000))
+        left.merge(right)
+        self.assertEqual(left.count, 100000)
+        self.assertLess(abs(left.median() - 50000) / 100000, 0.02)
+
+    def test_empty_sketch_and_nan(self):
+        sketch = KLLSketch()
+        sketch.update([np.nan])
+        self.assertTrue(np.isnan(sketch.median()))
+
+
+class TestOutOfCore(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.df = pd.DataFrame({
+            'x': [1.0, np.nan, 3.0, 4.0, np.nan, 6.0] * 50,
+            'count': [1, 2, 3, 4, 5, 6] * 50,
+            'label': ['a', None, 'b', 'c', 'a', 'b'] * 50
+        })
+        self.csv_path = os.path.join(self.temp_dir.name, 'data.csv')
+        self.df.to_csv(self.csv_path, index=False)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_compute_column_statistics(self):
+        stats = compute_column_statistics(self.csv_path, chunk_size=7)
+        self.assertEqual(list(stats['kind']), ['float', 'integer', 'text'])
+        self.assertEqual(list(stats['nan_count']), [100, 0, 50])
+        self.assertAlmostEqual(stats.loc['x', 'mean'], self.df['x'].mean())
+        self.assertIn(stats.loc['x', 'median'], [3.0, 4.0])
+        self.assertTrue(np.isnan(stats.loc['label', 'mean']))
+
+    def test_fill_with_mean_matches_in_memory(self):
+        output_path = os.path.join(self.temp_dir.name, 'clean.parquet')
+        summary = clean_large_file(self.csv_path, output_path, "2", chunk_size=7)
+        result = pd.read_parquet(output_path)
+        expected = self.df.fillna({'x': self.df['x'].mean()})
+        np.testing.assert_allclose(result['x'], expected['x'])
+        self.assertEqual(result['count'].dtype, np.int64)
+        self.assertEqual(result['label'].isnull().sum(), 50)
+        self.assertEqual(summary['rows_written'], len(self.df))
+        self.assertEqual(summary['filled'].to_dict(), {'x': 100})
+
+    def test_remove_rows_to_feather(self):
+        output_path = os.path.join(self.temp_dir.name, 'clean.feather')
+        summary = clean_large_file(self.csv_path, output_path, "1", chunk_size=7)
+        result = pd.read_feather(output_path)
+        self.assertEqual(len(result), len(self.df.dropna()))
+        self.assertEqual(summary['rows_read'], len(self.df))
+        self.assertFalse(result.isnull().values.any())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            clean_large_file(self.csv_path, os.path.join(self.temp_dir.name, 'out.csv'), "2")
+        with self.assertRaises(ValueError):
+            clean_large_file(self.csv_path, os.path.join(self.temp_dir.name, 'out.parquet'), "4")
+
+    def test_cancel(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        with self.assertRaises(ImportCancelledError):
+            clean_large_file(self.csv_path, os.path.join(self.temp_dir.name, 'out.parquet'),
+                             "3", cancel_event=cancel_event)
+
+
+if __name__ == '__main__':
+    unittest.main()
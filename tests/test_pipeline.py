@@ -0,0 +1,95 @@
+# tests/test_pipeline.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.pipeline import PreprocessingPipeline
+
+
+class TestPreprocessingPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'A': [1.0, 2.0, None, 4.0],
+            'B': [None, 2.0, 3.0, 5.0],
+            'C': ['x', 'y', 'z', None],
+            'D': [1.0, None, 1.0, 1.0]
+        })
+
+    def test_matches_sequential_steps(self):
+        pipeline = (PreprocessingPipeline()
+                    .drop_nan_rows(subset=['C'])
+                    .fill_nan('median', columns=['A'])
+                    .fill_nan('mean')
+                    .select_columns(['A', 'B', 'C']))
+        df_processed, report = pipeline.apply(self.df)
+
+        expected = self.df.dropna(subset=['C'])
+        expected = expected.fillna({'A': expected['A'].median()})
+        expected = expected.fillna({'B': expected['B'].mean()})[['A', 'B', 'C']]
+        pd.testing.assert_frame_equal(df_processed, expected)
+        self.assertEqual(report['rows_removed'], 1)
+        self.assertEqual(report['filled'].to_dict(), {'A': 1, 'B': 1})
+        # The steps are fused into a single pass
+        self.assertEqual(len(pipeline._plan()), 1)
+        # The original DataFrame is left untouched
+        self.assertTrue(self.df['A'].isnull().any())
+
+    def test_drop_after_fill_uses_new_pass(self):
+        pipeline = PreprocessingPipeline().fill_nan('constant', 0).drop_nan_rows()
+        self.assertEqual(len(pipeline._plan()), 2)
+        df_processed, report = pipeline.apply(self.df)
+        self.assertEqual(len(df_processed), 3)
+        self.assertFalse(df_processed.isnull().values.any())
+
+    def test_drop_checks_selected_columns_only(self):
+        pipeline = PreprocessingPipeline().select_columns(['A', 'B']).drop_nan_rows()
+        df_processed, _ = pipeline.apply(self.df)
+        pd.testing.assert_frame_equal(df_processed, self.df[['A', 'B']].dropna())
+
+    def test_serialization_round_trip(self):
+        pipeline = PreprocessingPipeline().drop_nan_rows(['C']).fill_nan('constant', 7)
+        restored = PreprocessingPipeline.from_json(pipeline.to_json())
+        self.assertEqual(restored.steps, pipeline.steps)
+        pd.testing.assert_frame_equal(restored.apply(self.df)[0], pipeline.apply(self.df)[0])
+
+    def test_replay_uses_fitted_values(self):
+        training = pd.DataFrame({'A': [1.0, 2.0, 3.0, None], 'B': [10.0, 20.0, 30.0, 40.0]})
+        pipeline = PreprocessingPipeline().fill_nan(
+            'median', values=training.median()
+        ).fill_nan('mean', values={'A': 2.0})
+        pipeline = PreprocessingPipeline.from_json(pipeline.to_json())
+        self.assertEqual(pipeline.steps[0]['values'], {'A': 2.0, 'B': 25.0})
+
+        scoring = pd.DataFrame({'A': [100.0, None, 300.0], 'B': [None, 1.0, 2.0]})
+        df_processed, report = pipeline.apply(scoring)
+        self.assertEqual(df_processed['A'].tolist(), [100.0, 2.0, 300.0])
+        self.assertEqual(df_processed['B'].tolist(), [25.0, 1.0, 2.0])
+        self.assertEqual(report['filled'].to_dict(), {'A': 1, 'B': 1})
+
+        # Steps without fitted values (older pipelines) use the replayed data.
+        legacy = PreprocessingPipeline([{'op': 'fillna', 'method': 'mean', 'value': None, 'columns': None}])
+        self.assertEqual(legacy.apply(scoring)[0]['A'].tolist(), [100.0, 200.0, 300.0])
+
+    def test_invalid_steps(self):
+        with self.assertRaises(ValueError):
+            PreprocessingPipeline([{'op': 'shuffle'}])
+        with self.assertRaises(ValueError):
+            PreprocessingPipeline().fill_nan('constant')
+        with self.assertRaises(ValueError):
+            PreprocessingPipeline().select_columns(['Z']).apply(self.df)
+
+    def test_apply_file(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = os.path.join(temp_dir, 'data.csv')
+            self.df.to_csv(csv_path, index=False)
+            df_processed, report = PreprocessingPipeline().fill_nan('mean').apply_file(csv_path)
+        self.assertFalse(df_processed[['A', 'B', 'D']].isnull().values.any())
+        self.assertEqual(df_processed['D'].tolist(), [1.0] * 4)
+        self.assertTrue(np.isclose(df_processed.loc[2, 'A'], 7 / 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# tests/test_profile.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.data.data_handler import handle_nan_values
+from src.data.profile import DatasetProfile
+from src.data.streaming_stats import HyperLogLog
+
+
+class TestDatasetProfile(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'A': rng.normal(3.0, 2.0, 5000),
+            'B': rng.integers(0, 40, 5000),
+            'C': rng.choice(['x', 'y', 'z'], 5000)
+        })
+        self.df.loc[::7, 'A'] = np.nan
+        self.profile = DatasetProfile.from_dataframe(self.df)
+
+    def test_statistics_match_pandas(self):
+        stats = self.profile.stats
+        self.assertEqual(stats.loc['A', 'nulls'], self.df['A'].isnull().sum())
+        self.assertAlmostEqual(stats.loc['A', 'mean'], self.df['A'].mean())
+        self.assertAlmostEqual(stats.loc['A', 'var'], self.df['A'].var())
+        self.assertEqual(stats.loc['B', 'min'], self.df['B'].min())
+        self.assertEqual(stats.loc['B', 'max'], self.df['B'].max())
+        self.assertEqual(stats.loc['B', 'distinct'], 40)
+        self.assertEqual(stats.loc['C', 'distinct'], 3)
+        rank = (self.df['A'] <= stats.loc['A', 'p50']).mean() / self.df['A'].notna().mean()
+        self.assertLess(abs(rank - 0.5), 0.01)
+        self.assertFalse(self.profile.is_empty())
+
+    def test_after_fill_matches_new_profile(self):
+        for method in ("mean", "median", "constant"):
+            statistics = self.profile.fill_statistics(method, 10, self.df)
+            filled, _ = handle_nan_values(self.df.copy(), "2", statistics=statistics)
+            updated = self.profile.after_fill(filled, statistics)
+            self.assertEqual(updated.stats.loc['A', 'nulls'], 0)
+            self.assertAlmostEqual(updated.stats.loc['A', 'mean'], filled['A'].mean())
+            self.assertAlmostEqual(updated.stats.loc['A', 'var'], filled['A'].var())
+            self.assertEqual(updated.stats.loc['A', 'max'], filled['A'].max())
+        # The original profile is left unchanged
+        self.assertEqual(self.profile.stats.loc['A', 'nulls'], self.df['A'].isnull().sum())
+
+    def test_median_fill_is_exact(self):
+        df = pd.DataFrame({'A': [1.0, 2.0, 3.0, 4.0, np.nan], 'B': [10.0, 20.0, 40.0, 50.0, np.nan]})
+        statistics = DatasetProfile.from_dataframe(df).fill_statistics("median", df=df)
+        self.assertEqual(statistics.to_dict(), {'A': 2.5, 'B': 30.0})
+        with self.assertRaises(ValueError):
+            self.profile.fill_statistics("median")
+
+    def test_empty_columns(self):
+        profile = DatasetProfile.from_dataframe(pd.DataFrame({'A': [np.nan, np.nan]}))
+        self.assertTrue(profile.is_empty())
+
+    def test_hyperloglog_estimate(self):
+        estimator = HyperLogLog()
+        estimator.update(np.arange(100000))
+        self.assertLess(abs(estimator.count() - 100000) / 100000, 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
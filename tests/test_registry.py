@@ -0,0 +1,100 @@
+# tests/test_registry.py
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.models.model_io import save_model_data
+from src.models.registry import ModelRegistry
+from src.models.regression import LinearRegressionModel
+
+
+def make_model_data(slope, noise, input_column='x', output_column='y', description=''):
+    rng = np.random.default_rng(int(slope * 10))
+    x = np.arange(50, dtype='float64')
+    y = slope * x + rng.normal(0.0, noise, 50)
+    model = LinearRegressionModel()
+    model.fit(x.reshape(-1, 1), y)
+    return {
+        'input_column': input_column,
+        'output_column': output_column,
+        'model_description': description,
+        'formula': model.get_formula(input_column, output_column),
+        'metrics': {'R²': model.r2_, 'MSE': model.mse_},
+        'model': model,
+    }
+
+
+class TestModelRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.registry = ModelRegistry(os.path.join(self.temp_dir.name, 'models'), cache_size=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_empty_registry(self):
+        self.assertEqual(len(self.registry), 0)
+        self.assertTrue(self.registry.list_models().empty)
+        with self.assertRaises(ValueError):
+            self.registry.load('missing')
+
+    def test_listing_filters_and_sorts(self):
+        self.registry.register(make_model_data(2.0, 1.0, description="Sales forecast"), 'a')
+        self.registry.register(make_model_data(2.0, 20.0), 'b')
+        self.registry.register(make_model_data(3.0, 5.0, input_column='t'), 'c_100%')
+        self.assertEqual(len(self.registry), 3)
+
+        self.assertEqual(list(self.registry.list_models()['name']), ['a', 'c_100%', 'b'])
+        self.assertEqual(list(self.registry.list_models(sort_by='mse')['name']), ['a', 'c_100%', 'b'])
+        self.assertEqual(list(self.registry.list_models(sort_by='name', descending=True)['name']),
+                         ['c_100%', 'b', 'a'])
+        self.assertEqual(list(self.registry.list_models(input_column='x')['name']), ['a', 'b'])
+        self.assertEqual(list(self.registry.list_models(search='SALES')['name']), ['a'])
+        self.assertEqual(list(self.registry.list_models(search='0%')['name']), ['c_100%'])
+        self.assertEqual(len(self.registry.list_models(min_r2=0.9)), 2)
+        self.assertEqual(len(self.registry.list_models(limit=1)), 1)
+        with self.assertRaises(ValueError):
+            self.registry.list_models(sort_by='hash')
+
+    def test_lazy_loading_with_lru_cache(self):
+        for name in ('a', 'b', 'c'):
+            self.registry.register(make_model_data(2.0, 1.0), name)
+        first = self.registry.load('a')
+        self.assertIs(self.registry.load('a'), first)
+        self.registry.load('b')
+        self.registry.load('c')
+        self.assertEqual(self.registry.cached_names(), ['b', 'c'])
+        model = self.registry.load('a')['model']
+        self.assertAlmostEqual(model.predict([[10.0]])[0], first['model'].predict([[10.0]])[0])
+
+    def test_replace_delete_and_import(self):
+        self.registry.register(make_model_data(2.0, 1.0), 'a')
+        self.registry.register(make_model_data(3.0, 1.0), 'a')
+        self.assertEqual(len(self.registry), 1)
+        self.assertAlmostEqual(self.registry.load('a')['model'].coef_, 3.0, places=1)
+        model_files = [name for name in os.listdir(self.registry.registry_dir)
+                       if name.endswith('.pemodel')]
+        self.assertEqual(len(model_files), 1)
+
+        old_path = os.path.join(self.temp_dir.name, 'legacy.joblib')
+        save_model_data(make_model_data(4.0, 1.0), old_path)
+        self.assertEqual(self.registry.import_file(old_path), 'legacy')
+
+        self.registry.delete('a')
+        self.assertEqual(list(self.registry.list_models()['name']), ['legacy'])
+        self.assertEqual(self.registry.cached_names(), [])
+
+    def test_modified_file_is_rejected(self):
+        self.registry.register(make_model_data(2.0, 1.0), 'a')
+        model_file = [name for name in os.listdir(self.registry.registry_dir)
+                      if name.endswith('.pemodel')][0]
+        with open(os.path.join(self.registry.registry_dir, model_file), 'ab') as handle:
+            handle.write(b'\0' * 8)
+        with self.assertRaises(ValueError):
+            self.registry.load('a')
+
+
+if __name__ == '__main__':
+    unittest.main()
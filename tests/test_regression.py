@@ -36,6 +36,48 @@ class TestRegressionModel(unittest.TestCase):
         formula = self.model.get_formula("X", "y")
         self.assertEqual(formula, "y = 2.00 * X + 0.00")
 
+    def test_metrics_computed_while_fitting(self):
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(200, 1))
+        y = 1.5 * X[:, 0] + rng.normal(size=200)
+        model = LinearRegressionModel()
+        model.fit(X, y)
+        predictions = model.predict(X)
+        self.assertAlmostEqual(model.r2_, model.r2_score(y, predictions), places=10)
+        self.assertAlmostEqual(model.mse_, model.mean_squared_error(y, predictions), places=10)
+        self.assertEqual(model.stats_.n, 200)
+
+    def test_fit_rejects_nan(self):
+        with self.assertRaises(ValueError):
+            LinearRegressionModel().fit(np.array([[1.0], [np.nan], [3.0]]), np.array([1.0, 2.0, 3.0]))
+
+    def test_partial_fit_matches_full_refit(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(10.0, 2.0, 300)
+        y = 1.5 * x + 4.0 + rng.normal(0.0, 0.5, 300)
+        model = LinearRegressionModel()
+        model.fit(x[:200].reshape(-1, 1), y[:200])
+        model.partial_fit(x[200:], y[200:])
+        reference = LinearRegressionModel()
+        reference.fit(x.reshape(-1, 1), y)
+        self.assertAlmostEqual(model.coef_, reference.coef_, places=10)
+        self.assertAlmostEqual(model.intercept_, reference.intercept_, places=8)
+        self.assertAlmostEqual(model.r2_, reference.r2_, places=10)
+        self.assertEqual(model.stats_.n, 300)
+
+    def test_partial_fit_forgets_old_data(self):
+        x = np.arange(100, dtype='float64')
+        model = LinearRegressionModel()
+        model.fit(x.reshape(-1, 1), 2.0 * x)
+        model.partial_fit(x, -3.0 * x + 1.0, decay=0.0)
+        self.assertAlmostEqual(model.coef_, -3.0)
+        self.assertAlmostEqual(model.intercept_, 1.0)
+        model.partial_fit(x, 2.0 * x, decay=0.5)
+        self.assertTrue(-3.0 < model.coef_ < 2.0)
+        self.assertAlmostEqual(model.stats_.n, 150)
+        with self.assertRaises(ValueError):
+            model.partial_fit(x, x, decay=1.5)
+
     def test_prediction_with_new_data(self):
         # Test prediction with new input
         X_new = np.array([[6], [7]])
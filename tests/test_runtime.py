@@ -0,0 +1,83 @@
+# tests/test_runtime.py
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+from src.models.model_io import save_model_data
+from src.models.regression import LinearRegressionModel
+from src.models.runtime import LinearPredictor, export_model_data
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestLinearPredictor(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, "model.json")
+        self.model = LinearRegressionModel()
+        self.X = np.array([[1.0], [2.0], [4.0], [5.0]])
+        self.y = np.array([2.5, 4.0, 8.5, 10.0])
+        self.model.fit(self.X, self.y)
+        self.model_data = {
+            'input_column': 'X',
+            'output_column': 'y',
+            'model_description': 'Test model',
+            'formula': self.model.get_formula('X', 'y'),
+            'metrics': {'R²': self.model.r2_, 'MSE': self.model.mse_},
+            'model': self.model,
+        }
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_predictions_match_model(self):
+        predictor = LinearPredictor.from_model(self.model)
+        np.testing.assert_allclose(predictor.predict(self.X), self.model.predict(self.X))
+        np.testing.assert_allclose(predictor.predict([1.0, np.nan])[0], self.model.predict([[1.0]])[0])
+        self.assertTrue(np.isnan(predictor.predict([1.0, np.nan])[1]))
+        self.assertAlmostEqual(predictor.predict(3.0), self.model.predict([[3.0]])[0])
+        self.assertIsInstance(predictor.predict(np.float32(3.0)), float)
+
+    def test_export_and_load(self):
+        export_model_data(self.model_data, self.file_path)
+        with open(self.file_path, encoding='utf-8') as handle:
+            self.assertEqual(json.load(handle)['input_column'], 'X')
+        predictor = LinearPredictor.load(self.file_path)
+        self.assertEqual(predictor.output_column, 'y')
+        self.assertEqual(predictor.metadata['formula'], self.model_data['formula'])
+        self.assertAlmostEqual(predictor.metadata['metrics']['R²'], self.model.r2_)
+        np.testing.assert_allclose(predictor.predict(self.X), self.model.predict(self.X))
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            LinearPredictor.from_dict({'coef': 1.0, 'intercept': 0.0})
+        data = LinearPredictor(1.0, 0.0).to_dict()
+        data['version'] += 1
+        with self.assertRaises(ValueError):
+            LinearPredictor.from_dict(data)
+
+    def test_does_not_import_sklearn(self):
+        compact_path = os.path.join(self.temp_dir.name, "model.pemodel")
+        export_model_data(self.model_data, self.file_path)
+        save_model_data(self.model_data, compact_path)
+        for file_path in (self.file_path, compact_path):
+            script = (
+                "import sys\n"
+                "from src.models.runtime import LinearPredictor\n"
+                f"predictor = LinearPredictor.load({file_path!r})\n"
+                "print(predictor.predict(3.0))\n"
+                "print(sorted(name for name in ('sklearn', 'pandas', 'joblib') if name in sys.modules))\n"
+            )
+            output = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT,
+                                    capture_output=True, text=True, check=True).stdout.splitlines()
+            self.assertAlmostEqual(float(output[0]), self.model.predict([[3.0]])[0])
+            self.assertEqual(output[1], "[]")
+
+
+if __name__ == '__main__':
+    unittest.main()
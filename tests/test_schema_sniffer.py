@@ -0,0 +1,65 @@
+# tests/test_schema_sniffer.py
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from src.data.file_importer import import_file
+from src.data.schema_sniffer import sniff_csv_schema
+
+
+class TestSchemaSniffer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.temp_dir.name, 'data.csv')
+        # Large enough for the tail and random blocks to be sampled
+        self.df = pd.DataFrame({
+            'id': range(50000),
+            'value': [i / 4 for i in range(50000)],
+            'city': ['Madrid', 'Paris'] * 25000
+        })
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_infer_schema(self):
+        self.df.to_csv(self.csv_path, index=False)
+        schema = sniff_csv_schema(self.csv_path)
+        self.assertEqual(schema, {'city': str})
+
+    def test_values_outside_the_sample_are_parsed(self):
+        # Integer and boolean in the sample, not in the rest of the file
+        self.df['id'] = self.df['id'].astype(object)
+        self.df.loc[49990, 'id'] = None
+        self.df['flag'] = pd.Series([True] * len(self.df), dtype=object)
+        self.df.loc[49995, 'flag'] = 'unknown'
+        self.df.to_csv(self.csv_path, index=False)
+        with mock.patch('src.data.file_importer.pd.read_csv', wraps=pd.read_csv) as read_csv:
+            imported = import_file(self.csv_path)
+        # The sample is parsed from memory, the file itself only once
+        self.assertEqual([call.args[0] for call in read_csv.call_args_list].count(self.csv_path), 1)
+        pd.testing.assert_frame_equal(imported, pd.read_csv(self.csv_path))
+
+    def test_corrupted_file(self):
+        corrupted_path = os.path.join(os.path.dirname(__file__), '..',
+                                      'functional_tests', 'corrupted.csv')
+        with self.assertRaises(pd.errors.ParserError):
+            sniff_csv_schema(corrupted_path)
+
+    def test_corrupted_row_near_the_end(self):
+        self.df.to_csv(self.csv_path, index=False)
+        with open(self.csv_path, 'a') as handle:
+            handle.write("1,2,3,4\n")
+        with self.assertRaises(pd.errors.ParserError):
+            sniff_csv_schema(self.csv_path)
+
+    def test_empty_file(self):
+        open(self.csv_path, 'w').close()
+        with self.assertRaises(pd.errors.EmptyDataError):
+            sniff_csv_schema(self.csv_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+# tests/test_service.py
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from src.models.runtime import LinearPredictor
+from src.service.client import _open_connection, _request, fetch, run_load
+from src.service.metrics import Histogram
+from src.service.server import PredictionServer, read_http_message
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_quantiles(self):
+        histogram = Histogram((1, 2, 5))
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in (0.5, 0.5, 1.5, 4.0, 9.0):
+            histogram.observe(value)
+        summary = histogram.to_dict()
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual(summary['p50'], 2)
+        self.assertEqual(summary['p99'], 9.0)
+        self.assertEqual(summary['buckets'], {'1': 2, '2': 1, '5': 1, 'inf': 1})
+
+
+class TestPredictionServer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.model_path = os.path.join(self.temp_dir.name, "sales.json")
+        LinearPredictor(2.0, 1.0, 'x', 'y').save(self.model_path)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_with_server(self, scenario, **options):
+        async def run():
+            server = PredictionServer(self.temp_dir.name, port=0, **options)
+            port = await server.start()
+            try:
+                return await scenario(server, port)
+            finally:
+                await server.close()
+        return asyncio.run(run())
+
+    def test_predictions_are_micro_batched(self):
+        async def scenario(server, port):
+            summary = await run_load(200, concurrency=20, port=port)
+            responses = await asyncio.gather(*(
+                fetch("/predict", {'model': 'sales', 'x': value}, port=port) for value in range(10)
+            ))
+            vector = await fetch("/predict", {'x': [1.0, None]}, port=port)
+            _, metrics = await fetch("/metrics", port=port)
+            return summary, responses, vector, metrics
+
+        summary, responses, vector, metrics = self.run_with_server(scenario, max_latency_ms=5)
+        self.assertEqual(summary['errors'], 0)
+        self.assertEqual(summary['latency_ms']['count'], 200)
+        self.assertEqual([payload['prediction'] for _, payload in responses],
+                         [2.0 * value + 1.0 for value in range(10)])
+        self.assertEqual(vector, (200, {'model': 'sales', 'predictions': [3.0, None]}))
+        self.assertEqual(metrics['predictions'], 212)
+        self.assertEqual(metrics['batch_size']['count'], metrics['batches'])
+        self.assertLess(metrics['batches'], 210)
+        self.assertEqual(metrics['latency_ms']['count'], 211)
+
+    def test_max_batch_size(self):
+        async def scenario(server, port):
+            await asyncio.gather(*(fetch("/predict", {'x': 1.0}, port=port) for _ in range(12)))
+            return server.metrics.batch_size.max
+
+        self.assertLessEqual(self.run_with_server(scenario, max_latency_ms=50, max_batch_size=4), 4)
+
+    def test_errors(self):
+        async def send_raw(port, head):
+            reader, writer = await _open_connection(port=port)
+            try:
+                writer.write(head)
+                status_line, _, body = await read_http_message(reader)
+                return int(status_line.split(" ")[1]), json.loads(body)
+            finally:
+                writer.close()
+
+        async def scenario(server, port):
+            return [
+                await fetch("/predict", {'model': ['sales'], 'x': 1.0}, port=port),
+                await send_raw(port, b"POST /predict HTTP/1.1\r\nContent-Length: abc\r\n\r\n"),
+                await send_raw(port, b"POST /predict HTTP/1.1\r\nContent-Length: 99999999999\r\n\r\n"),
+                await fetch("/predict", {'model': 'missing', 'x': 1.0}, port=port),
+                await fetch("/predict", {'x': "one"}, port=port),
+                await fetch("/predict", {'x': [[1.0, 2.0], [3.0, 4.0]]}, port=port),
+                await fetch("/predict", {'x': [1.0, True]}, port=port),
+                await fetch("/predict", {'x': 10 ** 400}, port=port),
+                await fetch("/predict", ["not", "an", "object"], port=port),
+                await fetch("/predict", port=port),
+                await fetch("/unknown", port=port),
+            ]
+
+        statuses = [status for status, _ in self.run_with_server(scenario)]
+        self.assertEqual(statuses, [400, 400, 413, 404, 400, 400, 400, 400, 400, 405, 404])
+
+    def test_close_ends_keep_alive_connections(self):
+        async def run():
+            server = PredictionServer(self.temp_dir.name, port=0, reload_interval=0.05)
+            port = await server.start()
+            reader, writer = await _open_connection(port=port)
+            response = await _request(reader, writer, "POST", "/predict", {'x': 1.0})
+            await server.close()
+            closed = await asyncio.wait_for(reader.read(), timeout=1.0)
+            writer.close()
+            others = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            return response, closed, others
+
+        response, closed, others = asyncio.run(run())
+        self.assertEqual(response, (200, {'model': 'sales', 'prediction': 3.0}))
+        self.assertEqual(closed, b"")
+        self.assertEqual(others, [])
+
+    def test_hot_reload(self):
+        async def scenario(server, port):
+            before = await fetch("/predict", {'x': 2.0}, port=port)
+            LinearPredictor(3.0, 0.0, 'x', 'y').save(self.model_path)
+            os.utime(self.model_path, ns=(1, 1))  # A distinct modification time
+            LinearPredictor(1.0, 0.0).save(os.path.join(self.temp_dir.name, "other.json"))
+            await asyncio.sleep(0.3)
+            after = await fetch("/predict", {'model': 'sales', 'x': 2.0}, port=port)
+            _, models = await fetch("/models", port=port)
+            os.remove(os.path.join(self.temp_dir.name, "other.json"))
+            await asyncio.sleep(0.3)
+            _, remaining = await fetch("/models", port=port)
+            return before, after, models, remaining
+
+        before, after, models, remaining = self.run_with_server(scenario, reload_interval=0.05)
+        self.assertEqual(before[1]['prediction'], 5.0)
+        self.assertEqual(after[1]['prediction'], 6.0)
+        self.assertEqual(models['sales']['coef'], 3.0)
+        self.assertEqual(sorted(models), ['other', 'sales'])
+        self.assertEqual(list(remaining), ['sales'])
+
+    @unittest.skipUnless(hasattr(asyncio, 'start_unix_server'), "Unix sockets are not available")
+    def test_unix_socket(self):
+        socket_path = os.path.join(self.temp_dir.name, "predict.sock")
+
+        async def run():
+            server = PredictionServer(self.model_path, unix_socket=socket_path, reload_interval=0)
+            await server.start()
+            try:
+                return await fetch("/predict", {'x': 2.0}, unix_socket=socket_path)
+            finally:
+                await server.close()
+
+        self.assertEqual(asyncio.run(run()), (200, {'model': 'sales', 'prediction': 5.0}))
+        self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_streaming_ols.py
+
+import os
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+import numpy as np
+import pandas as pd
+from src.models.regression import LinearRegressionModel
+from src.models.streaming_ols import OLSAccumulator, accumulate_file, accumulate_files
+
+
+class TestStreamingOLS(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = rng.normal(1000.0, 5.0, 2000)
+        self.y = 3.0 * self.x - 7.0 + rng.normal(0.0, 2.0, 2000)
+        self.reference = LinearRegressionModel()
+        self.reference.fit(self.x.reshape(-1, 1), self.y)
+        predictions = self.reference.predict(self.x.reshape(-1, 1))
+        self.r2 = self.reference.r2_score(self.y, predictions)
+        self.mse = self.reference.mean_squared_error(self.y, predictions)
+
+    def assert_matches_reference(self, accumulator):
+        self.assertAlmostEqual(accumulator.coef(), self.reference.coef_, places=8)
+        self.assertAlmostEqual(accumulator.intercept(), self.reference.intercept_, places=5)
+        self.assertAlmostEqual(accumulator.r2(), self.r2, places=10)
+        self.assertAlmostEqual(accumulator.mse(), self.mse, places=8)
+
+    def test_chunks_match_sklearn(self):
+        accumulator = OLSAccumulator()
+        for start in range(0, len(self.x), 300):
+            accumulator.update(self.x[start:start + 300], self.y[start:start + 300])
+        self.assert_matches_reference(accumulator)
+
+    def test_merge_in_any_order(self):
+        parts = [OLSAccumulator().update(self.x[i::3], self.y[i::3]) for i in range(3)]
+        merged = OLSAccumulator().merge(parts[2]).merge(parts[0]).merge(parts[1])
+        self.assert_matches_reference(merged)
+        restored = OLSAccumulator.from_dict(merged.to_dict())
+        self.assertEqual(restored.coef(), merged.coef())
+        with self.assertRaises(ValueError):
+            OLSAccumulator.from_dict(dict(merged.to_dict(), merge=0.0))
+        with self.assertRaises(ValueError):
+            OLSAccumulator.from_dict(dict(merged.to_dict(), n="10"))
+
+    def test_nan_points_are_ignored(self):
+        x = np.append(self.x, [np.nan, 1.0])
+        y = np.append(self.y, [1.0, np.nan])
+        accumulator = OLSAccumulator().update(x, y)
+        self.assertEqual(accumulator.n, len(self.x))
+        self.assert_matches_reference(accumulator)
+
+    def test_empty_accumulator(self):
+        with self.assertRaises(ValueError):
+            OLSAccumulator().coef()
+
+    def test_model_from_statistics(self):
+        model = LinearRegressionModel()
+        model.fit_streaming((self.x[i:i + 500].reshape(-1, 1), self.y[i:i + 500])
+                            for i in range(0, len(self.x), 500))
+        np.testing.assert_allclose(model.predict(np.array([[1000.0]])),
+                                   self.reference.predict(np.array([[1000.0]])))
+
+    def test_accumulate_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(2):
+                pd.DataFrame({'x': self.x[i::2], 'y': self.y[i::2]}).to_csv(
+                    os.path.join(temp_dir, f'part{i}.csv'), index=False)
+            with mock.patch('src.models.streaming_ols.ProcessPoolExecutor',
+                            wraps=ProcessPoolExecutor) as executor:
+                accumulator = accumulate_files(temp_dir, 'x', 'y', max_workers=2)
+            self.assertEqual(executor.call_args.kwargs['mp_context'].get_start_method(), 'spawn')
+            self.assert_matches_reference(accumulator)
+            with self.assertRaises(ValueError):
+                accumulate_file(os.path.join(temp_dir, 'part0.csv'), 'x', 'z')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+# tests/test_sweep.py
+
+import unittest
+import numpy as np
+import pandas as pd
+from src.models.regression import LinearRegressionModel
+from src.models.sweep import regression_sweep, r2_matrix
+
+
+class TestRegressionSweep(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        x = rng.normal(size=300)
+        self.df = pd.DataFrame({
+            'x': x,
+            'y': 2.0 * x + rng.normal(scale=0.5, size=300),
+            'z': rng.normal(size=300),
+            'constant': 1.0,
+            'label': ['a'] * 300
+        })
+        self.df.loc[::10, 'y'] = np.nan
+        self.df.loc[::7, 'z'] = np.nan
+
+    def test_matches_individual_fits(self):
+        sweep = regression_sweep(self.df)
+        # Constant and text columns are left out, both directions are fitted
+        self.assertEqual(len(sweep), 6)
+        self.assertEqual(set(sweep.iloc[0][['input', 'output']]), {'x', 'y'})
+
+        for _, row in sweep.iterrows():
+            pair = self.df[[row['input'], row['output']]].dropna()
+            model = LinearRegressionModel()
+            model.fit(pair[[row['input']]].values, pair[row['output']].values)
+            predictions = model.predict(pair[[row['input']]].values)
+            self.assertEqual(row['n'], len(pair))
+            self.assertAlmostEqual(row['coef'], model.coef_, places=8)
+            self.assertAlmostEqual(row['intercept'], model.intercept_, places=8)
+            self.assertAlmostEqual(row['r2'], model.r2_score(pair[row['output']], predictions), places=8)
+            self.assertAlmostEqual(row['mse'], model.mean_squared_error(pair[row['output']], predictions), places=8)
+
+    def test_target(self):
+        sweep = regression_sweep(self.df, target='y')
+        self.assertEqual(list(sweep['output'].unique()), ['y'])
+        self.assertEqual(list(sweep['input']), ['x', 'z'])
+        self.assertEqual(r2_matrix(sweep).shape, (2, 1))
+        with self.assertRaises(ValueError):
+            regression_sweep(self.df, target='label')
+
+
+if __name__ == '__main__':
+    unittest.main()
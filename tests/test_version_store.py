@@ -0,0 +1,101 @@
+# tests/test_version_store.py
+
+import tracemalloc
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from src.data.data_handler import handle_nan_values
+from src.data.version_store import COPY_ON_WRITE, DatasetVersionStore
+
+
+class TestDatasetVersionStore(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'A': rng.normal(size=1000),
+            'B': rng.normal(size=1000),
+            'C': rng.choice(['x', 'y'], size=1000)
+        })
+        self.df.loc[::10, 'A'] = np.nan
+        self.store = DatasetVersionStore()
+        self.store.commit(self.df, "Load dataset", metadata={'steps': []})
+
+    def test_fill_copies_only_changed_columns(self):
+        before = self.store.total_bytes()
+        filled, _ = handle_nan_values(self.df.copy(), "2")
+        self.store.commit(filled, "Fill with Mean", changed_columns=['A'])
+        self.assertEqual(self.store.total_bytes() - before, self.df['A'].array.nbytes)
+
+    def test_dropna_stores_row_positions(self):
+        before = self.store.total_bytes()
+        self.store.commit(self.df.dropna(), "Remove rows with NaN", changed_columns=[])
+        added = self.store.total_bytes() - before
+        # One array of row positions plus the new index
+        self.assertLess(added, 3 * 8 * len(self.df))
+
+    def test_undo_redo(self):
+        dropped = self.df.dropna()
+        self.store.commit(dropped, "Remove rows with NaN", metadata={'steps': ['dropna']})
+        self.assertEqual(self.store.undo_label(), "Remove rows with NaN")
+
+        restored, metadata = self.store.undo()
+        pd.testing.assert_frame_equal(restored, self.df)
+        self.assertEqual(metadata, {'steps': []})
+        self.assertFalse(self.store.can_undo())
+
+        # Modifying a restored version does not alter the history
+        restored.loc[:, 'B'] = 0.0
+        redone, metadata = self.store.redo()
+        pd.testing.assert_frame_equal(redone, dropped)
+        self.assertEqual(self.store.undo()[0]['B'].tolist(), self.df['B'].tolist())
+
+        # A new change discards the versions that could be redone
+        self.store.commit(self.df.iloc[:5], "Head")
+        self.assertFalse(self.store.can_redo())
+
+    @unittest.skipUnless(COPY_ON_WRITE, "Requires copy-on-write")
+    def test_first_commit_shares_the_dataset(self):
+        df = pd.DataFrame({'A': np.arange(1_000_000, dtype='float64'), 'B': np.ones(1_000_000)})
+        store = DatasetVersionStore()
+        tracemalloc.start()
+        try:
+            self.assertTrue(store.commit(df, "Load dataset"))
+            allocated = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(allocated, df.memory_usage().sum() // 100)
+        self.assertEqual(store.total_bytes(), 0)
+
+        # Modifying the dataset afterwards leaves the stored version intact
+        df.loc[0, 'A'] = -1.0
+        store.commit(df, "Edit A", changed_columns=['A'])
+        self.assertEqual(store.total_bytes(), df['A'].nbytes)
+        self.assertEqual(store.undo()[0].loc[0, 'A'], 0.0)
+
+    def test_private_copies_count_without_copy_on_write(self):
+        df = pd.DataFrame({'A': np.arange(1000, dtype='float64'), 'B': np.ones(1000)})
+        with mock.patch('src.data.version_store.COPY_ON_WRITE', False):
+            store = DatasetVersionStore()
+            store.commit(df, "Load dataset")
+            self.assertEqual(store.total_bytes(), df.memory_usage().sum())
+            df.loc[0, 'A'] = -1.0
+            store.commit(df, "Edit A", changed_columns=['A'])
+            self.assertEqual(store.total_bytes(), df.memory_usage().sum() + df['A'].nbytes)
+            self.assertEqual(store.undo()[0].loc[0, 'A'], 0.0)
+
+    def test_budget_evicts_oldest_versions(self):
+        filled, _ = handle_nan_values(self.df.copy(), "4", constant_value=0)
+        self.store.commit(filled, "Fill with Constant", changed_columns=['A'])
+        self.store.commit(filled.assign(B=filled['B'] * 2), "Scale B", changed_columns=['B'])
+        budget = self.store.total_bytes() - 1
+        self.assertTrue(self.store.set_budget(budget))
+        self.assertEqual(len(self.store.versions), 2)
+        self.assertEqual(self.store.undo_label(), "Scale B")
+        self.assertFalse(self.store.set_budget(10))
+        self.assertFalse(self.store.can_undo())
+
+
+if __name__ == '__main__':
+    unittest.main()